@@ -0,0 +1,127 @@
+"""Run the engine benchmarks and compare them with a saved baseline.
+
+Usage::
+
+    python -m benchmarks                       # run and print
+    python -m benchmarks --save main           # store benchmarks/baselines/main.json
+    python -m benchmarks --compare main        # exit 1 when a case is slower than the baseline
+    python -m benchmarks --filter run_all --sizes 10 100 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from .workloads import RULE_SET_SIZES, Case, build_cases
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def measure(case: Case, repeat: int) -> Dict[str, Any]:
+    """Time ``case`` ``repeat`` times (best run wins), then trace its peak memory once."""
+    case.function()  # warm caches the same way long-running processes do
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        case.function()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {
+        "seconds": best,
+        "records_per_second": case.records / best if best else 0.0,
+        "peak_memory_kib": peak / 1024,
+    }
+    if case.conditions:
+        result["condition_latency_us"] = best / (case.records * case.conditions) * 1e6
+    return result
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> List[str]:
+    """Return the names of cases more than ``tolerance`` slower than ``baseline``."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = result["seconds"] / reference["seconds"] - 1
+        result["change"] = change
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(RULE_SET_SIZES), help="rule set sizes")
+    parser.add_argument("--records", type=int, default=2000, help="facts per run for 1 rule (divided by size)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (best is kept)")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--save", metavar="NAME", help="save results as benchmarks/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="compare with benchmarks/baselines/NAME.json")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="allowed slowdown before a case counts as a regression"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads((BASELINE_DIR / f"{args.compare}.json").read_text())["results"]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"{'case':<32}{'records/s':>14}{'us/condition':>14}{'peak KiB':>12}{'vs baseline':>13}")
+    for case in build_cases(args.sizes, args.records):
+        if args.filter not in case.name:
+            continue
+        result = results[case.name] = measure(case, args.repeat)
+        regressions = compare({case.name: result}, baseline or {}, args.tolerance)
+        latency = result.get("condition_latency_us")
+        change = result.get("change")
+        print(
+            f"{case.name:<32}{result['records_per_second']:>14,.0f}"
+            f"{'' if latency is None else f'{latency:.2f}':>14}"
+            f"{result['peak_memory_kib']:>12,.0f}"
+            f"{'' if change is None else f'{change:+.1%}':>13}"
+            f"{'  REGRESSION' if regressions else ''}"
+        )
+
+    if args.save:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        document = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "options": {"sizes": args.sizes, "records": args.records, "repeat": args.repeat},
+            "results": results,
+        }
+        path = BASELINE_DIR / f"{args.save}.json"
+        path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+        print(f"saved {path}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than {args.compare} by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
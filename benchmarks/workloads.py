@@ -0,0 +1,235 @@
+"""Synthetic rule sets, facts and benchmark cases for the engine's hot paths."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from business_rules_genai import (
+    BaseActions,
+    BaseVariables,
+    boolean_rule_variable,
+    compile_rules,
+    export_rule_schema,
+    numeric_rule_variable,
+    rule_action,
+    string_rule_variable,
+)
+from business_rules_genai.engine import do_actions, parse_math_expression, run, run_all
+from business_rules_genai.fields import FIELD_NUMERIC, FIELD_TEXT
+
+RULE_SET_SIZES = (10, 100, 1000)
+REGIONS = ("EU", "US", "APAC", "LATAM")
+TIERS = ("bronze", "silver", "gold", "platinum")
+NUMERIC_FIELDS = ("amount", "quantity", "score", "balance", "age_days")
+EXPRESSIONS = (
+    "amount * quantity",
+    "(balance - amount) / quantity",
+    "amount * 1.2 + score",
+    "(score + age_days) * 2 - balance / 100",
+)
+NUMERIC_OPERATORS = ("greater_than", "less_than", "greater_than_or_equal_to", "less_than_or_equal_to")
+
+
+class BenchVariables(BaseVariables):
+    def __init__(self, facts: Dict[str, Any]) -> None:
+        self.facts = facts
+
+    @numeric_rule_variable
+    def amount(self):
+        return self.facts["amount"]
+
+    @numeric_rule_variable
+    def quantity(self):
+        return self.facts["quantity"]
+
+    @numeric_rule_variable
+    def score(self):
+        return self.facts["score"]
+
+    @numeric_rule_variable
+    def balance(self):
+        return self.facts["balance"]
+
+    @numeric_rule_variable
+    def age_days(self):
+        return self.facts["age_days"]
+
+    @string_rule_variable(options=list(REGIONS))
+    def region(self):
+        return self.facts["region"]
+
+    @string_rule_variable(options=list(TIERS))
+    def tier(self):
+        return self.facts["tier"]
+
+    @boolean_rule_variable
+    def verified(self):
+        return self.facts["verified"]
+
+
+class BenchActions(BaseActions):
+    @rule_action(params={"value": FIELD_NUMERIC, "rate": FIELD_NUMERIC}, pure=True)
+    def discounted(self, value, rate):
+        return self._unwrap_numeric(value) * (1 - self._unwrap_numeric(rate) / 100)
+
+    @rule_action(params={"label": FIELD_TEXT})
+    def flag(self, label):
+        return label
+
+
+def make_facts(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return ``count`` fact dicts with a realistic mix of numbers, strings and flags."""
+    rng = random.Random(seed)
+    return [
+        {
+            "amount": round(rng.lognormvariate(4, 1), 2),
+            "quantity": rng.randint(1, 50),
+            "score": rng.randint(300, 850),
+            "balance": round(rng.uniform(-500, 20000), 2),
+            "age_days": rng.randint(0, 3650),
+            "region": rng.choice(REGIONS),
+            "tier": rng.choice(TIERS),
+            "verified": rng.random() < 0.8,
+        }
+        for _ in range(count)
+    ]
+
+
+def make_rules(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return ``count`` rules mixing ``name``, ``function``, ``expression`` and ``value_condition`` leaves."""
+    rng = random.Random(seed)
+    return [_make_rule(rng, index) for index in range(count)]
+
+
+def count_leaves(rules: List[Dict[str, Any]]) -> int:
+    """Number of condition leaves in ``rules``, ``value_condition`` branches excluded."""
+
+    def leaves(block: Dict[str, Any]) -> int:
+        for group in ("all", "any"):
+            if group in block:
+                return sum(leaves(child) for child in block[group])
+        return 1
+
+    return sum(leaves(rule["conditions"]) for rule in rules)
+
+
+def _make_rule(rng: random.Random, index: int) -> Dict[str, Any]:
+    makers = (_name_leaf, _name_leaf, _string_leaf, _function_leaf, _expression_leaf, _value_condition_leaf)
+    leaves = [rng.choice(makers)(rng) for _ in range(rng.randint(2, 5))]
+    if rng.random() < 0.3:
+        leaves.append({"any": [_string_leaf(rng), {"name": "verified", "operator": "is_true", "value": True}]})
+    return {
+        "name": f"rule_{index}",
+        "conditions": {rng.choice(("all", "any")): leaves},
+        "actions": [{"function": "flag", "params": {"label": f"rule_{index}"}}],
+    }
+
+
+def _name_leaf(rng: random.Random) -> Dict[str, Any]:
+    field = rng.choice(NUMERIC_FIELDS)
+    return {"name": field, "operator": rng.choice(NUMERIC_OPERATORS), "value": rng.randint(1, 1000)}
+
+
+def _string_leaf(rng: random.Random) -> Dict[str, Any]:
+    if rng.random() < 0.5:
+        return {"name": "region", "operator": "equal_to", "value": rng.choice(REGIONS)}
+    return {"name": "tier", "operator": "is_in", "value": rng.sample(TIERS, 2)}
+
+
+def _function_leaf(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "function": "discounted",
+        "params": {"value": {"var": "amount"}, "rate": rng.choice((5, 10, 15, 20))},
+        "operator": rng.choice(NUMERIC_OPERATORS),
+        "value": rng.randint(10, 200),
+    }
+
+
+def _expression_leaf(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "expression": rng.choice(EXPRESSIONS),
+        "operator": rng.choice(NUMERIC_OPERATORS),
+        "value": rng.randint(10, 5000),
+    }
+
+
+def _value_condition_leaf(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "name": "score",
+        "operator": "greater_than_or_equal_to",
+        "value_condition": [
+            {
+                "conditions": {"all": [{"name": "tier", "operator": "equal_to", "value": rng.choice(TIERS)}]},
+                "value": rng.randint(500, 800),
+            },
+            {
+                "conditions": {"all": [{"function": "always_true", "operator": "is_true"}]},
+                "actions": [{"function": "set_value_numeric", "params": rng.randint(300, 700)}],
+            },
+        ],
+    }
+
+
+@dataclass
+class Case:
+    """One benchmark: ``function`` processes ``records`` items and ``conditions`` leaves per call."""
+
+    name: str
+    function: Callable[[], Any]
+    records: int
+    conditions: int = 0
+
+
+def build_cases(sizes=RULE_SET_SIZES, records: int = 2000) -> List[Case]:
+    """Return the benchmark cases; each rule-set size evaluates ``records / size`` facts."""
+    actions = BenchActions()
+    cases: List[Case] = []
+    for size in sizes:
+        rules = make_rules(size, seed=size)
+        leaves = count_leaves(rules)
+        record_count = max(5, records // size)
+        facts = make_facts(record_count, seed=size)
+        variables = [BenchVariables(record) for record in facts]
+        compiled = compile_rules(rules, BenchActions, BenchVariables)
+
+        cases.append(Case(f"run_all[dict-{size}]", _loop(run_all, rules, facts, actions), record_count, leaves))
+        cases.append(
+            Case(f"run_all[variables-{size}]", _loop(run_all, rules, variables, actions), record_count, leaves)
+        )
+        cases.append(
+            Case(f"compiled.run_all[dict-{size}]", _loop(compiled.run_all, None, facts, actions), record_count, leaves)
+        )
+        cases.append(Case(f"run[dict-{size}]", _loop_rules(rules, facts, actions), record_count, leaves))
+
+    expressions = [f"{expression} + {offset}" for offset in range(250) for expression in EXPRESSIONS]
+    cases.append(Case("parse_math_expression", lambda: [parse_math_expression(e) for e in expressions], len(expressions)))
+
+    action_list = [
+        {"function": "add", "params": [{"var": "amount"}, {"var": "balance"}]},
+        {"function": "mult", "params": [{"var": "quantity"}, 3]},
+        {"function": "discounted", "params": {"value": {"var": "amount"}, "rate": 10}},
+        {"function": "flag", "params": {"label": "done"}},
+    ]
+    facts = make_facts(1000, seed=1)
+    cases.append(
+        Case("do_actions", lambda: [do_actions(action_list, record, actions) for record in facts], len(facts))
+    )
+    cases.append(Case("export_rule_schema", lambda: export_rule_schema(BenchVariables, BenchActions), 1))
+    return cases
+
+
+def _loop(function: Callable[..., Any], rules: Any, records: List[Any], actions: Any) -> Callable[[], None]:
+    if rules is None:
+        return lambda: [function(record, actions) for record in records]
+    return lambda: [function(rules, record, actions) for record in records]
+
+
+def _loop_rules(rules: List[Dict[str, Any]], records: List[Any], actions: Any) -> Callable[[], None]:
+    def evaluate() -> None:
+        for record in records:
+            for rule in rules:
+                run(rule, record, actions)
+
+    return evaluate
@@ -1,8 +1,11 @@
 __version__ = "0.2.0"
 
 from .actions import BaseActions, rule_action
+from .analysis import project_variables, required_variables
+from .compiler import CompiledRuleSet, compile_rules
 from .engine import check_condition, check_conditions_recursively, run, run_all
 from .schema import export_rule_schema
+from .validation import RuleValidationError, validate_rules
 from .variables import (
     BaseVariables,
     boolean_rule_variable,
@@ -15,12 +18,18 @@ __all__ = (
     "BaseActions",
     "BaseVariables",
     "boolean_rule_variable",
+    "CompiledRuleSet",
+    "compile_rules",
     "run_all",
     "run",
     "check_conditions_recursively",
     "check_condition",
     "export_rule_schema",
     "numeric_rule_variable",
+    "project_variables",
+    "required_variables",
     "rule_action",
+    "RuleValidationError",
     "string_rule_variable",
+    "validate_rules",
 )
@@ -1,10 +1,30 @@
 from __future__ import annotations
 
 import inspect
+import threading
+import weakref
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Union, get_args, get_origin, get_type_hints
-
-from .operators import BooleanType, NumericType, StringType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from .operators import (
+    BooleanType,
+    NumericBackend,
+    NumericType,
+    StringType,
+    get_numeric_backend,
+)
 from .utils import fn_name_to_pretty_label
 
 NumericInput = Union[int, float, Decimal, NumericType]
@@ -116,14 +136,25 @@ def rule_action(
     label: str | None = None,
     params: Dict[str, Any] | List[Dict[str, Any]] | None = None,
     return_type: str | None = None,
+    pure: bool = False,
+    cost: float | None = None,
 ):
-    """Decorator to attach frontend metadata to a rule action."""
+    """Decorator to attach frontend metadata to a rule action.
+
+    Mark deterministic, side-effect free actions with ``pure=True`` so their
+    results are memoized per evaluation, keyed on the resolved arguments.
+    ``cost`` is a relative estimate of the action's expense (actions default
+    to 10, plain variables to 1) used to order conditions in compiled rule
+    sets.
+    """
 
     def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
         method.is_rule_action = True  # type: ignore[attr-defined]
         method.label = label or fn_name_to_pretty_label(method.__name__)  # type: ignore[attr-defined]
         method.rule_action_params = params  # type: ignore[attr-defined]
         method.return_type = return_type  # type: ignore[attr-defined]
+        method.is_pure_action = pure  # type: ignore[attr-defined]
+        method.cost = cost  # type: ignore[attr-defined]
         return method
 
     if func is not None:
@@ -133,8 +164,13 @@ def rule_action(
 
 def export_rule_actions(action_source: Any) -> List[ActionDefinition]:
     """Return action metadata for a class or action instance."""
+    return [definition for _, _, definition in _iter_rule_actions(action_source)]
+
+
+def _iter_rule_actions(
+    action_source: Any,
+) -> Iterator[Tuple[Callable[..., Any], inspect.Signature, ActionDefinition]]:
     action_class = action_source if inspect.isclass(action_source) else action_source.__class__
-    actions: List[ActionDefinition] = []
 
     for name, member in inspect.getmembers(action_class, predicate=callable):
         if name.startswith("_") or name == "get_all_actions":
@@ -168,9 +204,109 @@ def export_rule_actions(action_source: Any) -> List[ActionDefinition]:
         if return_type:
             action_definition["return_type"] = return_type
 
-        actions.append(action_definition)
+        yield member, signature, action_definition
+
+
+class ActionSpec:
+    """Dispatch metadata computed once per action of an actions class.
+
+    ``signature`` excludes the bound ``self`` parameter so call shapes can be
+    validated without an instance; validated shapes are memoized. ``pure``
+    and ``cost`` mirror the ``rule_action`` markers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        signature: inspect.Signature,
+        definition: ActionDefinition | None = None,
+        *,
+        pure: bool = False,
+        cost: float | None = None,
+    ) -> None:
+        self.name = name
+        self.signature = signature
+        self.definition = definition
+        self.pure = pure
+        self.cost = cost
+        self._shape_errors: Dict[Tuple[int, Tuple[str, ...]], str | None] = {}
+
+    def check_arguments(self, positional_count: int, keyword_names: Sequence[str] = ()) -> None:
+        """Raise ``TypeError`` when the call shape does not bind to the signature."""
+        shape = (positional_count, tuple(keyword_names))
+        try:
+            error = self._shape_errors[shape]
+        except KeyError:
+            try:
+                self.signature.bind(*([None] * positional_count), **dict.fromkeys(shape[1]))
+                error = None
+            except TypeError as exc:
+                error = str(exc)
+            self._shape_errors[shape] = error
+        if error is not None:
+            raise TypeError(error)
+
+
+_ACTION_REGISTRIES: "weakref.WeakKeyDictionary[type, Dict[str, ActionSpec]]" = (
+    weakref.WeakKeyDictionary()
+)
+_ACTION_REGISTRY_LOCK = threading.Lock()
+
+
+def get_action_registry(action_source: Any) -> Dict[str, ActionSpec]:
+    """Return the cached ``ActionSpec`` table for an actions class or instance.
+
+    The table covers the actions reported by :func:`export_rule_actions` and is
+    built on first use for each class.
+    """
+    action_class = action_source if inspect.isclass(action_source) else action_source.__class__
+    registry = _ACTION_REGISTRIES.get(action_class)
+    if registry is not None:
+        return registry
+
+    registry = {}
+    for member, signature, definition in _iter_rule_actions(action_class):
+        name = definition["name"]
+        registry[name] = ActionSpec(
+            name,
+            _unbound_signature(action_class, name, signature),
+            definition,
+            pure=getattr(member, "is_pure_action", False),
+            cost=getattr(member, "cost", None),
+        )
+
+    with _ACTION_REGISTRY_LOCK:
+        return _ACTION_REGISTRIES.setdefault(action_class, registry)
+
+
+def get_action_spec(action_source: Any, name: str) -> ActionSpec | None:
+    """Return the ``ActionSpec`` for ``name``, covering private methods as well."""
+    spec = get_action_registry(action_source).get(name)
+    if spec is not None:
+        return spec
+
+    action_class = action_source if inspect.isclass(action_source) else action_source.__class__
+    member = getattr(action_class, name, None)
+    if member is None or not callable(member):
+        return None
+    return ActionSpec(
+        name,
+        _unbound_signature(action_class, name, inspect.signature(member)),
+        pure=getattr(member, "is_pure_action", False),
+        cost=getattr(member, "cost", None),
+    )
+
 
-    return actions
+def _unbound_signature(
+    action_class: type,
+    name: str,
+    signature: inspect.Signature,
+) -> inspect.Signature:
+    """Drop ``self`` from the signature of plain methods looked up on the class."""
+    attribute = inspect.getattr_static(action_class, name, None)
+    if isinstance(attribute, (staticmethod, classmethod)) or not inspect.isfunction(attribute):
+        return signature
+    return signature.replace(parameters=list(signature.parameters.values())[1:])
 
 
 class BaseActions:
@@ -194,10 +330,18 @@ class BaseActions:
             return value
         return Decimal(str(value))
 
+    @classmethod
+    def _native_numeric(cls, value: NumericInput, backend: NumericBackend) -> Any:
+        """Convert numeric inputs into ``backend``'s native representation."""
+        native = backend.cast(value)
+        if native is None and value is not None and not isinstance(value, NumericType):
+            native = backend.cast(cls._unwrap_numeric(value))
+        return native
+
     @rule_action(label="Set Numeric Value", params={"value": NumericType.name}, return_type=NumericType.name)
     def set_value_numeric(self, value: NumericInput) -> NumericType:
         """Return the provided value wrapped as ``NumericType``."""
-        return NumericType(value if not isinstance(value, NumericType) else value.value)
+        return NumericType(value)
 
     @rule_action(label="Set String Value", params={"value": StringType.name}, return_type=StringType.name)
     def set_value_string(self, value: Union[str, StringType]) -> StringType:
@@ -214,33 +358,66 @@ class BaseActions:
         """Utility action that always yields ``True``."""
         return BooleanType(True)
 
-    @rule_action(params={"value1": NumericType.name, "value2": NumericType.name}, return_type=NumericType.name)
+    @rule_action(
+        params={"value1": NumericType.name, "value2": NumericType.name},
+        return_type=NumericType.name,
+        pure=True,
+        cost=2,
+    )
     def add(self, value1: NumericInput, value2: NumericInput) -> NumericType:
         """Add two numeric values."""
-        return NumericType(self._unwrap_numeric(value1) + self._unwrap_numeric(value2))
-
-    @rule_action(params={"value1": NumericType.name, "value2": NumericType.name}, return_type=NumericType.name)
+        backend = get_numeric_backend()
+        left = self._native_numeric(value1, backend)
+        right = self._native_numeric(value2, backend)
+        return NumericType.from_native(backend.add(left, right), backend)
+
+    @rule_action(
+        params={"value1": NumericType.name, "value2": NumericType.name},
+        return_type=NumericType.name,
+        pure=True,
+        cost=2,
+    )
     def minus(self, value1: NumericInput, value2: NumericInput) -> NumericType:
         """Subtract ``value2`` from ``value1``."""
-        return NumericType(self._unwrap_numeric(value1) - self._unwrap_numeric(value2))
-
-    @rule_action(params={"value1": NumericType.name, "value2": NumericType.name}, return_type=NumericType.name)
+        backend = get_numeric_backend()
+        left = self._native_numeric(value1, backend)
+        right = self._native_numeric(value2, backend)
+        return NumericType.from_native(backend.subtract(left, right), backend)
+
+    @rule_action(
+        params={"value1": NumericType.name, "value2": NumericType.name},
+        return_type=NumericType.name,
+        pure=True,
+        cost=2,
+    )
     def mult(self, value1: NumericInput, value2: NumericInput) -> NumericType:
         """Multiply two numeric values."""
-        return NumericType(self._unwrap_numeric(value1) * self._unwrap_numeric(value2))
-
-    @rule_action(params={"value1": NumericType.name, "value2": NumericType.name}, return_type=NumericType.name)
+        backend = get_numeric_backend()
+        left = self._native_numeric(value1, backend)
+        right = self._native_numeric(value2, backend)
+        return NumericType.from_native(backend.multiply(left, right), backend)
+
+    @rule_action(
+        params={"value1": NumericType.name, "value2": NumericType.name},
+        return_type=NumericType.name,
+        pure=True,
+        cost=2,
+    )
     def divide(self, value1: NumericInput, value2: NumericInput) -> NumericType:
         """Divide ``value1`` by ``value2``. Returns zero when dividing by zero."""
-        denominator = self._unwrap_numeric(value2)
+        backend = get_numeric_backend()
+        denominator = self._native_numeric(value2, backend)
         if denominator == 0:
             return NumericType(0)
-        numerator = self._unwrap_numeric(value1)
-        return NumericType(numerator / denominator)
+        numerator = self._native_numeric(value1, backend)
+        return NumericType.from_native(backend.divide(numerator, denominator), backend)
 
 
 __all__ = [
+    "ActionSpec",
     "BaseActions",
     "export_rule_actions",
+    "get_action_registry",
+    "get_action_spec",
     "rule_action",
 ]
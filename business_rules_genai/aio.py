@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Dict, Hashable, List, Sequence
+
+from .analysis import condition_actions, required_variables
+from .context import AwaitedResult, EvaluationContext, evaluation_context
+from .engine import (
+    TRACE_FULL,
+    Action,
+    Rule,
+    RunResult,
+    TraceNode,
+    _build_action_arguments,
+    _normalize_actions,
+    action_key,
+    call_action,
+    check_conditions_recursively,
+    prepare_action,
+)
+
+PREFETCH_RULE_SET = "rule_set"
+PREFETCH_RULE = "rule"
+PREFETCH_SCOPES = (PREFETCH_RULE_SET, PREFETCH_RULE)
+
+
+async def run_all_async(
+    rule_list: Sequence[Rule],
+    defined_variables: Any,
+    defined_actions: Any,
+    *,
+    stop_on_first_trigger: bool = False,
+    return_action_results: bool = False,
+    short_circuit: bool = False,
+    trace: str = TRACE_FULL,
+    prefetch: str = PREFETCH_RULE_SET,
+) -> RunResult:
+    """Evaluate a list of rules whose variables and actions may be coroutines.
+
+    Coroutine variables referenced by the rules, and coroutine actions used in
+    conditions, are awaited concurrently before any comparison runs: for the
+    whole rule set with ``prefetch="rule_set"`` (default) or rule by rule with
+    ``prefetch="rule"``. Conditions are then evaluated by the sync engine, and
+    the actions of triggered rules are awaited in order. Results and traces
+    match :func:`business_rules_genai.engine.run_all`.
+
+    Coroutine condition actions are awaited once per distinct resolved
+    arguments. Expression arithmetic must stay synchronous.
+    """
+    if prefetch not in PREFETCH_SCOPES:
+        raise ValueError(f"Unknown prefetch scope: {prefetch!r}")
+
+    context = evaluation_context(defined_variables)
+    previous_results = context.awaited_results
+    context.awaited_results = {}
+    try:
+        if prefetch == PREFETCH_RULE_SET:
+            await resolve_async_dependencies(rule_list, context, defined_actions)
+
+        aggregated_trace: List[TraceNode] = []
+        rule_triggered = False
+        for rule in rule_list:
+            triggered, details = await _run_rule(
+                rule,
+                context,
+                defined_actions,
+                prefetch=prefetch == PREFETCH_RULE,
+                return_action_results=return_action_results,
+                short_circuit=short_circuit,
+                trace=trace,
+            )
+            if return_action_results and triggered:
+                return True, details
+
+            if isinstance(details, list):
+                aggregated_trace.extend(details)
+            elif details is not None:
+                aggregated_trace.append(details)
+
+            if triggered:
+                rule_triggered = True
+                if stop_on_first_trigger:
+                    return True, aggregated_trace
+
+        return rule_triggered, aggregated_trace
+    finally:
+        context.awaited_results = previous_results
+
+
+async def run_async(
+    rule: Rule,
+    defined_variables: Any,
+    defined_actions: Any,
+    *,
+    return_action_results: bool = False,
+    short_circuit: bool = False,
+    trace: str = TRACE_FULL,
+) -> RunResult:
+    """Evaluate a single rule, awaiting its coroutine variables and actions."""
+    context = evaluation_context(defined_variables)
+    previous_results = context.awaited_results
+    context.awaited_results = {}
+    try:
+        return await _run_rule(
+            rule,
+            context,
+            defined_actions,
+            prefetch=True,
+            return_action_results=return_action_results,
+            short_circuit=short_circuit,
+            trace=trace,
+        )
+    finally:
+        context.awaited_results = previous_results
+
+
+async def do_actions_async(
+    actions: Sequence[Action],
+    defined_variables: Any,
+    defined_actions: Any,
+) -> Any:
+    """Execute actions in order, awaiting coroutine actions; returns the final result."""
+    result: Any = None
+    for action in _normalize_actions(actions):
+        method, args, kwargs, spec = prepare_action(action, defined_variables, defined_actions)
+        if inspect.iscoroutinefunction(method):
+            try:
+                result = await method(*args, **kwargs)
+            except Exception as exc:
+                raise RuntimeError(f"'{method.__name__}': {exc}") from exc
+        else:
+            result = call_action(
+                method, args, kwargs, defined_variables, pure=spec is not None and spec.pure
+            )
+    return result
+
+
+async def resolve_async_dependencies(
+    rule_list: Sequence[Rule],
+    context: EvaluationContext,
+    defined_actions: Any,
+) -> None:
+    """Await every coroutine variable and condition action of ``rule_list`` concurrently.
+
+    Variables are primed on ``context`` first, then coroutine actions called by
+    conditions (whose arguments may read those variables) are awaited and
+    stored in ``context.awaited_results``. Failures are stored as well and
+    raised only if evaluation reaches them, as in the sync engine.
+    """
+    pending_variables: Dict[str, Any] = {}
+    for name in required_variables(rule_list):
+        if context.is_cached(name):
+            continue
+        awaitable = _variable_awaitable(context.defined_variables, name)
+        if awaitable is not None:
+            pending_variables[name] = awaitable
+
+    outcomes = await asyncio.gather(*pending_variables.values(), return_exceptions=True)
+    for name, outcome in zip(pending_variables, outcomes):
+        if isinstance(outcome, BaseException):
+            context.prime(name, AwaitedResult(error=outcome))
+        else:
+            context.prime(name, outcome)
+
+    if context.awaited_results is None:
+        context.awaited_results = {}
+    awaited = context.awaited_results
+    pending_actions: Dict[Hashable, Any] = {}
+    for action in condition_actions(rule_list):
+        method = getattr(defined_actions, action.get("function") or "", None)
+        if method is None or not inspect.iscoroutinefunction(method):
+            continue
+        try:
+            args, kwargs = _build_action_arguments(action.get("params"), context)
+            key = action_key(method, args, kwargs)
+            if key in awaited or key in pending_actions:
+                continue
+            pending_actions[key] = method(*args, **kwargs)
+        except Exception:
+            # Evaluation reports unresolvable or mismatched calls itself.
+            continue
+
+    outcomes = await asyncio.gather(*pending_actions.values(), return_exceptions=True)
+    for key, outcome in zip(pending_actions, outcomes):
+        if isinstance(outcome, BaseException):
+            awaited[key] = AwaitedResult(error=outcome)
+        else:
+            awaited[key] = AwaitedResult(outcome)
+
+
+async def _run_rule(
+    rule: Rule,
+    context: EvaluationContext,
+    defined_actions: Any,
+    *,
+    prefetch: bool,
+    return_action_results: bool,
+    short_circuit: bool,
+    trace: str,
+) -> RunResult:
+    if prefetch:
+        await resolve_async_dependencies([rule], context, defined_actions)
+    triggered, trace_nodes = check_conditions_recursively(
+        rule.get("conditions") or {},
+        context,
+        defined_actions,
+        short_circuit=short_circuit,
+        trace=trace,
+    )
+    if triggered:
+        action_result = await do_actions_async(rule.get("actions"), context, defined_actions)
+        if return_action_results:
+            return True, action_result
+        return True, trace_nodes
+    return False, trace_nodes
+
+
+def _variable_awaitable(defined_variables: Any, name: str) -> Any:
+    if isinstance(defined_variables, dict):
+        value = defined_variables.get(name)
+        return value if inspect.isawaitable(value) else None
+    value = getattr(defined_variables, name, None)
+    if inspect.iscoroutinefunction(value):
+        return value()
+    return value if inspect.isawaitable(value) else None
+
+
+__all__ = [
+    "PREFETCH_RULE",
+    "PREFETCH_RULE_SET",
+    "do_actions_async",
+    "resolve_async_dependencies",
+    "run_all_async",
+    "run_async",
+]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterator, Sequence, Set, Tuple
+
+from .engine import (
+    MISSING,
+    Action,
+    Condition,
+    Rule,
+    _is_literal_wrapper,
+    _is_variable_reference,
+    _lookup_variable_value,
+    _normalize_actions,
+    compile_math_expression,
+)
+
+
+def rule_variables(rule: Rule, variables_class: Any = None) -> FrozenSet[str]:
+    """Return the names of the variables evaluating ``rule`` may read.
+
+    The walk covers ``name`` leaves, expression identifiers, ``{"var"}``
+    references in values and params, ``value_condition`` branches and the
+    rule's actions. Plain string params resolve to a variable only when one
+    of that name exists, so with ``variables_class`` they are kept only if
+    the class defines them; without it every string param is included.
+    """
+    names: Set[str] = set()
+    candidates: Set[str] = set()
+    for condition in _iter_leaves(rule.get("conditions") or {}):
+        if "name" in condition:
+            names.add(condition["name"])
+        if "expression" in condition:
+            names.update(_expression_names(compile_math_expression(condition["expression"]).tree))
+        if "function" in condition:
+            _collect_params(condition.get("params"), names, candidates)
+        names.update(_reference_names(condition.get("value")))
+        for branch in condition.get("value_condition") or []:
+            names.update(_reference_names(branch.get("value")))
+            for action in _normalize_actions(branch.get("actions")):
+                _collect_params(action.get("params"), names, candidates)
+    for action in _normalize_actions(rule.get("actions")):
+        _collect_params(action.get("params"), names, candidates)
+
+    if variables_class is not None:
+        candidates = {name for name in candidates if hasattr(variables_class, name)}
+    return frozenset(names | candidates)
+
+
+def required_variables(rule_list: Sequence[Rule], variables_class: Any = None) -> Tuple[str, ...]:
+    """Return the sorted union of :func:`rule_variables` over ``rule_list``.
+
+    This is the projection a caller has to load to evaluate the rule set:
+    evaluating against ``project_variables(source, names)`` gives the same
+    results as evaluating against ``source``.
+    """
+    names: Set[str] = set()
+    for rule in rule_list:
+        names.update(rule_variables(rule, variables_class))
+    return tuple(sorted(names))
+
+
+def project_variables(defined_variables: Any, names: Sequence[str]) -> Dict[str, Any]:
+    """Resolve ``names`` from ``defined_variables`` in one pass into a flat dict.
+
+    ``defined_variables`` may be a dict, a variables object or an evaluation
+    context. Names it does not define are left out, so the dict behaves like
+    the source for every lookup the rules make. Variables are resolved
+    eagerly: one that raises does so here, even if short-circuiting would
+    have skipped it.
+    """
+    projected: Dict[str, Any] = {}
+    for name in names:
+        value = _lookup_variable_value(defined_variables, name)
+        if value is not MISSING:
+            projected[name] = value
+    return projected
+
+
+def condition_actions(rule_list: Sequence[Rule]) -> Iterator[Action]:
+    """Yield the action calls made while evaluating the conditions of ``rule_list``."""
+    for rule in rule_list:
+        for condition in _iter_leaves(rule.get("conditions") or {}):
+            if "function" in condition:
+                yield {"function": condition["function"], "params": condition.get("params", [])}
+            for branch in condition.get("value_condition") or []:
+                yield from _normalize_actions(branch.get("actions"))
+
+
+def _iter_leaves(condition_block: Condition) -> Iterator[Condition]:
+    """Yield every condition leaf of a block, including ``value_condition`` branches."""
+    if not isinstance(condition_block, dict) or not condition_block:
+        return
+    for group_type in ("all", "any"):
+        if group_type in condition_block:
+            for child in condition_block[group_type] or []:
+                yield from _iter_leaves(child)
+            return
+    yield condition_block
+    for branch in condition_block.get("value_condition") or []:
+        yield from _iter_leaves(branch.get("conditions") or {})
+
+
+def _expression_names(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        for arg in node["args"]:
+            yield from _expression_names(arg)
+    elif isinstance(node, str):
+        yield node
+
+
+def _collect_params(param: Any, names: Set[str], candidates: Set[str]) -> None:
+    """Sort param names into ``{"var"}`` references and plain strings that may be variables."""
+    if _is_variable_reference(param):
+        names.add(param["var"])
+    elif _is_literal_wrapper(param):
+        return
+    elif isinstance(param, str):
+        candidates.add(param)
+    elif isinstance(param, list):
+        for item in param:
+            _collect_params(item, names, candidates)
+    elif isinstance(param, dict):
+        for item in param.values():
+            _collect_params(item, names, candidates)
+
+
+def _reference_names(value: Any) -> Iterator[str]:
+    if _is_variable_reference(value):
+        yield value["var"]
+    elif isinstance(value, list):
+        for item in value:
+            yield from _reference_names(item)
+    elif isinstance(value, dict) and not _is_literal_wrapper(value):
+        for item in value.values():
+            yield from _reference_names(item)
+
+
+__all__ = [
+    "condition_actions",
+    "project_variables",
+    "required_variables",
+    "rule_variables",
+]
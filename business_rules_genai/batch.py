@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from .engine import (
+    MISSING,
+    Condition,
+    Rule,
+    _contains_variable_reference,
+    _evaluate_condition_block,
+    _lookup_variable_value,
+)
+from .operators import DECIMAL_BACKEND, BaseType, NumericType, ScaledIntegerBackend, get_numeric_backend
+
+NUMERIC_COLUMN = "numeric"
+BOOLEAN_COLUMN = "boolean"
+STRING_COLUMN = "string"
+OBJECT_COLUMN = "object"
+
+# Operator name -> number of comparison arguments it takes.
+_NUMERIC_KERNEL_ARITY = {
+    "equal_to": 1,
+    "greater_than": 1,
+    "greater_than_or_equal_to": 1,
+    "less_than": 1,
+    "less_than_or_equal_to": 1,
+    "between": 2,
+    "between_equal": 2,
+}
+_BOOLEAN_KERNELS = ("is_true", "is_false")
+
+
+def run_all_batch(
+    rule_list: Sequence[Rule],
+    records: Sequence[Any],
+    defined_actions: Any = None,
+    *,
+    per_rule: bool = False,
+) -> Any:
+    """Evaluate rule conditions over many records with NumPy column operations.
+
+    ``records`` holds one variables context per record (dicts or objects, as
+    accepted by ``run_all``). Each variable referenced by a vectorizable leaf
+    is gathered into a column once; numeric and boolean comparisons against
+    constant values run as array operations using ``NumericType.tolerance()``
+    for the active backend, and every other leaf (or every numeric leaf under
+    the scaled backend) falls back to the row-by-row engine.
+
+    Returns a boolean array with one entry per record that is ``True`` when any
+    rule's conditions pass, or a ``(records, rules)`` matrix when ``per_rule``
+    is set. Rule actions are not executed.
+    """
+    np = _require_numpy()
+    evaluator = BatchEvaluator(RecordColumns(list(records)), defined_actions)
+    matrix = np.zeros((evaluator.size, len(rule_list)), dtype=bool)
+    for index, rule in enumerate(rule_list):
+        matrix[:, index] = evaluator.evaluate_block(rule.get("conditions") or {}, f"rule[{index}]")
+    if per_rule:
+        return matrix
+    return matrix.any(axis=1)
+
+
+class RecordColumns:
+    """Column access over a sequence of per-record variables contexts."""
+
+    def __init__(self, records: Sequence[Any]) -> None:
+        self.records = records
+        self.size = len(records)
+        self._columns: Dict[str, Tuple[str, Any, Any]] = {}
+
+    def column(self, name: str) -> Tuple[str, Any, Any]:
+        """Return ``(kind, values, valid)`` for variable ``name``.
+
+        Numeric columns carry ``(floats, originals)``, boolean columns a boolean
+        array, and string or object columns an object array; ``valid`` masks
+        records holding a value.
+        """
+        if name not in self._columns:
+            np = _require_numpy()
+            values = np.empty(self.size, dtype=object)
+            for index, record in enumerate(self.records):
+                value = _lookup_variable_value(record, name)
+                values[index] = None if value is MISSING else value
+            self._columns[name] = typed_column(values)
+        return self._columns[name]
+
+    def record(self, index: int) -> Any:
+        return self.records[index]
+
+
+def typed_column(values: Any) -> Tuple[str, Any, Any]:
+    """Classify an object array and convert it to a typed column when possible."""
+    np = _require_numpy()
+    unwrapped = np.array([_unwrap(value) for value in values], dtype=object)
+    valid = np.array([value is not None for value in unwrapped], dtype=bool)
+    present = unwrapped[valid]
+
+    if all(isinstance(value, bool) for value in present):
+        return BOOLEAN_COLUMN, np.where(valid, unwrapped, False).astype(bool), valid
+    if all(
+        isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+        for value in present
+    ):
+        column = np.zeros(len(unwrapped), dtype=float)
+        column[valid] = [float(value) for value in present]
+        return NUMERIC_COLUMN, (column, unwrapped), valid
+    if all(isinstance(value, str) for value in present):
+        return STRING_COLUMN, unwrapped, valid
+    return OBJECT_COLUMN, unwrapped, valid
+
+
+class BatchEvaluator:
+    """Evaluate condition trees into per-record boolean masks."""
+
+    def __init__(self, columns: Any, defined_actions: Any = None) -> None:
+        self.columns = columns
+        self.defined_actions = defined_actions
+        self.size = columns.size
+        self.leaf_kernels: List[Callable[[Condition], Any]] = [self._numeric_or_boolean_leaf]
+        self.leaf_masks: Dict[str, Any] | None = None
+
+    def evaluate_block(self, condition_block: Condition, path: str = "") -> Any:
+        """Return the mask of ``condition_block``.
+
+        When ``leaf_masks`` is a dict, every leaf mask is also stored in it
+        under its ``path`` (for example ``rule[0].all[1]``).
+        """
+        np = _require_numpy()
+        if not condition_block:
+            return np.ones(self.size, dtype=bool)
+
+        for group_type, reducer in (("all", np.logical_and), ("any", np.logical_or)):
+            if group_type in condition_block:
+                children = condition_block[group_type]
+                if not isinstance(children, list) or not children:
+                    raise AssertionError(
+                        f"'{group_type}' requires a non-empty list of conditions"
+                    )
+                return reducer.reduce(
+                    [
+                        self.evaluate_block(child, f"{path}.{group_type}[{index}]")
+                        for index, child in enumerate(children)
+                    ]
+                )
+
+        mask = self.evaluate_leaf(condition_block)
+        if self.leaf_masks is not None:
+            self.leaf_masks[path] = mask
+        return mask
+
+    def evaluate_leaf(self, condition: Condition) -> Any:
+        for kernel in self.leaf_kernels:
+            mask = kernel(condition)
+            if mask is not None:
+                return mask
+        return self.evaluate_rows(condition)
+
+    def evaluate_rows(self, condition: Condition, rows: Any = None) -> Any:
+        """Evaluate ``condition`` with the row-by-row engine."""
+        np = _require_numpy()
+        indexes = range(self.size) if rows is None else rows
+        return np.fromiter(
+            (
+                _evaluate_condition_block(
+                    condition,
+                    self.columns.record(index),
+                    self.defined_actions,
+                    False,
+                    False,
+                )[0]
+                for index in indexes
+            ),
+            dtype=bool,
+            count=len(indexes),
+        )
+
+    def vectorizable_operands(self, condition: Condition) -> Tuple[Any, ...] | None:
+        """Return the comparison arguments of a ``name`` leaf with a constant value."""
+        if "expression" in condition or "function" in condition or "name" not in condition:
+            return None
+        if condition.get("value_condition") or condition.get("operator") is None:
+            return None
+        value = condition.get("value")
+        if _contains_variable_reference(value) or isinstance(value, dict):
+            return None
+        value = value.value if isinstance(value, BaseType) else value
+        return tuple(value) if isinstance(value, list) else (value,)
+
+    def _numeric_or_boolean_leaf(self, condition: Condition) -> Any:
+        operands = self.vectorizable_operands(condition)
+        if operands is None:
+            return None
+        operator = condition["operator"]
+        kind, values, valid = self.columns.column(condition["name"])
+
+        if kind == BOOLEAN_COLUMN and operator in _BOOLEAN_KERNELS:
+            return valid & (values if operator == "is_true" else ~values)
+
+        if kind != NUMERIC_COLUMN or _NUMERIC_KERNEL_ARITY.get(operator) != len(operands):
+            return None
+        # The scaled backend rounds every input to its scale before comparing,
+        # which the float columns do not reproduce.
+        if isinstance(get_numeric_backend(), ScaledIntegerBackend):
+            return None
+        bounds = [DECIMAL_BACKEND.cast(operand) for operand in operands]
+        if any(bound is None for bound in bounds):
+            return None
+        return self._numeric_kernel(operator, values, valid, bounds)
+
+    def _numeric_kernel(self, operator: str, values: Any, valid: Any, bounds: List[Decimal]) -> Any:
+        np = _require_numpy()
+        floats, originals = values
+        epsilon = float(NumericType.tolerance())
+        result = np.ones(self.size, dtype=bool)
+        uncertain = ~np.isfinite(floats)
+
+        for position, bound in enumerate(bounds):
+            difference = floats - float(bound)
+            greater = difference > epsilon
+            less = -difference > epsilon
+            equal = np.abs(difference) <= epsilon
+            if operator in ("between", "between_equal"):
+                check = {
+                    ("between", 0): greater,
+                    ("between", 1): less,
+                    ("between_equal", 0): greater | equal,
+                    ("between_equal", 1): less | equal,
+                }[(operator, position)]
+            else:
+                check = {
+                    "equal_to": equal,
+                    "greater_than": greater,
+                    "greater_than_or_equal_to": greater | equal,
+                    "less_than": less,
+                    "less_than_or_equal_to": less | equal,
+                }[operator]
+            result &= check
+            # Float rounding can flip results within a hair of the epsilon
+            # boundary; those records are re-checked with Decimal arithmetic.
+            tolerance = 1e-12 * (1.0 + np.abs(floats) + abs(float(bound)))
+            uncertain |= np.abs(np.abs(difference) - epsilon) <= tolerance
+
+        result &= valid
+        recheck = np.flatnonzero(uncertain & valid)
+        for index in recheck:
+            method = getattr(NumericType(originals[index]), operator)
+            result[index] = method(*bounds) is True
+        return result
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, NumericType):
+        return value.to_decimal()
+    return value.value if isinstance(value, BaseType) else value
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("Batch evaluation requires numpy to be installed") from exc
+    return numpy
+
+
+__all__ = [
+    "BOOLEAN_COLUMN",
+    "BatchEvaluator",
+    "NUMERIC_COLUMN",
+    "OBJECT_COLUMN",
+    "RecordColumns",
+    "STRING_COLUMN",
+    "run_all_batch",
+    "typed_column",
+]
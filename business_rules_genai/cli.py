@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib
+import json
+import sys
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Sequence
+
+from .engine import TRACE_LEVELS, TRACE_NONE
+from .operators import BaseType
+from .parallel import ERROR_MODES, ERRORS_COLLECT, ERRORS_RAISE, RecordResult, run_all_parallel
+
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+INPUT_FORMATS = (FORMAT_JSONL, FORMAT_CSV)
+
+DEFAULT_ACTIONS = "business_rules_genai.actions.BaseActions"
+BUFFER_SIZE = 1 << 20
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m business_rules_genai",
+        description="Evaluate business rules against fact files.",
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    evaluate = subcommands.add_parser(
+        "evaluate",
+        help="evaluate rules against a JSONL or CSV stream of facts",
+        description=(
+            "Read facts one record at a time, evaluate the rules against each "
+            "record and write one JSON decision per line."
+        ),
+    )
+    evaluate.add_argument("--rules", required=True, help="JSON file holding the list of rules")
+    evaluate.add_argument("--input", default="-", help="facts file, '-' for stdin (default)")
+    evaluate.add_argument("--output", default="-", help="decisions file, '-' for stdout (default)")
+    evaluate.add_argument(
+        "--format",
+        choices=INPUT_FORMATS,
+        help="input format; inferred from the input file extension, jsonl otherwise",
+    )
+    evaluate.add_argument(
+        "--actions",
+        default=DEFAULT_ACTIONS,
+        help=f"dotted path of the actions class (default: {DEFAULT_ACTIONS})",
+    )
+    evaluate.add_argument(
+        "--variables",
+        help="dotted path of a variables class built from each record; records are used as is otherwise",
+    )
+    evaluate.add_argument(
+        "--trace",
+        choices=TRACE_LEVELS,
+        default=TRACE_NONE,
+        help="trace level written with each decision (default: none)",
+    )
+    evaluate.add_argument("--return-action-results", action="store_true")
+    evaluate.add_argument("--stop-on-first-trigger", action="store_true")
+    evaluate.add_argument("--short-circuit", action="store_true")
+    evaluate.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    evaluate.add_argument(
+        "--chunk-size", type=int, default=1000, help="records sent to a worker at once (default: 1000)"
+    )
+    evaluate.add_argument(
+        "--errors",
+        choices=ERROR_MODES,
+        default=ERRORS_RAISE,
+        help="stop on the first failing record, or report failures per record (default: raise)",
+    )
+    evaluate.add_argument(
+        "--stats",
+        action="store_true",
+        help="print throughput and per-rule trigger counts to stderr",
+    )
+    evaluate.set_defaults(handler=evaluate_command)
+    return parser
+
+
+def evaluate_command(args: argparse.Namespace) -> int:
+    try:
+        rules = load_rules(args.rules)
+        actions_class = import_object(args.actions)
+        variables_class = import_object(args.variables) if args.variables else None
+    except (OSError, ValueError) as exc:
+        sys.stderr.write(f"error: {exc}\n")
+        return 1
+    input_format = args.format or _infer_format(args.input)
+
+    counts = [0] * len(rules)
+    records = triggered = failed = 0
+    started = time.perf_counter()
+    try:
+        with _open_input(args.input) as source, _open_output(args.output) as sink:
+            results = run_all_parallel(
+                rules,
+                read_records(source, input_format, errors=args.errors),
+                actions_class,
+                variables_factory=_RecordVariables(variables_class),
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                errors=args.errors,
+                trace=args.trace,
+                return_action_results=args.return_action_results,
+                stop_on_first_trigger=args.stop_on_first_trigger,
+                short_circuit=args.short_circuit,
+            )
+            include_result = args.trace != TRACE_NONE or args.return_action_results
+            lines: List[str] = []
+            for result in results:
+                records += 1
+                if result.error is not None:
+                    failed += 1
+                elif result.triggered:
+                    triggered += 1
+                for index in result.triggered_rules:
+                    counts[index] += 1
+                lines.append(format_decision(result, include_result))
+                if len(lines) >= args.chunk_size:
+                    sink.writelines(lines)
+                    lines.clear()
+            sink.writelines(lines)
+    except (RuntimeError, ValueError, KeyError, AssertionError) as exc:
+        sys.stderr.write(f"error: {exc}\n")
+        return 1
+    elapsed = time.perf_counter() - started
+
+    if args.stats:
+        _write_stats(sys.stderr, rules, counts, records, triggered, failed, elapsed)
+    return 0
+
+
+def load_rules(path: str) -> List[Dict[str, Any]]:
+    """Load a rule list from a JSON file; ``{"rules": [...]}`` documents are accepted too."""
+    with open(path, encoding="utf-8") as handle:
+        document = json.load(handle)
+    if isinstance(document, dict) and "rules" in document:
+        document = document["rules"]
+    if not isinstance(document, list):
+        raise ValueError(f"{path} must contain a list of rules")
+    return document
+
+
+def import_object(path: str) -> Any:
+    """Import ``package.module.Name`` (or ``package.module:Name``)."""
+    if ":" in path:
+        module_name, _, attribute = path.partition(":")
+    else:
+        module_name, _, attribute = path.rpartition(".")
+    if not module_name or not attribute:
+        raise ValueError(f"Expected a dotted import path, got {path!r}")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        raise ValueError(f"Cannot import {module_name!r}: {exc}") from exc
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ValueError(f"Module {module_name!r} has no attribute {attribute!r}") from None
+
+
+def read_records(
+    source: IO[str], input_format: str, errors: str = ERRORS_RAISE
+) -> Iterator[Dict[str, Any] | ValueError]:
+    """Yield records from a JSONL or CSV stream one at a time.
+
+    CSV cells holding JSON scalars (numbers, ``true``/``false``, ``null``) are
+    decoded; other cells stay strings, and empty cells are left out of the
+    record so they read as missing variables. A JSONL line that does not
+    decode raises ``ValueError``, or with ``errors="collect"`` is yielded as
+    that error in the record's place.
+    """
+    if input_format == FORMAT_JSONL:
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                error = ValueError(f"invalid JSON on line {number}: {exc}")
+                if errors != ERRORS_COLLECT:
+                    raise error from exc
+                yield error
+    elif input_format == FORMAT_CSV:
+        for row in csv.DictReader(source):
+            yield {key: _parse_cell(value) for key, value in row.items() if value}
+    else:
+        raise ValueError(f"Unknown input format: {input_format!r}")
+
+
+class _RecordVariables:
+    """Variables factory that builds ``variables_class`` from each record.
+
+    Records the reader could not decode are re-raised here, so the run
+    reports them on the record's own result.
+    """
+
+    def __init__(self, variables_class: type | None = None) -> None:
+        self.variables_class = variables_class
+
+    def __call__(self, record: Any) -> Any:
+        if isinstance(record, ValueError):
+            raise record
+        return record if self.variables_class is None else self.variables_class(record)
+
+
+def format_decision(result: RecordResult, include_result: bool) -> str:
+    decision: Dict[str, Any] = {"index": result.index, "triggered": result.triggered}
+    if result.error is not None:
+        decision["error"] = result.error
+    if result.triggered_rules:
+        decision["rules"] = list(result.triggered_rules)
+    if include_result and result.error is None:
+        decision["result"] = result.result
+    return json.dumps(decision, default=_json_default) + "\n"
+
+
+def _parse_cell(value: str) -> Any:
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return value
+    return parsed if not isinstance(parsed, (dict, list)) else value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseType):
+        value = value.value
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _infer_format(path: str) -> str:
+    return FORMAT_CSV if Path(path).suffix.lower() == ".csv" else FORMAT_JSONL
+
+
+@contextmanager
+def _open_input(path: str) -> Iterator[IO[str]]:
+    if path == "-":
+        yield sys.stdin
+        return
+    with open(path, encoding="utf-8", newline="", buffering=BUFFER_SIZE) as handle:
+        yield handle
+
+
+@contextmanager
+def _open_output(path: str) -> Iterator[IO[str]]:
+    if path == "-":
+        try:
+            yield sys.stdout
+        finally:
+            sys.stdout.flush()
+        return
+    with open(path, "w", encoding="utf-8", buffering=BUFFER_SIZE) as handle:
+        yield handle
+
+
+def _write_stats(
+    stream: IO[str],
+    rules: Sequence[Dict[str, Any]],
+    counts: Iterable[int],
+    records: int,
+    triggered: int,
+    failed: int,
+    elapsed: float,
+) -> None:
+    rate = records / elapsed if elapsed > 0 else 0.0
+    stream.write(
+        f"records: {records}  triggered: {triggered}  errors: {failed}  "
+        f"elapsed: {elapsed:.3f}s  throughput: {rate:,.0f} records/s\n"
+    )
+    for index, (rule, count) in enumerate(zip(rules, counts)):
+        label = rule.get("name") or rule.get("id") or f"rule[{index}]"
+        stream.write(f"  {label}: {count}\n")
+    stream.flush()
+
+
+__all__ = ["build_parser", "import_object", "load_rules", "main", "read_records"]
@@ -0,0 +1,1276 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import inspect
+import json
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from .engine import (
+    COMPARISON_OPERATOR_MAP,
+    SKIPPED,
+    TRACE_FULL,
+    TRACE_LEVELS,
+    TRACE_NONE,
+    TRACE_RESULT,
+    Action,
+    Condition,
+    Rule,
+    RunResult,
+    TraceNode,
+    _block_type,
+    _build_action_arguments,
+    _contains_variable_reference,
+    _do_operator_comparison,
+    _format_action_params,
+    _format_summary,
+    _get_variable_value,
+    _is_literal_wrapper,
+    _is_variable_reference,
+    _normalize_actions,
+    _resolve_rule_value,
+    call_action,
+    compile_math_expression,
+)
+from .actions import get_action_spec
+from .analysis import project_variables, required_variables
+from .context import evaluation_context
+from .fields import FIELD_LIST, FIELD_NO_INPUT
+from .observers import ACTIVE_OBSERVERS, CONDITION, RULE, notify_call
+from .validation import validate_rules
+from .variables import export_rule_variables
+from .operators import (
+    BaseType,
+    BooleanType,
+    NumericBackend,
+    NumericType,
+    OperatorEntry,
+    StringType,
+    TYPE_CLASS_MAP,
+    compile_regex,
+    get_operator_table,
+    membership_set,
+    resolve_numeric_backend,
+    use_numeric_backend,
+)
+
+Resolver = Callable[[Any, Any], Any]
+ValueResolver = Callable[["_Evaluation"], Any]
+
+_OPERATOR_TYPES = (BooleanType, NumericType, StringType)
+
+
+class CompiledRuleSet:
+    """An ordered collection of rules validated and compiled ahead of time.
+
+    Instances are produced by :func:`compile_rules` and evaluate records with
+    the same results and trace output as :func:`business_rules_genai.engine.run_all`.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence["CompiledRule"],
+        *,
+        group_nodes: Sequence["_GroupNode"] = (),
+        required_variables: Sequence[str] = (),
+        projected_variables: Sequence[str] | None = None,
+        share_conditions: bool = False,
+        distinct_conditions: int | None = None,
+        numeric_backend: NumericBackend | None = None,
+    ) -> None:
+        self.rules: Tuple[CompiledRule, ...] = tuple(rules)
+        self.group_nodes = tuple(group_nodes)
+        # Variables the rules may read, see ``analysis.required_variables``.
+        self.required_variables: Tuple[str, ...] = tuple(required_variables)
+        # Names resolved by ``projected`` runs: every plain string param is kept,
+        # since the variables object may define it outside its class.
+        self.projected_variables: Tuple[str, ...] = (
+            self.required_variables if projected_variables is None else tuple(projected_variables)
+        )
+        self.share_conditions = share_conditions
+        self.numeric_backend = numeric_backend
+        # Number of distinct condition nodes in the shared network, if any.
+        self.distinct_conditions = distinct_conditions
+        # Adaptive ordering state, see ``enable_adaptive_ordering``.
+        self.rule_stats: _ChildStats | None = None
+        self.rule_order: Tuple[int, ...] | None = None
+
+    def enable_adaptive_ordering(
+        self,
+        *,
+        replan_every: int = 1000,
+        reorder_rules: bool = False,
+    ) -> None:
+        """Learn condition order from live traffic.
+
+        Every ``all`` / ``any`` group records each child's pass rate and latency
+        and, every ``replan_every`` evaluations, re-plans the order in which
+        ``run_all(short_circuit=True)`` evaluates its children. Children that
+        are cheap and likely to decide the group (fail an ``all``, pass an
+        ``any``) move to the front. Traces keep the authored order.
+
+        With ``reorder_rules``, rules are also re-planned by trigger rate and
+        latency for ``run_all(stop_on_first_trigger=True)`` and
+        ``return_action_results=True``. This changes which rule wins when
+        several could trigger, so enable it only for mutually exclusive rules.
+        """
+        if replan_every < 1:
+            raise ValueError("replan_every must be at least 1")
+        for node in self.group_nodes:
+            node.stats = _ChildStats(len(node.children), replan_every)
+        self.rule_stats = _ChildStats(len(self.rules), replan_every) if reorder_rules else None
+
+    def disable_adaptive_ordering(self) -> None:
+        """Stop collecting statistics; learned orders stay in effect."""
+        for node in self.group_nodes:
+            node.stats = None
+        self.rule_stats = None
+
+    def export_plan(self) -> Dict[str, Any]:
+        """Return the learned ordering and its statistics as a JSON-compatible dict.
+
+        Groups and rules are keyed by a digest of their content, so a plan can
+        be imported into a later compilation of an edited rule set; entries
+        for changed conditions are ignored.
+        """
+        groups = {}
+        for node in self.group_nodes:
+            if node.stats is None and node.order is None:
+                continue
+            groups[_content_digest(node.block)] = {
+                "type": node.group_type,
+                "order": list(node.order or range(len(node.children))),
+                "children": node.stats.export() if node.stats is not None else None,
+            }
+        plan: Dict[str, Any] = {"version": _PLAN_VERSION, "groups": groups}
+        if self.rule_stats is not None or self.rule_order is not None:
+            plan["rules"] = {
+                "order": [
+                    _content_digest(self.rules[index].rule) for index in self.rule_order or range(len(self.rules))
+                ],
+                "stats": {
+                    _content_digest(rule.rule): entry
+                    for rule, entry in zip(self.rules, self.rule_stats.export())
+                }
+                if self.rule_stats is not None
+                else {},
+            }
+        return plan
+
+    def import_plan(self, plan: Dict[str, Any]) -> None:
+        """Apply a plan produced by :meth:`export_plan` to matching groups and rules."""
+        if plan.get("version") != _PLAN_VERSION:
+            raise ValueError(f"Unsupported plan version: {plan.get('version')!r}")
+        groups = plan.get("groups") or {}
+        for node in self.group_nodes:
+            entry = groups.get(_content_digest(node.block))
+            if entry is None or len(entry["order"]) != len(node.children):
+                continue
+            if entry.get("children") is not None:
+                if node.stats is None:
+                    node.stats = _ChildStats(len(node.children), _DEFAULT_REPLAN_EVERY)
+                node.stats.load(entry["children"])
+            node.order = _non_trivial_order(entry["order"])
+
+        rules = plan.get("rules")
+        if rules:
+            digests = [_content_digest(rule.rule) for rule in self.rules]
+            stats = rules.get("stats") or {}
+            if stats:
+                if self.rule_stats is None:
+                    self.rule_stats = _ChildStats(len(self.rules), _DEFAULT_REPLAN_EVERY)
+                self.rule_stats.load([stats.get(digest, [0, 0, 0.0]) for digest in digests])
+            positions: Dict[str, List[int]] = {}
+            for index, digest in enumerate(digests):
+                positions.setdefault(digest, []).append(index)
+            order = [index for digest in dict.fromkeys(rules.get("order") or []) for index in positions.get(digest, ())]
+            placed = set(order)
+            order += [index for index in range(len(self.rules)) if index not in placed]
+            self.rule_order = _non_trivial_order(order)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def run_all(
+        self,
+        defined_variables: Any,
+        defined_actions: Any,
+        *,
+        stop_on_first_trigger: bool = False,
+        return_action_results: bool = False,
+        short_circuit: bool = False,
+        trace: str = TRACE_FULL,
+        projected: bool = False,
+    ) -> RunResult:
+        """Evaluate every compiled rule against the provided context.
+
+        With ``projected``, the variables the rules may read are first resolved
+        from ``defined_variables`` in one pass into a flat dict (see
+        :func:`~business_rules_genai.analysis.project_variables`) and the rules
+        are evaluated against that dict. The projection covers the
+        :attr:`required_variables` plus every plain string param, which may name
+        an instance attribute the variables class does not declare.
+        """
+        triggered, details, _ = self.run_all_detailed(
+            defined_variables,
+            defined_actions,
+            stop_on_first_trigger=stop_on_first_trigger,
+            return_action_results=return_action_results,
+            short_circuit=short_circuit,
+            trace=trace,
+            projected=projected,
+        )
+        return triggered, details
+
+    def run_all_detailed(
+        self,
+        defined_variables: Any,
+        defined_actions: Any,
+        *,
+        stop_on_first_trigger: bool = False,
+        return_action_results: bool = False,
+        short_circuit: bool = False,
+        trace: str = TRACE_FULL,
+        projected: bool = False,
+    ) -> Tuple[bool, Any, Tuple[int, ...]]:
+        """Like :meth:`run_all`, also returning the indices of the rules that triggered."""
+        if projected:
+            defined_variables = project_variables(defined_variables, self.projected_variables)
+        backend_scope = (
+            nullcontext()
+            if self.numeric_backend is None
+            else use_numeric_backend(self.numeric_backend)
+        )
+        with backend_scope:
+            evaluation = _Evaluation(
+                defined_variables,
+                defined_actions,
+                short_circuit,
+                trace,
+                {} if self.share_conditions else None,
+            )
+            if self.rule_stats is not None or (
+                self.rule_order is not None and (stop_on_first_trigger or return_action_results)
+            ):
+                return self._run_planned(evaluation, stop_on_first_trigger, return_action_results)
+
+            aggregated_trace: List[TraceNode] = []
+            triggered_rules: List[int] = []
+
+            for index, rule in enumerate(self.rules):
+                triggered, details = rule.run_evaluation(evaluation, return_action_results)
+                if return_action_results and triggered:
+                    return True, details, (*triggered_rules, index)
+
+                if isinstance(details, list):
+                    aggregated_trace.extend(details)
+                elif details is not None:
+                    aggregated_trace.append(details)
+
+                if triggered:
+                    triggered_rules.append(index)
+                    if stop_on_first_trigger:
+                        break
+
+            return bool(triggered_rules), aggregated_trace, tuple(triggered_rules)
+
+    def _run_planned(
+        self,
+        evaluation: "_Evaluation",
+        stop_on_first_trigger: bool,
+        return_action_results: bool,
+    ) -> Tuple[bool, Any, Tuple[int, ...]]:
+        stats = self.rule_stats
+        planned = stop_on_first_trigger or return_action_results
+        order = self.rule_order if planned and self.rule_order is not None else range(len(self.rules))
+        details_by_rule: Dict[int, Any] = {}
+        triggered_rules: List[int] = []
+
+        for index in order:
+            started = perf_counter()
+            triggered, details = self.rules[index].run_evaluation(evaluation, return_action_results)
+            if stats is not None:
+                stats.record(index, triggered, perf_counter() - started)
+            if return_action_results and triggered:
+                self._maybe_replan_rules()
+                return True, details, (*sorted(triggered_rules), index)
+            details_by_rule[index] = details
+            if triggered:
+                triggered_rules.append(index)
+                if stop_on_first_trigger:
+                    break
+        self._maybe_replan_rules()
+
+        aggregated_trace: List[TraceNode] = []
+        for index in sorted(details_by_rule):
+            details = details_by_rule[index]
+            if isinstance(details, list):
+                aggregated_trace.extend(details)
+            elif details is not None:
+                aggregated_trace.append(details)
+        return bool(triggered_rules), aggregated_trace, tuple(sorted(triggered_rules))
+
+    def _maybe_replan_rules(self) -> None:
+        stats = self.rule_stats
+        if stats is not None and stats.tick():
+            # Rules are ranked like the children of an ``any`` group.
+            self.rule_order = _non_trivial_order(stats.plan(deciding_result=True))
+
+
+class CompiledRule:
+    """A single rule whose condition tree and actions are pre-bound."""
+
+    def __init__(self, rule: Rule, root: "_Node", actions: Sequence["_ActionCall"]) -> None:
+        self.rule = rule
+        self.root = root
+        self.actions = tuple(actions)
+        conditions = rule.get("conditions") or {}
+        self.root_type = _block_type(conditions) if conditions else None
+
+    def check_conditions(
+        self,
+        defined_variables: Any,
+        defined_actions: Any,
+        *,
+        short_circuit: bool = False,
+        trace: str = TRACE_FULL,
+    ) -> Tuple[bool, List[TraceNode]]:
+        evaluation = _Evaluation(defined_variables, defined_actions, short_circuit, trace)
+        return self.check_evaluation(evaluation)
+
+    def check_evaluation(self, evaluation: "_Evaluation") -> Tuple[bool, List[TraceNode]]:
+        passed, trace_node = self.root.evaluate(evaluation)
+        if evaluation.trace == TRACE_RESULT and self.root_type is not None:
+            trace_node = {"type": self.root_type, "result": passed}
+        return passed, [trace_node] if trace_node else []
+
+    def run(
+        self,
+        defined_variables: Any,
+        defined_actions: Any,
+        *,
+        return_action_results: bool = False,
+        short_circuit: bool = False,
+        trace: str = TRACE_FULL,
+    ) -> RunResult:
+        """Evaluate the rule, executing its actions when the conditions pass."""
+        evaluation = _Evaluation(defined_variables, defined_actions, short_circuit, trace)
+        return self.run_evaluation(evaluation, return_action_results)
+
+    def run_evaluation(
+        self,
+        evaluation: "_Evaluation",
+        return_action_results: bool = False,
+    ) -> RunResult:
+        if ACTIVE_OBSERVERS:
+            return notify_call(RULE, self.rule, self._run_evaluation, evaluation, return_action_results)
+        return self._run_evaluation(evaluation, return_action_results)
+
+    def _run_evaluation(self, evaluation: "_Evaluation", return_action_results: bool) -> RunResult:
+        triggered, trace_nodes = self.check_evaluation(evaluation)
+
+        if triggered:
+            action_result = None
+            for action in self.actions:
+                action_result = action(evaluation.defined_variables, evaluation.defined_actions)
+            if return_action_results:
+                return True, action_result
+            return True, trace_nodes
+
+        return False, trace_nodes
+
+
+def compile_rules(
+    rule_list: Sequence[Rule],
+    actions_class: Any,
+    variables_class: Any = None,
+    *,
+    share_conditions: bool = False,
+    numeric_backend: str | NumericBackend | None = None,
+    validate: bool = False,
+    reorder_conditions: bool = False,
+) -> CompiledRuleSet:
+    """Validate ``rule_list`` once and compile it into a :class:`CompiledRuleSet`.
+
+    ``actions_class`` may be an actions class or instance; every referenced
+    action must exist on it and accept the declared params. When
+    ``variables_class`` is given, every ``name`` leaf must refer to one of its
+    attributes. Structural problems raise the same exception types the
+    interpreter raises at evaluation time.
+
+    With ``share_conditions`` the rule set is compiled into a shared condition
+    network: identical leaves and sub-trees across all rules become a single
+    node that is evaluated at most once per ``run_all`` call, its result reused
+    by every rule referencing it. This assumes rule actions do not change the
+    values conditions read during the same call.
+
+    Constant ``matches_regex`` patterns are compiled up front.
+
+    ``numeric_backend`` (``"decimal"``, ``"float"``, ``"scaled"`` or a
+    :class:`~business_rules_genai.operators.NumericBackend`) selects the number
+    representation used while this rule set runs, overriding the process-wide
+    default.
+
+    With ``validate`` the rules are first type-checked by
+    :func:`~business_rules_genai.validation.validate_rules` against
+    ``variables_class`` (required), raising ``RuleValidationError``. Leaves
+    comparing a validated variable with a constant then skip the per-call
+    operator dispatch and argument checks for values of the declared type.
+
+    With ``reorder_conditions``, ``run_all(short_circuit=True)`` evaluates the
+    children of each ``all`` / ``any`` group cheapest first, so a decisive
+    plain variable check can skip expensive siblings. Leaf costs are estimated
+    as plain variable < expression < function < ``value_condition``, refined
+    by the ``cost`` hints of ``rule_variable`` and ``rule_action``. Traces keep
+    the authored order. Reordering assumes conditions have no side effects.
+    """
+    variable_types = None
+    if validate:
+        if variables_class is None:
+            raise ValueError("validate=True requires a variables_class")
+        validate_rules(rule_list, variables_class, actions_class)
+        variable_types = {
+            definition["name"]: TYPE_CLASS_MAP[definition["field_type"]]
+            for definition in export_rule_variables(variables_class, include_operators=False)
+        }
+    compiler = _RuleCompiler(
+        actions_class,
+        variables_class,
+        share_conditions=share_conditions,
+        variable_types=variable_types,
+        cost_model=_CostModel(actions_class, variables_class) if reorder_conditions else None,
+    )
+    rules = [compiler.compile_rule(rule) for rule in rule_list]
+    return CompiledRuleSet(
+        rules,
+        group_nodes=compiler.group_nodes,
+        required_variables=required_variables(rule_list, variables_class),
+        projected_variables=required_variables(rule_list),
+        share_conditions=share_conditions,
+        distinct_conditions=(
+            None if compiler.shared_nodes is None else len(compiler.shared_nodes)
+        ),
+        numeric_backend=(
+            None if numeric_backend is None else resolve_numeric_backend(numeric_backend)
+        ),
+    )
+
+
+class _RuleCompiler:
+    def __init__(
+        self,
+        actions_class: Any,
+        variables_class: Any,
+        *,
+        share_conditions: bool = False,
+        variable_types: Dict[str, type] | None = None,
+        cost_model: "_CostModel | None" = None,
+    ) -> None:
+        self.actions_class = (
+            actions_class if inspect.isclass(actions_class) else actions_class.__class__
+        )
+        self.variables_class = variables_class
+        self.shared_nodes: Dict[str, _Node] | None = {} if share_conditions else None
+        # Wrapper types of the variables proven by ``validate_rules``, if run.
+        self.variable_types = variable_types or {}
+        self.cost_model = cost_model
+        self.group_nodes: List[_GroupNode] = []
+
+    def compile_rule(self, rule: Rule) -> CompiledRule:
+        root = self.compile_block(rule.get("conditions") or {})
+        actions = [self.compile_action(action) for action in _normalize_actions(rule.get("actions"))]
+        return CompiledRule(rule, root, actions)
+
+    def compile_block(self, condition_block: Condition) -> "_Node":
+        if not condition_block:
+            return _EMPTY_NODE
+        if self.shared_nodes is None:
+            return self._compile_block(condition_block)
+
+        key = _condition_key(condition_block)
+        node = self.shared_nodes.get(key)
+        if node is None:
+            node = self.shared_nodes[key] = _SharedNode(self._compile_block(condition_block))
+        return node
+
+    def _compile_block(self, condition_block: Condition) -> "_Node":
+        for group_type in ("all", "any"):
+            if group_type in condition_block:
+                children = condition_block[group_type]
+                if not isinstance(children, list) or not children:
+                    raise AssertionError(
+                        f"'{group_type}' requires a non-empty list of conditions"
+                    )
+                order = None
+                if self.cost_model is not None:
+                    costs = [self.cost_model.block_cost(child) for child in children]
+                    order = sorted(range(len(children)), key=lambda index: (costs[index], index))
+                node = _GroupNode(
+                    group_type,
+                    [self.compile_block(child) for child in children],
+                    order,
+                    block=condition_block,
+                )
+                self.group_nodes.append(node)
+                return node
+
+        return self.compile_condition(condition_block)
+
+    def compile_condition(self, condition: Condition) -> "_Node":
+        value_resolver = self.compile_comparison_value(condition)
+        label = condition.get("label")
+
+        if "expression" in condition:
+            expression = condition["expression"]
+            source = compile_math_expression(expression)
+            label = label or expression
+        elif "function" in condition:
+            function_name = condition["function"]
+            params = condition.get("params", [])
+            source = self.compile_action({"function": function_name, "params": params})
+            label = label or f"{function_name}({_format_action_params(condition.get('params'))})"
+        elif "name" in condition:
+            name = condition["name"]
+            if self.variables_class is not None and not hasattr(self.variables_class, name):
+                raise AssertionError(
+                    f"Variable {name} is not defined in class {_class_name(self.variables_class)}"
+                )
+            source = _variable_source(name)
+            label = label or name
+        elif label:
+            return _DisplayNode(label, value_resolver)
+        else:
+            raise ValueError("Condition must specify 'name', 'function', 'expression', or 'label'.")
+
+        operator = condition.get("operator")
+        if operator is None:
+            raise ValueError("Condition is missing an 'operator'.")
+
+        pattern = _constant_regex(condition)
+        if pattern is not None:
+            return _RegexConditionNode(label, operator, source, value_resolver, pattern)
+
+        if (
+            operator == "is_in"
+            and value_resolver.is_constant
+            and isinstance(value_resolver.constant, (list, tuple))
+        ):
+            try:
+                members = membership_set(value_resolver.constant)
+            except TypeError:
+                members = None
+            if members is not None:
+                return _MembershipConditionNode(label, operator, source, value_resolver, members)
+
+        type_class = self.variable_types.get(condition.get("name"))
+        if type_class is not None and "name" in condition and value_resolver.is_constant:
+            entry = _operator_dispatch(operator).get(type_class)
+            if (
+                entry is not None
+                and entry.casts_arguments
+                and entry.input_type != FIELD_NO_INPUT
+                and entry.comparison_type != FIELD_LIST
+            ):
+                return _TypedConditionNode(label, operator, source, value_resolver, type_class)
+
+        return _ConditionNode(label, operator, source, value_resolver)
+
+    def compile_comparison_value(self, condition: Condition) -> "_ValueResolver":
+        value_condition_list = condition.get("value_condition")
+        if value_condition_list:
+            branches = []
+            for branch in value_condition_list:
+                branch_conditions = branch.get("conditions") or {}
+                node = self.compile_block(branch_conditions) if branch_conditions else None
+                if "value" in branch:
+                    outcome: Any = _ValueResolver.for_rule_value(branch["value"])
+                else:
+                    outcome = [
+                        self.compile_action(action)
+                        for action in _normalize_actions(branch.get("actions") or [])
+                    ]
+                branches.append((node, outcome))
+            return _ValueResolver(_value_condition_resolver(branches))
+        return _ValueResolver.for_rule_value(condition.get("value"))
+
+    def compile_action(self, action: Action) -> "_ActionCall":
+        method_name = action.get("function") or action.get("name")
+        if not method_name:
+            raise AssertionError("Action is missing a 'function' or 'name'.")
+
+        spec = get_action_spec(self.actions_class, method_name)
+        if spec is None:
+            raise AssertionError(
+                f"Action {method_name} is not defined in class {self.actions_class.__name__}"
+            )
+
+        raw_params = action.get("params")
+        try:
+            spec.check_arguments(*_action_argument_shape(raw_params))
+        except TypeError as exc:
+            raise AssertionError(f"Action {method_name} parameter mismatch: {exc}") from exc
+
+        return _ActionCall(method_name, raw_params, spec.pure)
+
+
+class _ActionCall:
+    """A pre-validated action invocation resolved against the runtime actions."""
+
+    def __init__(self, method_name: str, raw_params: Any, pure: bool = False) -> None:
+        self.method_name = method_name
+        self.raw_params = raw_params
+        self.pure = pure
+
+    def __call__(self, defined_variables: Any, defined_actions: Any) -> Any:
+        method = getattr(defined_actions, self.method_name)
+        args, kwargs = _build_action_arguments(self.raw_params, defined_variables)
+        return call_action(method, args, kwargs, defined_variables, pure=self.pure)
+
+
+class _ValueResolver:
+    """Comparison value that is either a compile-time constant or resolved per call."""
+
+    def __init__(self, resolver: ValueResolver | None = None, constant: Any = None) -> None:
+        self.resolver = resolver
+        self.constant = constant
+
+    @classmethod
+    def for_rule_value(cls, value: Any) -> "_ValueResolver":
+        if _contains_variable_reference(value):
+            return cls(
+                lambda evaluation: _resolve_rule_value(value, evaluation.defined_variables)
+            )
+        return cls(constant=_unwrap(_resolve_rule_value(value, {})))
+
+    @property
+    def is_constant(self) -> bool:
+        return self.resolver is None
+
+    def __call__(self, evaluation: "_Evaluation") -> Any:
+        if self.resolver is None:
+            return self.copy_constant()
+        return _unwrap(self.resolver(evaluation))
+
+    def copy_constant(self) -> Any:
+        """Return the constant, copied when mutable so calls never share it."""
+        constant = self.constant
+        if type(constant) is list and not any(isinstance(item, (dict, list)) for item in constant):
+            return list(constant)
+        if isinstance(constant, (dict, list)):
+            return copy.deepcopy(constant)
+        return constant
+
+
+class _Evaluation:
+    """Per-call evaluation state threaded through the compiled node tree."""
+
+    __slots__ = (
+        "defined_variables",
+        "defined_actions",
+        "short_circuit",
+        "trace",
+        "build_trace",
+        "memo",
+    )
+
+    def __init__(
+        self,
+        defined_variables: Any,
+        defined_actions: Any,
+        short_circuit: bool = False,
+        trace: str = TRACE_FULL,
+        memo: Dict["_Node", Tuple[bool, TraceNode | None, bool]] | None = None,
+    ) -> None:
+        if trace not in TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level: {trace!r}")
+        self.defined_variables = evaluation_context(defined_variables)
+        self.defined_actions = defined_actions
+        self.short_circuit = short_circuit
+        self.trace = trace
+        self.build_trace = trace == TRACE_FULL
+        self.memo = memo
+
+    def without_trace(self) -> "_Evaluation":
+        if not self.build_trace:
+            return self
+        return _Evaluation(
+            self.defined_variables,
+            self.defined_actions,
+            self.short_circuit,
+            TRACE_NONE,
+            self.memo,
+        )
+
+
+class _Node:
+    def evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        raise NotImplementedError
+
+    def skipped_trace(self) -> TraceNode | None:
+        """Return the trace node reported when short-circuiting skips this node."""
+        raise NotImplementedError
+
+
+class _EmptyNode(_Node):
+    def evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        return True, None
+
+    def skipped_trace(self) -> TraceNode | None:
+        return None
+
+
+_EMPTY_NODE = _EmptyNode()
+
+
+class _GroupNode(_Node):
+    def __init__(
+        self,
+        group_type: str,
+        children: Sequence[_Node],
+        order: Sequence[int] | None = None,
+        *,
+        block: Condition | None = None,
+    ) -> None:
+        self.group_type = group_type
+        self.children = tuple(children)
+        self.block = block
+        # Evaluation order of the children under short-circuiting, kept only
+        # when it differs from the authored order.
+        self.order = _non_trivial_order(order)
+        # Per-child statistics while adaptive ordering is enabled.
+        self.stats: _ChildStats | None = None
+
+    def evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        if self.stats is not None or (self.order is not None and evaluation.short_circuit):
+            return self._evaluate_reordered(evaluation)
+
+        child_nodes: List[TraceNode] = []
+        short_circuit = evaluation.short_circuit
+        build_trace = evaluation.build_trace
+        # A failing child settles an ``all`` group, a passing child an ``any``.
+        deciding_result = self.group_type != "all"
+        group_passed = not deciding_result
+
+        for child in self.children:
+            if short_circuit and group_passed is deciding_result:
+                if not build_trace:
+                    break
+                child_node = child.skipped_trace()
+            else:
+                child_passed, child_node = child.evaluate(evaluation)
+                if child_passed is deciding_result:
+                    group_passed = deciding_result
+            if child_node is not None:
+                child_nodes.append(child_node)
+
+        if not build_trace:
+            return group_passed, None
+
+        return group_passed, {
+            "type": self.group_type,
+            "result": group_passed,
+            "children": child_nodes,
+        }
+
+    def _evaluate_reordered(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        build_trace = evaluation.build_trace
+        short_circuit = evaluation.short_circuit
+        stats = self.stats
+        deciding_result = self.group_type != "all"
+        group_passed = not deciding_result
+        # Trace nodes are slotted back into the authored order.
+        child_nodes: List[TraceNode | None] = [None] * len(self.children)
+        order = self.order if short_circuit and self.order is not None else range(len(self.children))
+
+        for index in order:
+            child = self.children[index]
+            if short_circuit and group_passed is deciding_result:
+                if not build_trace:
+                    break
+                child_nodes[index] = child.skipped_trace()
+                continue
+            if stats is None:
+                child_passed, child_nodes[index] = child.evaluate(evaluation)
+            else:
+                started = perf_counter()
+                child_passed, child_nodes[index] = child.evaluate(evaluation)
+                stats.record(index, child_passed, perf_counter() - started)
+            if child_passed is deciding_result:
+                group_passed = deciding_result
+
+        if stats is not None and stats.tick():
+            self.order = _non_trivial_order(stats.plan(deciding_result))
+
+        if not build_trace:
+            return group_passed, None
+
+        return group_passed, {
+            "type": self.group_type,
+            "result": group_passed,
+            "children": [node for node in child_nodes if node is not None],
+        }
+
+    def skipped_trace(self) -> TraceNode | None:
+        child_nodes = [child.skipped_trace() for child in self.children]
+        return {
+            "type": self.group_type,
+            "result": SKIPPED,
+            "children": [node for node in child_nodes if node is not None],
+        }
+
+
+class _DisplayNode(_Node):
+    def __init__(self, label: Any, value_resolver: _ValueResolver) -> None:
+        self.label = label
+        self.value_resolver = value_resolver
+
+    def evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        if ACTIVE_OBSERVERS:
+            return notify_call(CONDITION, self.label, self._evaluate, evaluation)
+        return self._evaluate(evaluation)
+
+    def _evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        threshold = self.value_resolver(evaluation)
+        if not evaluation.build_trace:
+            return True, None
+        return True, {
+            "type": "display",
+            "label": self.label,
+            "threshold": threshold,
+        }
+
+    def skipped_trace(self) -> TraceNode | None:
+        return {
+            "type": "display",
+            "label": self.label,
+            "threshold": self.value_resolver.copy_constant(),
+            "result": SKIPPED,
+        }
+
+
+class _ConditionNode(_Node):
+    def __init__(
+        self,
+        label: Any,
+        operator: str,
+        source: Resolver,
+        value_resolver: _ValueResolver,
+    ) -> None:
+        self.label = label
+        self.raw_operator = operator
+        self.operator = COMPARISON_OPERATOR_MAP.get(operator, operator)
+        self.source = source
+        self.value_resolver = value_resolver
+        self.dispatch = _operator_dispatch(operator)
+        self.cast_cache: Dict[Tuple[type, Any], Tuple[Any, ...] | None] = {}
+        self.summary = (
+            _format_summary(label, self.operator, value_resolver.constant)
+            if value_resolver.is_constant
+            else None
+        )
+
+    def evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        if ACTIVE_OBSERVERS:
+            return notify_call(CONDITION, self.label, self._evaluate, evaluation)
+        return self._evaluate(evaluation)
+
+    def _evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        comparison_value = self.value_resolver(evaluation)
+        variable = self.source(evaluation.defined_variables, evaluation.defined_actions)
+        result = self.compare(variable, comparison_value)
+        passed = result if isinstance(result, bool) else False
+        if not evaluation.build_trace:
+            return passed, None
+
+        summary = self.summary
+        if summary is None:
+            summary = _format_summary(self.label, self.operator, comparison_value)
+
+        return passed, {
+            "type": "condition",
+            "label": self.label,
+            "operator": self.operator,
+            "raw_operator": self.raw_operator,
+            "value": comparison_value,
+            "input": variable.value if isinstance(variable, BaseType) else variable,
+            "result": result,
+            "summary": summary,
+        }
+
+    def skipped_trace(self) -> TraceNode | None:
+        value = self.value_resolver.copy_constant()
+        return {
+            "type": "condition",
+            "label": self.label,
+            "operator": self.operator,
+            "raw_operator": self.raw_operator,
+            "value": value,
+            "input": None,
+            "result": SKIPPED,
+            "summary": _format_summary(self.label, self.operator, value),
+        }
+
+    def compare(self, variable: Any, comparison_value: Any) -> Any:
+        entry = self.dispatch.get(type(variable))
+        if entry is None:
+            return _do_operator_comparison(variable, self.raw_operator, comparison_value)
+
+        if entry.input_type == FIELD_NO_INPUT:
+            return entry.call(variable, ())
+        if comparison_value is None:
+            return None
+        if entry.comparison_type == FIELD_LIST:
+            return entry.call(variable, (comparison_value,))
+        if entry.casts_arguments and variable.value is None:
+            return False
+
+        if self.value_resolver.is_constant:
+            # Constant comparison values are cast once per wrapper type and backend.
+            key = (type(variable), getattr(variable, "backend", None))
+            try:
+                args = self.cast_cache[key]
+            except KeyError:
+                args = self.cast_cache[key] = entry.cast_arguments(
+                    variable, _comparison_arguments(comparison_value)
+                )
+        else:
+            args = entry.cast_arguments(variable, _comparison_arguments(comparison_value))
+        if args is None:
+            return False
+        return entry.function(variable, *args)
+
+
+class _RegexConditionNode(_ConditionNode):
+    """``matches_regex`` leaf with a precompiled pattern."""
+
+    def __init__(
+        self,
+        label: Any,
+        operator: str,
+        source: Resolver,
+        value_resolver: _ValueResolver,
+        pattern: str,
+    ) -> None:
+        super().__init__(label, operator, source, value_resolver)
+        self.pattern = pattern
+        self.regex = compile_regex(pattern)
+
+    def compare(self, variable: Any, comparison_value: Any) -> Any:
+        if type(variable) is not StringType or variable.value is None:
+            return super().compare(variable, comparison_value)
+        return bool(self.regex.search(variable.value))
+
+
+class _MembershipConditionNode(_ConditionNode):
+    """``is_in`` leaf whose constant list is tested against a precomputed frozenset."""
+
+    def __init__(
+        self,
+        label: Any,
+        operator: str,
+        source: Resolver,
+        value_resolver: _ValueResolver,
+        members: frozenset,
+    ) -> None:
+        super().__init__(label, operator, source, value_resolver)
+        self.members = members
+
+    def compare(self, variable: Any, comparison_value: Any) -> Any:
+        return super().compare(variable, self.members)
+
+
+class _TypedConditionNode(_ConditionNode):
+    """Leaf comparing a validated variable with a constant.
+
+    Values of the declared wrapper type go straight to the operator with
+    arguments cast once per numeric backend; anything else (missing values,
+    variables returning another type) takes the generic path.
+    """
+
+    def __init__(
+        self,
+        label: Any,
+        operator: str,
+        source: Resolver,
+        value_resolver: _ValueResolver,
+        type_class: type,
+    ) -> None:
+        super().__init__(label, operator, source, value_resolver)
+        self.type_class = type_class
+        self.entry = self.dispatch[type_class]
+        self.arguments: Dict[Any, Tuple[Any, ...] | None] = {}
+
+    def compare(self, variable: Any, comparison_value: Any) -> Any:
+        if type(variable) is not self.type_class or variable.value is None:
+            return super().compare(variable, comparison_value)
+        backend = getattr(variable, "backend", None)
+        try:
+            args = self.arguments[backend]
+        except KeyError:
+            args = self.arguments[backend] = self.entry.cast_arguments(
+                variable, _comparison_arguments(comparison_value)
+            )
+        if args is None:
+            return False
+        return self.entry.function(variable, *args)
+
+
+class _SharedNode(_Node):
+    """A node shared across rules whose result is memoized per evaluation."""
+
+    def __init__(self, node: _Node) -> None:
+        self.node = node
+
+    def evaluate(self, evaluation: _Evaluation) -> Tuple[bool, TraceNode | None]:
+        memo = evaluation.memo
+        if memo is None:
+            return self.node.evaluate(evaluation)
+
+        cached = memo.get(self)
+        if cached is not None and (cached[2] or not evaluation.build_trace):
+            passed, trace_node, _ = cached
+            return passed, trace_node if evaluation.build_trace else None
+
+        passed, trace_node = self.node.evaluate(evaluation)
+        memo[self] = (passed, trace_node, evaluation.build_trace)
+        return passed, trace_node
+
+    def skipped_trace(self) -> TraceNode | None:
+        return self.node.skipped_trace()
+
+
+_PLAN_VERSION = 1
+_DEFAULT_REPLAN_EVERY = 1000
+
+
+class _ChildStats:
+    """Pass counts and latency of a group's children (or a rule set's rules)."""
+
+    __slots__ = ("evaluations", "passes", "seconds", "replan_every", "ticks")
+
+    def __init__(self, size: int, replan_every: int) -> None:
+        self.evaluations = [0] * size
+        self.passes = [0] * size
+        self.seconds = [0.0] * size
+        self.replan_every = replan_every
+        self.ticks = 0
+
+    def record(self, index: int, passed: bool, elapsed: float) -> None:
+        self.evaluations[index] += 1
+        if passed is True:
+            self.passes[index] += 1
+        self.seconds[index] += elapsed
+
+    def tick(self) -> bool:
+        """Count one evaluation of the owner; return True when it is time to re-plan."""
+        self.ticks += 1
+        return self.ticks % self.replan_every == 0
+
+    def plan(self, deciding_result: bool) -> List[int]:
+        """Order children by expected cost per chance of deciding the outcome.
+
+        Under short-circuiting the expected cost of a sequence is minimized by
+        ranking each child by ``mean latency / P(child decides)``, the deciding
+        result being a failure for ``all`` and a pass for ``any``. Pass rates
+        are Laplace-smoothed and unobserved children get the mean latency.
+        """
+        observed = [
+            seconds / evaluations
+            for seconds, evaluations in zip(self.seconds, self.evaluations)
+            if evaluations
+        ]
+        default_latency = sum(observed) / len(observed) if observed else 1.0
+
+        def rank(index: int) -> Tuple[float, int]:
+            evaluations = self.evaluations[index]
+            latency = self.seconds[index] / evaluations if evaluations else default_latency
+            pass_rate = (self.passes[index] + 1) / (evaluations + 2)
+            deciding = pass_rate if deciding_result else 1 - pass_rate
+            return latency / deciding, index
+
+        return sorted(range(len(self.evaluations)), key=rank)
+
+    def export(self) -> List[List[float]]:
+        return [
+            [evaluations, passes, seconds]
+            for evaluations, passes, seconds in zip(self.evaluations, self.passes, self.seconds)
+        ]
+
+    def load(self, entries: Sequence[Sequence[float]]) -> None:
+        for index, (evaluations, passes, seconds) in enumerate(entries):
+            self.evaluations[index] = int(evaluations)
+            self.passes[index] = int(passes)
+            self.seconds[index] = float(seconds)
+
+
+def _non_trivial_order(order: Sequence[int] | None) -> Tuple[int, ...] | None:
+    if order is None or list(order) == sorted(order):
+        return None
+    return tuple(order)
+
+
+def _content_digest(value: Any) -> str:
+    return hashlib.sha1(_condition_key(value).encode("utf-8")).hexdigest()[:16]
+
+
+class _CostModel:
+    """Relative evaluation cost estimates for condition blocks."""
+
+    VARIABLE_COST = 1
+    ACTION_COST = 10
+    VALUE_CONDITION_COST = 20
+
+    def __init__(self, actions_class: Any, variables_class: Any) -> None:
+        self.actions_class = actions_class
+        self.variables_class = variables_class
+
+    def block_cost(self, condition_block: Condition) -> float:
+        if not isinstance(condition_block, dict) or not condition_block:
+            return 0
+        for group_type in ("all", "any"):
+            if group_type in condition_block:
+                return sum(self.block_cost(child) for child in condition_block[group_type] or [])
+        return self.leaf_cost(condition_block)
+
+    def leaf_cost(self, condition: Condition) -> float:
+        if "expression" in condition:
+            cost = self.expression_cost(compile_math_expression(condition["expression"]).tree)
+        elif "function" in condition:
+            cost = self.action_cost(condition["function"], condition.get("params"))
+        elif "name" in condition:
+            cost = self.variable_cost(condition["name"])
+        else:
+            cost = 0
+
+        cost += self.reference_cost(condition.get("value"))
+        value_conditions = condition.get("value_condition")
+        if value_conditions:
+            cost += self.VALUE_CONDITION_COST
+            for branch in value_conditions:
+                cost += self.block_cost(branch.get("conditions") or {})
+                cost += self.reference_cost(branch.get("value"))
+                for action in _normalize_actions(branch.get("actions")):
+                    cost += self.action_cost(
+                        action.get("function") or action.get("name"), action.get("params")
+                    )
+        return cost
+
+    def expression_cost(self, node: Any) -> float:
+        if isinstance(node, dict):
+            return self.action_cost(node["function"]) + sum(
+                self.expression_cost(argument) for argument in node["args"]
+            )
+        if isinstance(node, str):
+            return self.variable_cost(node)
+        return 0
+
+    def action_cost(self, name: str | None, params: Any = None) -> float:
+        spec = get_action_spec(self.actions_class, name) if name else None
+        cost = self.ACTION_COST if spec is None or spec.cost is None else spec.cost
+        return cost + self.reference_cost(params)
+
+    def variable_cost(self, name: str) -> float:
+        hint = getattr(getattr(self.variables_class, name, None), "cost", None)
+        return self.VARIABLE_COST if hint is None else hint
+
+    def reference_cost(self, value: Any) -> float:
+        if _is_variable_reference(value):
+            return self.variable_cost(value["var"])
+        if isinstance(value, list):
+            return sum(self.reference_cost(item) for item in value)
+        if isinstance(value, dict) and not _is_literal_wrapper(value):
+            return sum(self.reference_cost(item) for item in value.values())
+        return 0
+
+
+def _constant_regex(condition: Condition) -> str | None:
+    """Return the pattern of a ``name`` leaf testing ``matches_regex`` against a constant."""
+    if condition.get("operator") != "matches_regex" or "name" not in condition:
+        return None
+    if "expression" in condition or "function" in condition or condition.get("value_condition"):
+        return None
+    value = condition.get("value")
+    if isinstance(value, list) and len(value) == 1:
+        value = value[0]
+    value = value.value if isinstance(value, StringType) else value
+    return value if isinstance(value, str) else None
+
+
+def _condition_key(condition_block: Condition) -> str:
+    """Return a canonical key identifying structurally identical condition blocks."""
+    return json.dumps(condition_block, sort_keys=True, default=repr)
+
+
+def _operator_dispatch(operator: str) -> Dict[type, OperatorEntry]:
+    """Pre-resolve ``operator`` for the built-in wrapper types that define it."""
+    dispatch: Dict[type, OperatorEntry] = {}
+    for type_class in _OPERATOR_TYPES:
+        entry = get_operator_table(type_class).get(operator)
+        if entry is not None:
+            dispatch[type_class] = entry
+    return dispatch
+
+
+def _comparison_arguments(comparison_value: Any) -> Sequence[Any]:
+    return comparison_value if isinstance(comparison_value, list) else (comparison_value,)
+
+
+def _variable_source(name: str) -> Resolver:
+    def source(defined_variables: Any, defined_actions: Any) -> Any:
+        return _get_variable_value(defined_variables, name)
+
+    return source
+
+
+def _value_condition_resolver(branches: Sequence[Tuple[_Node | None, Any]]) -> ValueResolver:
+    def resolve(evaluation: _Evaluation) -> Any:
+        branch_evaluation = evaluation.without_trace()
+        for node, outcome in branches:
+            if node is not None:
+                matched, _ = node.evaluate(branch_evaluation)
+                if not matched:
+                    continue
+            if isinstance(outcome, _ValueResolver):
+                if outcome.is_constant:
+                    return outcome.constant
+                return outcome.resolver(evaluation)
+            result = None
+            for action in outcome:
+                result = action(evaluation.defined_variables, evaluation.defined_actions)
+            return result
+        raise RuntimeError("No matching value_condition branch")
+
+    return resolve
+
+
+def _action_argument_shape(raw_params: Any) -> Tuple[int, Tuple[str, ...]]:
+    """Return the positional count and keyword names ``_build_action_arguments`` yields."""
+    if raw_params is None:
+        return 0, ()
+    if isinstance(raw_params, list):
+        return len(raw_params), ()
+    if isinstance(raw_params, dict):
+        if _is_variable_reference(raw_params) or _is_literal_wrapper(raw_params):
+            return 1, ()
+        return 0, tuple(raw_params)
+    return 1, ()
+
+
+def _unwrap(value: Any) -> Any:
+    return value.value if isinstance(value, BaseType) else value
+
+
+def _class_name(source: Any) -> str:
+    return source.__name__ if inspect.isclass(source) else source.__class__.__name__
+
+
+__all__ = [
+    "CompiledRule",
+    "CompiledRuleSet",
+    "compile_rules",
+]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable
+
+from .observers import ACTIVE_OBSERVERS, VARIABLE, notify_call
+from .operators import BaseType
+
+
+class EvaluationContext:
+    """Variables context that memoizes computed variable values.
+
+    Wraps a variables object (usually a :class:`BaseVariables` instance) and
+    calls each computed variable at most once, however many conditions,
+    expressions, action parameters and rules reference it. ``run_all`` wraps
+    plain variables objects in a fresh context for every call; pass an
+    ``EvaluationContext`` explicitly to keep cached values across calls for the
+    same facts, and call :meth:`invalidate` when they change.
+
+    Variables declared with ``cache=False`` are computed on every lookup, and
+    plain (non-callable) attributes and dict entries are always read live.
+    Results of ``pure`` actions are memoized on the context as well, keyed on
+    the action and its resolved arguments.
+    """
+
+    def __init__(self, defined_variables: Any) -> None:
+        if isinstance(defined_variables, EvaluationContext):
+            defined_variables = defined_variables.defined_variables
+        self.defined_variables = defined_variables
+        self._values: Dict[str, Any] = {}
+        self._results: Dict[Hashable, Any] = {}
+        # Coroutine action results keyed like ``engine.action_key``; only set
+        # while evaluating with :mod:`business_rules_genai.aio`.
+        self.awaited_results: Dict[Hashable, AwaitedResult] | None = None
+
+    def lookup(self, name: str, default: Any) -> Any:
+        """Return the value of variable ``name`` or ``default`` when it is missing."""
+        if name in self._values:
+            value = self._values[name]
+            if type(value) is AwaitedResult:
+                return value.result()
+            return value
+
+        defined_variables = self.defined_variables
+        if isinstance(defined_variables, dict):
+            return defined_variables[name] if name in defined_variables else default
+        if not hasattr(defined_variables, name):
+            return default
+
+        value = getattr(defined_variables, name)
+        if not callable(value):
+            return value
+        result = notify_call(VARIABLE, name, value) if ACTIVE_OBSERVERS else value()
+        if getattr(value, "cacheable", True):
+            self._values[name] = result
+        return result
+
+    def prime(self, name: str, value: Any) -> None:
+        """Store an already computed value for variable ``name``.
+
+        ``value`` may be an :class:`AwaitedResult`, whose error is raised when
+        the variable is looked up.
+        """
+        self._values[name] = value
+
+    def memoize(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """Return the result memoized under ``key``, computing it with ``factory`` once."""
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return factory()
+        result = self._results[key] = factory()
+        return result
+
+    def invalidate(self, *names: str) -> None:
+        """Forget cached values for ``names``, or everything when none are given.
+
+        Memoized action results stay valid when single variables change since
+        they are keyed on resolved arguments; they are dropped only by a full
+        invalidation.
+        """
+        if not names:
+            self._values.clear()
+            self._results.clear()
+            return
+        for name in names:
+            self._values.pop(name, None)
+
+    def is_cached(self, name: str) -> bool:
+        return name in self._values
+
+    def cached_names(self) -> frozenset:
+        return frozenset(self._values)
+
+
+class AwaitedResult:
+    """Outcome of an awaited variable or action: a value or the error it raised."""
+
+    __slots__ = ("value", "error")
+
+    def __init__(self, value: Any = None, error: BaseException | None = None) -> None:
+        self.value = value
+        self.error = error
+
+    def result(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def evaluation_context(defined_variables: Any) -> EvaluationContext:
+    """Wrap ``defined_variables`` in an :class:`EvaluationContext` unless it already is one."""
+    if isinstance(defined_variables, EvaluationContext):
+        return defined_variables
+    return EvaluationContext(defined_variables)
+
+
+def memo_key(value: Any) -> Hashable:
+    """Return a hashable key telling apart values that compare equal but differ in type or scale."""
+    if isinstance(value, BaseType):
+        return (type(value), memo_key(value.value))
+    if isinstance(value, Decimal):
+        return (Decimal, value.as_tuple())
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(memo_key(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, tuple((key, memo_key(item)) for key, item in value.items()))
+    return (type(value), value)
+
+
+__all__ = ["AwaitedResult", "EvaluationContext", "evaluation_context", "memo_key"]
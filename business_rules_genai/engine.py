@@ -4,16 +4,32 @@ import ast
 import inspect
 import logging
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union
 
+from .actions import get_action_registry
+from .context import EvaluationContext, evaluation_context, memo_key
 from .fields import FIELD_LIST, FIELD_NO_INPUT
+from .observers import (
+    ACTION,
+    ACTIVE_OBSERVERS,
+    CONDITION,
+    RULE,
+    VARIABLE,
+    EvaluationObserver,
+    add_observer,
+    notify_call,
+    observing,
+    remove_observer,
+)
 from .operators import (
     BaseType,
     BooleanType,
     COMPARISON_OPERATOR_MAP,
     NumericType,
     StringType,
+    get_operator_table,
 )
+from .utils import CacheInfo, LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +39,13 @@ TraceNode = Dict[str, Any]
 Rule = Dict[str, Any]
 RunResult = Tuple[bool, Union[List[TraceNode], Any]]
 MISSING = object()
+DISPLAY_ONLY = object()
+SKIPPED = "skipped"
+
+TRACE_FULL = "full"
+TRACE_RESULT = "result"
+TRACE_NONE = "none"
+TRACE_LEVELS = (TRACE_FULL, TRACE_RESULT, TRACE_NONE)
 
 
 def run_all(
@@ -32,17 +55,34 @@ def run_all(
     *,
     stop_on_first_trigger: bool = False,
     return_action_results: bool = False,
+    short_circuit: bool = False,
+    trace: str = TRACE_FULL,
 ) -> RunResult:
-    """Evaluate a list of rules against the provided context."""
+    """Evaluate a list of rules against the provided context.
+
+    With ``short_circuit`` enabled, ``all`` / ``any`` groups stop evaluating
+    children once their outcome is decided; the remaining children appear in
+    the trace with a ``"skipped"`` result.
+
+    ``trace`` selects how much trace output is built: ``"full"`` (default)
+    returns the nested condition trace, ``"result"`` only the top-level
+    pass/fail node of each rule, and ``"none"`` skips tracing entirely.
+
+    Computed variables are evaluated at most once per call; see
+    :class:`business_rules_genai.context.EvaluationContext`.
+    """
     aggregated_trace: List[TraceNode] = []
     rule_triggered = False
 
+    defined_variables = evaluation_context(defined_variables)
     for rule in rule_list:
         triggered, details = run(
             rule,
             defined_variables,
             defined_actions,
             return_action_results=return_action_results,
+            short_circuit=short_circuit,
+            trace=trace,
         )
         if return_action_results and triggered:
             return True, details
@@ -66,32 +106,91 @@ def run(
     defined_actions: Any,
     *,
     return_action_results: bool = False,
+    short_circuit: bool = False,
+    trace: str = TRACE_FULL,
 ) -> RunResult:
     """Evaluate a single rule."""
+    defined_variables = evaluation_context(defined_variables)
+    if ACTIVE_OBSERVERS:
+        return notify_call(
+            RULE,
+            rule,
+            _run_rule,
+            rule,
+            defined_variables,
+            defined_actions,
+            return_action_results,
+            short_circuit,
+            trace,
+        )
+    return _run_rule(
+        rule, defined_variables, defined_actions, return_action_results, short_circuit, trace
+    )
+
+
+def _run_rule(
+    rule: Rule,
+    defined_variables: Any,
+    defined_actions: Any,
+    return_action_results: bool,
+    short_circuit: bool,
+    trace: str,
+) -> RunResult:
     conditions = rule.get("conditions") or {}
     actions = _normalize_actions(rule.get("actions"))
 
-    triggered, trace = check_conditions_recursively(
+    triggered, trace_nodes = check_conditions_recursively(
         conditions,
         defined_variables,
         defined_actions,
+        short_circuit=short_circuit,
+        trace=trace,
     )
 
     if triggered:
         action_result = do_actions(actions, defined_variables, defined_actions)
         if return_action_results:
             return True, action_result
-        return True, trace
+        return True, trace_nodes
 
-    return False, trace
+    return False, trace_nodes
 
 
 def check_condition(
     condition: Condition,
     defined_variables: Any,
     defined_actions: Any,
+    *,
+    short_circuit: bool = False,
 ) -> Dict[str, Any]:
     """Evaluate a single condition leaf."""
+    variable_value, comparison_value, condition_result = _evaluate_condition(
+        condition, defined_variables, defined_actions, short_circuit
+    )
+    label = _condition_label(condition)
+
+    if condition_result is DISPLAY_ONLY:
+        return {"label": label, "threshold": comparison_value}
+
+    return {
+        "condition_result": condition_result,
+        "label": label,
+        "operator": condition.get("operator"),
+        "value": comparison_value,
+        "function_result": variable_value,
+    }
+
+
+def _evaluate_condition(
+    condition: Condition,
+    defined_variables: Any,
+    defined_actions: Any,
+    short_circuit: bool = False,
+) -> Tuple[Any, Any, Any]:
+    """Return the input value, comparison value, and result of a condition leaf.
+
+    Labelled display leaves report ``DISPLAY_ONLY`` as their result.
+    """
     operator = condition.get("operator")
     comparison_value = condition.get("value")
     value_condition_list = condition.get("value_condition")
@@ -99,45 +198,35 @@ def check_condition(
 
     if value_condition_list:
         comparison_value = _resolve_value_condition(
-            value_condition_list, defined_variables, defined_actions
+            value_condition_list, defined_variables, defined_actions, short_circuit
         )
     else:
         comparison_value = _resolve_rule_value(comparison_value, defined_variables)
 
-    label = condition.get("label")
-
     if "expression" in condition:
-        expression = condition["expression"]
-        structured_expression = parse_math_expression(expression)
-        variable = execute_math_expression(
-            structured_expression, defined_variables, defined_actions
+        variable = compile_math_expression(condition["expression"])(
+            defined_variables, defined_actions
         )
-        label = label or expression
     elif "function" in condition:
-        function_name = condition["function"]
         variable = do_actions(
             [
                 {
-                    "function": function_name,
+                    "function": condition["function"],
                     "params": condition.get("params", []),
                 }
             ],
             defined_variables,
             defined_actions,
         )
-        params = condition.get("params")
-        params_str = _format_action_params(params)
-        label = label or f"{function_name}({params_str})"
     elif "name" in condition:
         variable = _get_variable_value(defined_variables, condition["name"])
-        label = label or condition["name"]
-    elif label:
+    elif condition.get("label"):
         comparison_value = (
             comparison_value.value
             if isinstance(comparison_value, BaseType)
             else comparison_value
         )
-        return {"label": label, "threshold": comparison_value}
+        return None, comparison_value, DISPLAY_ONLY
     else:
         raise ValueError("Condition must specify 'name', 'function', 'expression', or 'label'.")
 
@@ -149,13 +238,11 @@ def check_condition(
     if operator is None:
         raise ValueError("Condition is missing an 'operator'.")
 
-    return {
-        "condition_result": _do_operator_comparison(variable, operator, comparison_value),
-        "label": label,
-        "operator": operator,
-        "value": comparison_value,
-        "function_result": variable_value,
-    }
+    return (
+        variable_value,
+        comparison_value,
+        _do_operator_comparison(variable, operator, comparison_value),
+    )
 
 
 def parse_math_expression(expression: str) -> Dict[str, Any]:
@@ -212,6 +299,96 @@ def execute_math_expression(
     return ast_dict
 
 
+class CompiledExpression:
+    """A math expression compiled into a direct callable.
+
+    Calling the instance with ``(defined_variables, defined_actions)`` yields
+    the same value as ``execute_math_expression`` on the parsed tree, without
+    routing each operator through ``do_actions``.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tree = parse_math_expression(expression)
+        self._evaluate = _compile_expression_node(self.tree)
+
+    def __call__(self, defined_variables: Any, defined_actions: Any) -> Any:
+        return self._evaluate(defined_variables, defined_actions)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expression!r})"
+
+
+_EXPRESSION_CACHE = LRUCache(maxsize=1024)
+
+
+def compile_math_expression(expression: str) -> CompiledExpression:
+    """Return the compiled form of ``expression``, cached in a bounded LRU."""
+    return _EXPRESSION_CACHE.get_or_create(expression, CompiledExpression)
+
+
+def expression_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the compiled expression cache."""
+    return _EXPRESSION_CACHE.info()
+
+
+def set_expression_cache_size(maxsize: int) -> None:
+    """Bound the compiled expression cache to ``maxsize`` entries."""
+    _EXPRESSION_CACHE.resize(maxsize)
+
+
+def clear_expression_cache() -> None:
+    """Drop every cached expression and reset the statistics."""
+    _EXPRESSION_CACHE.clear()
+
+
+def _compile_expression_node(node: Any) -> Callable[[Any, Any], Any]:
+    if isinstance(node, dict):
+        function_name = node["function"]
+        operands = [_compile_expression_node(arg) for arg in node["args"]]
+
+        def evaluate_operator(defined_variables: Any, defined_actions: Any) -> Any:
+            args = [operand(defined_variables, defined_actions) for operand in operands]
+            if any(arg is None for arg in args):
+                return None
+            method = getattr(defined_actions, function_name, None)
+            if method is None:
+                raise AssertionError(
+                    f"Action {function_name} is not defined in class "
+                    f"{defined_actions.__class__.__name__}"
+                )
+            spec = get_action_registry(defined_actions).get(function_name)
+            try:
+                if spec is None:
+                    inspect.signature(method).bind(*args)
+                else:
+                    spec.check_arguments(len(args))
+            except TypeError as exc:
+                raise AssertionError(
+                    f"Action {function_name} parameter mismatch: {exc}"
+                ) from exc
+            return call_action(
+                method, args, {}, defined_variables, pure=spec is not None and spec.pure
+            )
+
+        return evaluate_operator
+
+    if isinstance(node, str):
+
+        def evaluate_variable(defined_variables: Any, defined_actions: Any) -> Any:
+            value = _lookup_variable_value(defined_variables, node)
+            if value is MISSING or value is None:
+                return None
+            wrapped_value = _wrap_value(value)
+            if isinstance(wrapped_value, BaseType):
+                return wrapped_value if wrapped_value.value is not None else None
+            return wrapped_value
+
+        return evaluate_variable
+
+    return lambda defined_variables, defined_actions: node
+
+
 def do_actions(
     actions: Sequence[Action],
     defined_variables: Any,
@@ -219,60 +396,152 @@ def do_actions(
 ) -> Any:
     """Execute a sequence of actions and return the final result."""
     result: Any = None
+    registry = get_action_registry(defined_actions)
 
     for action in _normalize_actions(actions):
-        method_name = action.get("function") or action.get("name")
-        if not method_name:
-            raise AssertionError("Action is missing a 'function' or 'name'.")
+        method, processed_args, processed_kwargs, spec = prepare_action(
+            action, defined_variables, defined_actions, registry
+        )
+        result = call_action(
+            method,
+            processed_args,
+            processed_kwargs,
+            defined_variables,
+            pure=spec is not None and spec.pure,
+        )
 
-        method = getattr(defined_actions, method_name, None)
-        if method is None:
-            raise AssertionError(
-                f"Action {method_name} is not defined in class {defined_actions.__class__.__name__}"
-            )
+    return result
 
-        processed_args, processed_kwargs = _build_action_arguments(
-            action.get("params"),
-            defined_variables,
+
+def prepare_action(
+    action: Action,
+    defined_variables: Any,
+    defined_actions: Any,
+    registry: Dict[str, Any] | None = None,
+) -> Tuple[Callable[..., Any], List[Any], Dict[str, Any], Any]:
+    """Resolve an action's method and arguments and validate the call shape.
+
+    Returns ``(method, args, kwargs, spec)`` where ``spec`` is the registered
+    :class:`~business_rules_genai.actions.ActionSpec` or ``None``.
+    """
+    method_name = action.get("function") or action.get("name")
+    if not method_name:
+        raise AssertionError("Action is missing a 'function' or 'name'.")
+
+    method = getattr(defined_actions, method_name, None)
+    if method is None:
+        raise AssertionError(
+            f"Action {method_name} is not defined in class {defined_actions.__class__.__name__}"
         )
 
-        try:
+    processed_args, processed_kwargs = _build_action_arguments(
+        action.get("params"),
+        defined_variables,
+    )
+
+    if registry is None:
+        registry = get_action_registry(defined_actions)
+    spec = registry.get(method_name)
+    try:
+        if spec is None:
             inspect.signature(method).bind(*processed_args, **processed_kwargs)
-        except TypeError as exc:
-            raise AssertionError(
-                f"Action {method_name} parameter mismatch: {exc}"
-            ) from exc
+        else:
+            spec.check_arguments(len(processed_args), tuple(processed_kwargs))
+    except TypeError as exc:
+        raise AssertionError(
+            f"Action {method_name} parameter mismatch: {exc}"
+        ) from exc
+
+    logger.debug(
+        "Executing action '%s' with args=%s kwargs=%s",
+        method_name,
+        processed_args,
+        processed_kwargs,
+    )
+    return method, processed_args, processed_kwargs, spec
 
-        logger.debug(
-            "Executing action '%s' with args=%s kwargs=%s",
-            method_name,
-            processed_args,
-            processed_kwargs,
-        )
 
-        try:
-            result = method(*processed_args, **processed_kwargs)
-        except Exception as exc:  # pragma: no cover - defensive
-            raise RuntimeError(f"'{method_name}': {exc}") from exc
+def call_action(
+    method: Callable[..., Any],
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    defined_variables: Any,
+    *,
+    pure: bool = False,
+) -> Any:
+    """Invoke an action method, memoizing pure actions on the evaluation context.
+
+    Under :mod:`business_rules_genai.aio`, coroutine actions are served from the
+    results awaited ahead of evaluation.
+    """
+    if isinstance(defined_variables, EvaluationContext):
+        awaited = defined_variables.awaited_results
+        if awaited is not None and inspect.iscoroutinefunction(method):
+            key = action_key(method, args, kwargs)
+            if key not in awaited:
+                raise RuntimeError(
+                    f"'{method.__name__}': asynchronous action was not resolved ahead of "
+                    "evaluation"
+                )
+            try:
+                return awaited[key].result()
+            except Exception as exc:
+                raise RuntimeError(f"'{method.__name__}': {exc}") from exc
+        if pure:
+            return defined_variables.memoize(
+                action_key(method, args, kwargs), lambda: _invoke_action(method, args, kwargs)
+            )
+    return _invoke_action(method, args, kwargs)
 
-    return result
+
+def action_key(method: Callable[..., Any], args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+    """Return the memoization key of a call to ``method`` with resolved arguments."""
+    return (
+        type(getattr(method, "__self__", None)),
+        method.__name__,
+        memo_key(tuple(args)),
+        memo_key(kwargs),
+    )
+
+
+def _invoke_action(method: Callable[..., Any], args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+    try:
+        if ACTIVE_OBSERVERS:
+            return notify_call(ACTION, method.__name__, lambda: method(*args, **kwargs))
+        return method(*args, **kwargs)
+    except Exception as exc:
+        raise RuntimeError(f"'{method.__name__}': {exc}") from exc
 
 
 def check_conditions_recursively(
     conditions: Condition,
     defined_variables: Any,
     defined_actions: Any,
+    *,
+    short_circuit: bool = False,
+    trace: str = TRACE_FULL,
 ) -> Tuple[bool, List[TraceNode]]:
     """Recursively evaluate nested rule conditions and provide trace output."""
-    passed, trace = _evaluate_condition_block(conditions, defined_variables, defined_actions)
-    trace_list = [trace] if trace else []
-    return passed, trace_list
+    if trace not in TRACE_LEVELS:
+        raise ValueError(f"Unknown trace level: {trace!r}")
+
+    passed, trace_node = _evaluate_condition_block(
+        conditions,
+        defined_variables,
+        defined_actions,
+        short_circuit,
+        trace == TRACE_FULL,
+    )
+    if trace == TRACE_RESULT and conditions:
+        trace_node = {"type": _block_type(conditions), "result": passed}
+    return passed, [trace_node] if trace_node else []
 
 
 def _resolve_value_condition(
     value_conditions: Iterable[Condition],
     defined_variables: Any,
     defined_actions: Any,
+    short_circuit: bool = False,
 ) -> Any:
     """Resolve a value based on the first matching condition branch."""
     for branch in value_conditions:
@@ -280,7 +549,11 @@ def _resolve_value_condition(
         matched = True
         if branch_conditions:
             matched, _ = check_conditions_recursively(
-                branch_conditions, defined_variables, defined_actions
+                branch_conditions,
+                defined_variables,
+                defined_actions,
+                short_circuit=short_circuit,
+                trace=TRACE_NONE,
             )
         if matched:
             if "value" in branch:
@@ -297,8 +570,14 @@ def _evaluate_condition_block(
     condition_block: Condition,
     defined_variables: Any,
     defined_actions: Any,
+    short_circuit: bool = False,
+    build_trace: bool = True,
 ) -> Tuple[bool, TraceNode | None]:
-    """Evaluate a branch of the condition tree."""
+    """Evaluate a branch of the condition tree.
+
+    When ``build_trace`` is false no trace nodes are built and ``None`` is
+    returned in their place.
+    """
     if not condition_block:
         return True, None
 
@@ -311,13 +590,21 @@ def _evaluate_condition_block(
         group_passed = True
 
         for child in children:
-            child_passed, child_node = _evaluate_condition_block(
-                child, defined_variables, defined_actions
-            )
+            if short_circuit and not group_passed:
+                if not build_trace:
+                    break
+                child_node = _skipped_trace(child)
+            else:
+                child_passed, child_node = _evaluate_condition_block(
+                    child, defined_variables, defined_actions, short_circuit, build_trace
+                )
+                if not child_passed:
+                    group_passed = False
             if child_node is not None:
                 child_nodes.append(child_node)
-            if not child_passed:
-                group_passed = False
+
+        if not build_trace:
+            return group_passed, None
 
         return group_passed, {
             "type": "all",
@@ -334,13 +621,21 @@ def _evaluate_condition_block(
         group_passed = False
 
         for child in children:
-            child_passed, child_node = _evaluate_condition_block(
-                child, defined_variables, defined_actions
-            )
+            if short_circuit and group_passed:
+                if not build_trace:
+                    break
+                child_node = _skipped_trace(child)
+            else:
+                child_passed, child_node = _evaluate_condition_block(
+                    child, defined_variables, defined_actions, short_circuit, build_trace
+                )
+                if child_passed:
+                    group_passed = True
             if child_node is not None:
                 child_nodes.append(child_node)
-            if child_passed:
-                group_passed = True
+
+        if not build_trace:
+            return group_passed, None
 
         return group_passed, {
             "type": "any",
@@ -348,25 +643,49 @@ def _evaluate_condition_block(
             "children": child_nodes,
         }
 
-    condition_details = check_condition(condition_block, defined_variables, defined_actions)
+    if ACTIVE_OBSERVERS:
+        return notify_call(
+            CONDITION,
+            _condition_label(condition_block),
+            _evaluate_leaf,
+            condition_block,
+            defined_variables,
+            defined_actions,
+            short_circuit,
+            build_trace,
+        )
+    return _evaluate_leaf(
+        condition_block, defined_variables, defined_actions, short_circuit, build_trace
+    )
+
 
-    if "condition_result" not in condition_details:
+def _evaluate_leaf(
+    condition_block: Condition,
+    defined_variables: Any,
+    defined_actions: Any,
+    short_circuit: bool,
+    build_trace: bool,
+) -> Tuple[bool, TraceNode | None]:
+    variable_value, value, condition_result = _evaluate_condition(
+        condition_block, defined_variables, defined_actions, short_circuit
+    )
+
+    if condition_result is DISPLAY_ONLY:
+        if not build_trace:
+            return True, None
         return True, {
             "type": "display",
-            "label": condition_details.get("label"),
-            "threshold": condition_details.get("threshold"),
+            "label": _condition_label(condition_block),
+            "threshold": value,
         }
 
-    operator_token = condition_details.get("operator")
+    passed = condition_result if isinstance(condition_result, bool) else False
+    if not build_trace:
+        return passed, None
+
+    operator_token = condition_block.get("operator")
     operator = COMPARISON_OPERATOR_MAP.get(operator_token, operator_token)
-    label = condition_details.get("label")
-    value = condition_details.get("value")
-    display_value = "" if value is None else value
-    summary = " ".join(
-        str(piece)
-        for piece in (label, operator, display_value)
-        if piece not in (None, "")
-    ).strip()
+    label = _condition_label(condition_block)
 
     trace: TraceNode = {
         "type": "condition",
@@ -374,16 +693,88 @@ def _evaluate_condition_block(
         "operator": operator,
         "raw_operator": operator_token,
         "value": value,
-        "input": condition_details.get("function_result"),
-        "result": condition_details.get("condition_result"),
-        "summary": summary,
+        "input": variable_value,
+        "result": condition_result,
+        "summary": _format_summary(label, operator, value),
     }
-
-    condition_result = condition_details.get("condition_result")
-    passed = condition_result if isinstance(condition_result, bool) else False
     return passed, trace
 
 
+def _block_type(condition_block: Condition) -> str:
+    """Return the trace ``type`` of a non-empty condition block."""
+    for group_type in ("all", "any"):
+        if group_type in condition_block:
+            return group_type
+    if any(key in condition_block for key in ("expression", "function", "name")):
+        return "condition"
+    return "display"
+
+
+def _skipped_trace(condition_block: Condition) -> TraceNode | None:
+    """Describe a branch that short-circuit evaluation did not evaluate.
+
+    The node mirrors the shape an evaluated branch would produce, using only
+    what is known statically, with ``"skipped"`` as its result.
+    """
+    if not condition_block:
+        return None
+
+    for group_type in ("all", "any"):
+        if group_type in condition_block:
+            children = condition_block[group_type]
+            child_nodes = [_skipped_trace(child) for child in children or []]
+            return {
+                "type": group_type,
+                "result": SKIPPED,
+                "children": [node for node in child_nodes if node is not None],
+            }
+
+    label = _condition_label(condition_block)
+    value = None
+    if not condition_block.get("value_condition") and not _contains_variable_reference(
+        condition_block.get("value")
+    ):
+        value = _resolve_rule_value(condition_block.get("value"), {})
+        value = value.value if isinstance(value, BaseType) else value
+
+    if _block_type(condition_block) == "display":
+        return {"type": "display", "label": label, "threshold": value, "result": SKIPPED}
+
+    operator_token = condition_block.get("operator")
+    operator = COMPARISON_OPERATOR_MAP.get(operator_token, operator_token)
+    return {
+        "type": "condition",
+        "label": label,
+        "operator": operator,
+        "raw_operator": operator_token,
+        "value": value,
+        "input": None,
+        "result": SKIPPED,
+        "summary": _format_summary(label, operator, value),
+    }
+
+
+def _condition_label(condition: Condition) -> Any:
+    """Return the trace label ``check_condition`` would assign to a leaf."""
+    label = condition.get("label")
+    if label:
+        return label
+    if "expression" in condition:
+        return condition["expression"]
+    if "function" in condition:
+        return f"{condition['function']}({_format_action_params(condition.get('params'))})"
+    return condition.get("name")
+
+
+def _format_summary(label: Any, operator: Any, value: Any) -> str:
+    display_value = "" if value is None else value
+    return " ".join(
+        str(piece)
+        for piece in (label, operator, display_value)
+        if piece not in (None, "")
+    ).strip()
+
+
 def _resolve_action_param(param: Any, defined_variables: Any) -> Any:
     """Resolve action parameters, performing variable substitution when possible."""
     if _is_variable_reference(param):
@@ -443,12 +834,18 @@ def _get_variable_value(defined_variables: Any, name: str) -> BaseType | None:
 def _lookup_variable_value(defined_variables: Any, name: str) -> Any:
     if isinstance(defined_variables, dict):
         return defined_variables[name] if name in defined_variables else MISSING
+    if isinstance(defined_variables, EvaluationContext):
+        return defined_variables.lookup(name, MISSING)
 
     if not hasattr(defined_variables, name):
         return MISSING
 
     value = getattr(defined_variables, name)
-    return value() if callable(value) else value
+    if not callable(value):
+        return value
+    if ACTIVE_OBSERVERS:
+        return notify_call(VARIABLE, name, value)
+    return value()
 
 
 def _wrap_value(value: Any) -> Any:
@@ -471,6 +868,18 @@ def _is_literal_wrapper(value: Any) -> bool:
     return isinstance(value, dict) and set(value.keys()) == {"literal"}
 
 
+def _contains_variable_reference(value: Any) -> bool:
+    if _is_variable_reference(value):
+        return True
+    if _is_literal_wrapper(value):
+        return False
+    if isinstance(value, list):
+        return any(_contains_variable_reference(item) for item in value)
+    if isinstance(value, dict):
+        return any(_contains_variable_reference(item) for item in value.values())
+    return False
+
+
 def _resolve_rule_value(value: Any, defined_variables: Any) -> Any:
     if _is_variable_reference(value):
         variable_name = value["var"]
@@ -481,6 +890,10 @@ def _resolve_rule_value(value: Any, defined_variables: Any) -> Any:
     if _is_literal_wrapper(value):
         return value["literal"]
     if isinstance(value, list):
+        if not any(isinstance(item, (dict, list)) for item in value):
+            # Flat lists of literals (e.g. ``is_in`` values) only need a shallow
+            # copy, which keeps the rule's own list out of traces and actions.
+            return list(value)
         return [_resolve_rule_value(item, defined_variables) for item in value]
     if isinstance(value, dict):
         return {
@@ -533,28 +946,33 @@ def _do_operator_comparison(
                 f"Operator {operator_name} is not available for type {type(operator_type).__name__}"
             )
 
-    method = getattr(operator_type, operator_name, None)
-    if method is None:
-        raise AssertionError(
-            f"Operator {operator_name} does not exist for type {operator_type.__class__.__name__}"
-        )
-
-    if getattr(method, "input_type", None) == FIELD_NO_INPUT:
-        return method()
-
-    if comparison_value is None:
-        return None
-
-    if isinstance(comparison_value, BaseType):
-        comparison_value = comparison_value.value
-
-    if getattr(method, "comparison_type", None) == FIELD_LIST:
-        return method(comparison_value)
+    entry = get_operator_table(type(operator_type)).get(operator_name)
+    if entry is not None:
+        input_type, comparison_type = entry.input_type, entry.comparison_type
+    else:
+        method = getattr(operator_type, operator_name, None)
+        if method is None:
+            raise AssertionError(
+                f"Operator {operator_name} does not exist for type {operator_type.__class__.__name__}"
+            )
+        input_type = getattr(method, "input_type", None)
+        comparison_type = getattr(method, "comparison_type", None)
 
-    if isinstance(comparison_value, list):
-        return method(*comparison_value)
+    if input_type == FIELD_NO_INPUT:
+        args: Sequence[Any] = ()
+    else:
+        if comparison_value is None:
+            return None
+        if isinstance(comparison_value, BaseType):
+            comparison_value = comparison_value.value
+        if comparison_type == FIELD_LIST or not isinstance(comparison_value, list):
+            args = (comparison_value,)
+        else:
+            args = comparison_value
 
-    return method(comparison_value)
+    if entry is not None:
+        return entry.call(operator_type, args)
+    return method(*args)
 
 
 OPERATOR_MAP = {
@@ -566,11 +984,26 @@ OPERATOR_MAP = {
 
 
 __all__ = [
+    "TRACE_FULL",
+    "TRACE_NONE",
+    "TRACE_RESULT",
     "run_all",
     "run",
     "check_conditions_recursively",
     "check_condition",
+    "CompiledExpression",
+    "clear_expression_cache",
+    "compile_math_expression",
+    "expression_cache_info",
     "parse_math_expression",
     "execute_math_expression",
+    "set_expression_cache_size",
+    "EvaluationObserver",
+    "action_key",
+    "add_observer",
+    "call_action",
     "do_actions",
+    "observing",
+    "prepare_action",
+    "remove_observer",
 ]
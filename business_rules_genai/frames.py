@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import warnings
+from typing import Any, Dict, Sequence, Tuple
+
+from .batch import (
+    BOOLEAN_COLUMN,
+    NUMERIC_COLUMN,
+    STRING_COLUMN,
+    BatchEvaluator,
+    typed_column,
+)
+from .engine import Condition, Rule, _contains_variable_reference
+from .operators import BaseType, compile_regex
+
+# StringType operator name (see ``COMPARISON_OPERATOR_MAP``) -> vectorized
+# kernel over a pandas string Series.
+_STRING_KERNELS = {
+    "equal_to": lambda series, other: series == other,
+    "equal_to_case_insensitive": lambda series, other: series.str.lower() == other.lower(),
+    "starts_with": lambda series, other: series.str.startswith(other),
+    "ends_with": lambda series, other: series.str.endswith(other),
+    "contains": lambda series, other: series.str.contains(other, regex=False),
+    "matches_regex": lambda series, other: _search_regex(series, other),
+}
+
+
+def evaluate_frame(
+    rule_list: Sequence[Rule],
+    frame: Any,
+    defined_actions: Any = None,
+    *,
+    trace: bool = False,
+) -> Tuple[Any, Any]:
+    """Evaluate rule conditions column-wise over a pandas DataFrame or Arrow table.
+
+    Each column is treated as a variable and null cells as missing values.
+    Returns ``(triggered, trace)`` where ``triggered`` holds one boolean column
+    per rule (named by rule index) and ``trace``, when requested, one boolean
+    column per condition leaf named by its path, e.g. ``rule[0].all[1]``.
+    Both come back as the same kind of table as ``frame``. Rule actions are not
+    executed; leaves without a vectorized kernel use the row-by-row engine.
+    """
+    pd = _require_pandas()
+    is_arrow = not isinstance(frame, pd.DataFrame)
+    data = frame.to_pandas() if is_arrow else frame
+
+    evaluator = FrameEvaluator(FrameColumns(data), defined_actions)
+    if trace:
+        evaluator.leaf_masks = {}
+    triggered = pd.DataFrame(
+        {
+            index: evaluator.evaluate_block(rule.get("conditions") or {}, f"rule[{index}]")
+            for index, rule in enumerate(rule_list)
+        },
+        index=data.index,
+        columns=range(len(rule_list)),
+    )
+    leaf_trace = (
+        pd.DataFrame(evaluator.leaf_masks, index=data.index, columns=list(evaluator.leaf_masks))
+        if trace
+        else None
+    )
+
+    if is_arrow:
+        return _to_arrow(triggered), None if leaf_trace is None else _to_arrow(leaf_trace)
+    return triggered, leaf_trace
+
+
+class FrameColumns:
+    """Column access over a pandas DataFrame for :class:`FrameEvaluator`."""
+
+    def __init__(self, frame: Any) -> None:
+        self.frame = frame
+        self.size = len(frame)
+        self._columns: Dict[str, Tuple[str, Any, Any]] = {}
+        self._objects: Dict[Any, Any] | None = None
+
+    def column(self, name: str) -> Tuple[str, Any, Any]:
+        if name not in self._columns:
+            self._columns[name] = self._typed_column(name)
+        return self._columns[name]
+
+    def series(self, name: str) -> Any:
+        return self.frame[name]
+
+    def record(self, index: int) -> Dict[str, Any]:
+        if self._objects is None:
+            self._objects = {
+                name: self._object_values(self.frame[name]) for name in self.frame.columns
+            }
+        return {name: values[index] for name, values in self._objects.items()}
+
+    def _typed_column(self, name: str) -> Tuple[str, Any, Any]:
+        pd = _require_pandas()
+        np = _require_numpy()
+        if name not in self.frame.columns:
+            return BOOLEAN_COLUMN, np.zeros(self.size, dtype=bool), np.zeros(self.size, dtype=bool)
+
+        series = self.frame[name]
+        valid = series.notna().to_numpy(dtype=bool)
+        if pd.api.types.is_bool_dtype(series.dtype):
+            return BOOLEAN_COLUMN, series.fillna(False).to_numpy(dtype=bool), valid
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            floats = series.to_numpy(dtype=float, na_value=np.nan)
+            return NUMERIC_COLUMN, (floats, self._object_values(series)), valid
+        if pd.api.types.is_string_dtype(series.dtype) and not pd.api.types.is_object_dtype(
+            series.dtype
+        ):
+            return STRING_COLUMN, self._object_values(series), valid
+        return typed_column(self._object_values(series))
+
+    @staticmethod
+    def _object_values(series: Any) -> Any:
+        # A fresh array: for object columns ``to_numpy`` may return the frame's own
+        # (possibly read-only) buffer.
+        values = series.to_numpy(dtype=object, copy=True)
+        values[series.isna().to_numpy(dtype=bool)] = None
+        return values
+
+
+class FrameEvaluator(BatchEvaluator):
+    """Batch evaluator adding pandas string kernels for ``StringType`` operators."""
+
+    def __init__(self, columns: FrameColumns, defined_actions: Any = None) -> None:
+        super().__init__(columns, defined_actions)
+        self.leaf_kernels.append(self._string_leaf)
+
+    def _string_leaf(self, condition: Condition) -> Any:
+        if "expression" in condition or "function" in condition or "name" not in condition:
+            return None
+        if condition.get("value_condition") or _contains_variable_reference(
+            condition.get("value")
+        ):
+            return None
+
+        operator = condition.get("operator")
+        kind, values, valid = self.columns.column(condition["name"])
+        if kind != STRING_COLUMN:
+            return None
+
+        series = self.columns.series(condition["name"])
+        value = condition.get("value")
+        value = value.value if isinstance(value, BaseType) else value
+        if isinstance(value, list) and len(value) == 1 and operator != "is_in":
+            value = value[0]
+
+        if operator == "non_empty":
+            matches = series.str.len() > 0
+        elif operator == "is_in":
+            if not isinstance(value, (list, tuple, set, frozenset)):
+                return None
+            matches = series.isin(list(value))
+        elif operator in _STRING_KERNELS and isinstance(value, str):
+            matches = _STRING_KERNELS[operator](series, value)
+        else:
+            return None
+        return valid & matches.fillna(False).to_numpy(dtype=bool)
+
+
+def _search_regex(series: Any, pattern: str) -> Any:
+    with warnings.catch_warnings():
+        # pandas warns about capture groups, which only matter for extraction.
+        warnings.simplefilter("ignore", UserWarning)
+        return series.str.contains(compile_regex(pattern), regex=True)
+
+
+def _to_arrow(frame: Any) -> Any:
+    pa = _require_pyarrow()
+    frame = frame.rename(columns=str)
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def _require_pandas() -> Any:
+    try:
+        import pandas
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("DataFrame evaluation requires pandas to be installed") from exc
+    return pandas
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("DataFrame evaluation requires numpy to be installed") from exc
+    return numpy
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("Arrow table evaluation requires pyarrow to be installed") from exc
+    return pyarrow
+
+
+__all__ = ["FrameColumns", "FrameEvaluator", "evaluate_frame"]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import inspect
+import itertools
+from typing import Any, Callable, Collection, Dict, Hashable, Iterable, Iterator, List, Sequence
+
+from .analysis import required_variables
+from .compiler import CompiledRuleSet
+from .context import AwaitedResult, EvaluationContext, evaluation_context
+from .engine import Rule, RunResult, run_all
+from .observers import ACTIVE_OBSERVERS, VARIABLE, notify_call
+from .variables import load_values
+
+
+def run_all_many(
+    rules: Sequence[Rule] | CompiledRuleSet,
+    records: Iterable[Any],
+    defined_actions: Any,
+    *,
+    chunk_size: int = 1000,
+    **run_options: Any,
+) -> Iterator[RunResult]:
+    """Evaluate ``rules`` for many variables objects, loading batch variables per chunk.
+
+    ``records`` are variables objects (or evaluation contexts). They are read
+    ``chunk_size`` at a time, and every ``batch=True`` variable the rules
+    reference is loaded once per chunk for all the keys of the chunk (see
+    :func:`prime_batch_variables`) before the records are evaluated. Yields
+    one ``run_all`` result per record, in input order; ``run_options`` are
+    passed to ``run_all``. ``rules`` may be a rule list or a compiled rule set.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(rules, CompiledRuleSet):
+        run: Callable[..., RunResult] = rules.run_all
+        names: Collection[str] = rules.required_variables
+    else:
+        rule_list = list(rules)
+        names = required_variables(rule_list)
+
+        def run(defined_variables: Any, actions: Any, **options: Any) -> RunResult:
+            return run_all(rule_list, defined_variables, actions, **options)
+
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        for context in prime_batch_variables(chunk, names):
+            yield run(context, defined_actions, **run_options)
+
+
+def prime_batch_variables(
+    variables_list: Sequence[Any],
+    names: Collection[str] | None = None,
+) -> List[EvaluationContext]:
+    """Load the batch variables of ``variables_list`` with one loader call per variable.
+
+    Objects are grouped by class. For each ``batch=True`` variable (restricted
+    to ``names`` when given) the loader is called once, on the first object of
+    the group, with the distinct keys from ``get_batch_key()``; values not
+    already cached are primed on each object's evaluation context. If a loader
+    or an object's ``get_batch_key()`` raises, the error is raised only when a
+    rule reads that variable for the affected records, as it would be without
+    batching. Returns the contexts in input order.
+    """
+    contexts = [evaluation_context(variables) for variables in variables_list]
+    groups: Dict[type, List[EvaluationContext]] = {}
+    for context in contexts:
+        if not isinstance(context.defined_variables, dict):
+            groups.setdefault(type(context.defined_variables), []).append(context)
+
+    for variables_class, group in groups.items():
+        for name, loader in _batch_loaders(variables_class).items():
+            if names is not None and name not in names:
+                continue
+            pending = [context for context in group if not context.is_cached(name)]
+            if pending:
+                _load(name, loader, pending)
+    return contexts
+
+
+def _load(name: str, loader: Callable[..., Any], contexts: List[EvaluationContext]) -> None:
+    keyed: List[EvaluationContext] = []
+    keys_by_context: List[Hashable] = []
+    for context in contexts:
+        # A record whose key cannot be resolved fails on its own, like a failed load.
+        try:
+            key = context.defined_variables.get_batch_key()
+            hash(key)
+        except Exception as exc:
+            context.prime(name, AwaitedResult(error=exc))
+            continue
+        keyed.append(context)
+        keys_by_context.append(key)
+    if not keyed:
+        return
+
+    keys: List[Hashable] = list(dict.fromkeys(keys_by_context))
+    arguments = (loader, keyed[0].defined_variables, keys)
+    try:
+        if ACTIVE_OBSERVERS:
+            values = notify_call(VARIABLE, name, load_values, *arguments)
+        else:
+            values = load_values(*arguments)
+    except Exception as exc:
+        failure = AwaitedResult(error=exc)
+        for context in keyed:
+            context.prime(name, failure)
+        return
+
+    value_by_key = dict(zip(keys, values))
+    for context, key in zip(keyed, keys_by_context):
+        context.prime(name, value_by_key[key])
+
+
+_BATCH_LOADERS: Dict[type, Dict[str, Callable[..., Any]]] = {}
+
+
+def _batch_loaders(variables_class: type) -> Dict[str, Callable[..., Any]]:
+    loaders = _BATCH_LOADERS.get(variables_class)
+    if loaders is None:
+        loaders = _BATCH_LOADERS[variables_class] = {
+            name: member.batch_loader
+            for name, member in inspect.getmembers(variables_class)
+            if getattr(member, "is_rule_variable", False) and hasattr(member, "batch_loader")
+        }
+    return loaders
+
+
+__all__ = ["prime_batch_variables", "run_all_many"]
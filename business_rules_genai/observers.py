@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+RULE = "rule"
+CONDITION = "condition"
+ACTION = "action"
+VARIABLE = "variable"
+
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+class EvaluationObserver:
+    """Hooks called around rule, condition, action and variable evaluation.
+
+    Subclass and override the callbacks you need, then register the observer
+    with :func:`add_observer` or :func:`observing`. ``before_*`` hooks receive
+    the subject: the rule dict, the condition label, the action name or the
+    variable name. ``after_*`` hooks also receive what the call returned, its
+    duration in seconds and the exception it raised, if any. Rule results are
+    ``(triggered, details)`` and condition results ``(passed, trace_node)``.
+
+    Only evaluated work is reported: conditions skipped by short-circuiting,
+    memoized pure actions and cached variables produce no calls.
+    """
+
+    def before_rule(self, rule: Dict[str, Any]) -> None:
+        pass
+
+    def after_rule(self, rule: Dict[str, Any], result: Any, elapsed: float, error: BaseException | None) -> None:
+        pass
+
+    def before_condition(self, label: Any) -> None:
+        pass
+
+    def after_condition(self, label: Any, result: Any, elapsed: float, error: BaseException | None) -> None:
+        pass
+
+    def before_action(self, name: str) -> None:
+        pass
+
+    def after_action(self, name: str, result: Any, elapsed: float, error: BaseException | None) -> None:
+        pass
+
+    def before_variable(self, name: str) -> None:
+        pass
+
+    def after_variable(self, name: str, result: Any, elapsed: float, error: BaseException | None) -> None:
+        pass
+
+
+# Registered observers. Evaluation code only tests this list for truth, so
+# hooks cost nothing beyond that check while it is empty.
+ACTIVE_OBSERVERS: List[EvaluationObserver] = []
+
+
+def add_observer(observer: EvaluationObserver) -> None:
+    """Register ``observer`` for every evaluation in the process."""
+    ACTIVE_OBSERVERS.append(observer)
+
+
+def remove_observer(observer: EvaluationObserver) -> None:
+    ACTIVE_OBSERVERS.remove(observer)
+
+
+@contextmanager
+def observing(*observers: EvaluationObserver) -> Iterator[None]:
+    """Register ``observers`` for the duration of a ``with`` block."""
+    for observer in observers:
+        add_observer(observer)
+    try:
+        yield
+    finally:
+        for observer in observers:
+            remove_observer(observer)
+
+
+def notify_call(kind: str, subject: Any, function: Callable[..., Any], *args: Any) -> Any:
+    """Call ``function(*args)`` between the ``before_<kind>`` and ``after_<kind>`` hooks."""
+    observers = tuple(ACTIVE_OBSERVERS)
+    before, after = f"before_{kind}", f"after_{kind}"
+    for observer in observers:
+        getattr(observer, before)(subject)
+    started = perf_counter()
+    try:
+        result = function(*args)
+    except BaseException as exc:
+        elapsed = perf_counter() - started
+        for observer in observers:
+            getattr(observer, after)(subject, None, elapsed, exc)
+        raise
+    elapsed = perf_counter() - started
+    for observer in observers:
+        getattr(observer, after)(subject, result, elapsed, None)
+    return result
+
+
+def rule_id(rule: Dict[str, Any]) -> str:
+    """Return a rule's ``id`` or ``name``, or a digest of its content for anonymous rules."""
+    identifier = rule.get("id", rule.get("name"))
+    if identifier is not None:
+        return str(identifier)
+    content = json.dumps(rule, sort_keys=True, default=repr)
+    return "rule-" + hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+
+
+_OUTCOME_COUNTERS = {
+    RULE: ("triggered", "Evaluations of each rule that triggered."),
+    CONDITION: ("passed", "Evaluations of each condition that passed."),
+}
+
+
+class _Series:
+    __slots__ = ("bucket_counts", "total", "count", "outcomes", "errors")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.total = 0.0
+        self.count = 0
+        self.outcomes = 0
+        self.errors = 0
+
+
+class MetricsCollector(EvaluationObserver):
+    """Observer keeping latency histograms and counters per rule, condition and action.
+
+    Series are keyed by :func:`rule_id`, condition label, action name and
+    variable name. Besides durations, the collector counts triggered rules,
+    passed conditions and errors. Read the data with :meth:`as_dict` or
+    :meth:`to_prometheus`.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, *, namespace: str = "business_rules") -> None:
+        self.buckets = tuple(sorted(bound for bound in buckets if not math.isinf(bound)))
+        self.namespace = namespace
+        self._series: Dict[str, Dict[str, _Series]] = {RULE: {}, CONDITION: {}, ACTION: {}, VARIABLE: {}}
+        self._rule_ids: Dict[int, Tuple[Dict[str, Any], str]] = {}
+        self._lock = threading.Lock()
+
+    def after_rule(self, rule: Dict[str, Any], result: Any, elapsed: float, error: BaseException | None) -> None:
+        cached = self._rule_ids.get(id(rule))
+        if cached is None or cached[0] is not rule:
+            cached = self._rule_ids[id(rule)] = (rule, rule_id(rule))
+        self._record(RULE, cached[1], elapsed, error, bool(result and result[0]))
+
+    def after_condition(self, label: Any, result: Any, elapsed: float, error: BaseException | None) -> None:
+        self._record(CONDITION, str(label), elapsed, error, bool(result and result[0]))
+
+    def after_action(self, name: str, result: Any, elapsed: float, error: BaseException | None) -> None:
+        self._record(ACTION, name, elapsed, error, False)
+
+    def after_variable(self, name: str, result: Any, elapsed: float, error: BaseException | None) -> None:
+        self._record(VARIABLE, name, elapsed, error, False)
+
+    def _record(self, kind: str, key: str, elapsed: float, error: BaseException | None, outcome: bool) -> None:
+        with self._lock:
+            series = self._series[kind].get(key)
+            if series is None:
+                series = self._series[kind][key] = _Series(len(self.buckets))
+            series.bucket_counts[bisect_left(self.buckets, elapsed)] += 1
+            series.total += elapsed
+            series.count += 1
+            if outcome:
+                series.outcomes += 1
+            if error is not None:
+                series.errors += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            for series in self._series.values():
+                series.clear()
+            self._rule_ids.clear()
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return ``{"rules"|"conditions"|"actions"|"variables": {key: stats}}``.
+
+        Each entry holds ``count``, ``errors``, ``seconds`` (total), cumulative
+        ``buckets`` keyed by upper bound and, for rules and conditions,
+        ``triggered`` or ``passed``.
+        """
+        with self._lock:
+            document: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for kind, series_by_key in self._series.items():
+                entries = document[f"{kind}s"] = {}
+                for key, series in series_by_key.items():
+                    entry: Dict[str, Any] = {
+                        "count": series.count,
+                        "errors": series.errors,
+                        "seconds": series.total,
+                        "buckets": dict(zip(self._bucket_labels(), self._cumulative(series))),
+                    }
+                    if kind in _OUTCOME_COUNTERS:
+                        entry[_OUTCOME_COUNTERS[kind][0]] = series.outcomes
+                    entries[key] = entry
+            return document
+
+    def to_prometheus(self) -> str:
+        """Render the collected metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for kind, series_by_key in self._series.items():
+                if not series_by_key:
+                    continue
+                name = f"{self.namespace}_{kind}_duration_seconds"
+                lines.append(f"# HELP {name} Time spent evaluating each {kind}.")
+                lines.append(f"# TYPE {name} histogram")
+                for key, series in series_by_key.items():
+                    label = f'{kind}="{_escape_label(key)}"'
+                    for bound, count in zip(self._bucket_labels(), self._cumulative(series)):
+                        lines.append(f'{name}_bucket{{{label},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{label}}} {series.total!r}")
+                    lines.append(f"{name}_count{{{label}}} {series.count}")
+
+                if kind in _OUTCOME_COUNTERS:
+                    suffix, help_text = _OUTCOME_COUNTERS[kind]
+                    lines.extend(self._counter_lines(kind, series_by_key, suffix, help_text, "outcomes"))
+                help_text = f"Evaluations of each {kind} that raised."
+                lines.extend(self._counter_lines(kind, series_by_key, "errors", help_text, "errors"))
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _counter_lines(
+        self, kind: str, series_by_key: Dict[str, _Series], suffix: str, help_text: str, attribute: str
+    ) -> List[str]:
+        name = f"{self.namespace}_{kind}_{suffix}_total"
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for key, series in series_by_key.items():
+            lines.append(f'{name}{{{kind}="{_escape_label(key)}"}} {getattr(series, attribute)}')
+        return lines
+
+    def _bucket_labels(self) -> List[str]:
+        return [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+
+    def _cumulative(self, series: _Series) -> List[int]:
+        running, cumulative = 0, []
+        for count in series.bucket_counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "EvaluationObserver",
+    "MetricsCollector",
+    "add_observer",
+    "observing",
+    "remove_observer",
+    "rule_id",
+]
@@ -2,12 +2,24 @@ from __future__ import annotations
 
 import inspect
 import re
-from decimal import Decimal
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import ROUND_HALF_EVEN, Decimal
 from functools import wraps
-from typing import Any, Callable, Dict, Iterable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
 
 from .fields import FIELD_LIST, FIELD_NO_INPUT, FIELD_NUMERIC, FIELD_TEXT
-from .utils import fn_name_to_pretty_label
+from .utils import CacheInfo, LRUCache, fn_name_to_pretty_label
 
 COMPARISON_OPERATOR_MAP: Dict[str, str] = {
     "equal_to": "==",
@@ -28,6 +40,8 @@ COMPARISON_OPERATOR_MAP: Dict[str, str] = {
 class BaseType:
     """Base wrapper class used by the rules engine for type-specific operators."""
 
+    __slots__ = ("value",)
+
     name: str = "base"
 
     def __init__(self, value: Any) -> None:
@@ -52,31 +66,95 @@ def type_operator(
         func.label = label  # type: ignore[attr-defined]
         func.input_type = input_type  # type: ignore[attr-defined]
         func.comparison_type = comparison_type  # type: ignore[attr-defined]
+        func.casts_arguments = assert_type_for_arguments  # type: ignore[attr-defined]
+
+        if not assert_type_for_arguments:
+            func.raw_operator = func  # type: ignore[attr-defined]
+            return func
 
         @wraps(func)
         def inner(self: BaseType, *args: Any, **kwargs: Any) -> Any:
-            if assert_type_for_arguments:
-                args = tuple(self._assert_valid_value_and_cast(arg) for arg in args)
-                kwargs = {
-                    key: self._assert_valid_value_and_cast(value)
-                    for key, value in kwargs.items()
-                }
-                if (
-                    self.value is None
-                    or any(arg is None for arg in args)
-                    or any(value is None for value in kwargs.values())
-                ):
+            if self.value is None:
+                return False
+            cast = self._assert_valid_value_and_cast
+            if len(args) == 1 and not kwargs:
+                other = cast(args[0])
+                return False if other is None else func(self, other)
+            args = tuple([cast(arg) for arg in args])
+            if kwargs:
+                kwargs = {key: cast(value) for key, value in kwargs.items()}
+                if None in kwargs.values():
                     return False
+            if None in args:
+                return False
             return func(self, *args, **kwargs)
 
+        inner.raw_operator = func  # type: ignore[attr-defined]
         return inner
 
     return wrapper
 
 
+class OperatorEntry(NamedTuple):
+    """An operator of a wrapper type resolved for direct calls on cast values.
+
+    ``function`` is the undecorated operator: it takes the wrapper instance and
+    arguments already cast by ``_assert_valid_value_and_cast`` when
+    ``casts_arguments`` is set, skipping the validation done by the public
+    method.
+    """
+
+    name: str
+    function: Callable[..., Any]
+    input_type: str | None
+    comparison_type: str | None
+    casts_arguments: bool
+
+    def cast_arguments(self, instance: BaseType, args: Sequence[Any]) -> Tuple[Any, ...] | None:
+        """Cast ``args`` for ``instance``; ``None`` when any of them is invalid."""
+        if not self.casts_arguments:
+            return tuple(args)
+        cast = instance._assert_valid_value_and_cast
+        cast_args = tuple([cast(arg) for arg in args])
+        return None if None in cast_args else cast_args
+
+    def call(self, instance: BaseType, args: Sequence[Any]) -> Any:
+        """Call the operator with uncast ``args``, matching the public method."""
+        if self.casts_arguments:
+            if instance.value is None:
+                return False
+            args = self.cast_arguments(instance, args)
+            if args is None:
+                return False
+        return self.function(instance, *args)
+
+
+_OPERATOR_TABLES: Dict[type, Dict[str, OperatorEntry]] = {}
+
+
+def get_operator_table(type_class: type[BaseType]) -> Dict[str, OperatorEntry]:
+    """Return the cached ``OperatorEntry`` table of a wrapper type, keyed by operator name."""
+    table = _OPERATOR_TABLES.get(type_class)
+    if table is None:
+        table = {}
+        for name, member in inspect.getmembers(type_class, predicate=callable):
+            if getattr(member, "is_operator", False):
+                table[name] = OperatorEntry(
+                    name,
+                    getattr(member, "raw_operator", member),
+                    getattr(member, "input_type", None),
+                    getattr(member, "comparison_type", None),
+                    getattr(member, "casts_arguments", True),
+                )
+        table = _OPERATOR_TABLES.setdefault(type_class, table)
+    return table
+
+
 class StringType(BaseType):
     """Wrapper class exposing string specific operators."""
 
+    __slots__ = ()
+
     name = "string"
 
     def _assert_valid_value_and_cast(self, value: Any) -> str | None:
@@ -106,7 +184,7 @@ class StringType(BaseType):
 
     @type_operator(FIELD_TEXT)
     def matches_regex(self, regex: str) -> bool:
-        return bool(re.search(regex, self.value))
+        return bool(compile_regex(regex).search(self.value))
 
     @type_operator(FIELD_NO_INPUT)
     def non_empty(self) -> bool:
@@ -124,15 +202,86 @@ class StringType(BaseType):
         return self.value in value_list
 
 
-class NumericType(BaseType):
-    """Wrapper class exposing numeric operators leveraging ``Decimal`` math."""
+def membership_set(values: Iterable[Any]) -> FrozenSet[Any]:
+    """Return ``values`` as a frozenset usable by the ``is_in`` operators.
+
+    Floats are converted to ``Decimal`` the way ``NumericType`` casts them, so
+    numeric membership agrees with the wrapped values; everything else is kept
+    as is. Raises ``TypeError`` for unhashable members.
+    """
+    return frozenset(Decimal(str(value)) if isinstance(value, float) else value for value in values)
+
+
+_REGEX_CACHE = LRUCache(maxsize=512)
+
+
+def compile_regex(pattern: str) -> re.Pattern:
+    """Return the compiled form of ``pattern``, cached in a bounded LRU."""
+    return _REGEX_CACHE.get_or_create(pattern, re.compile)
 
-    EPSILON = Decimal("0.000001")
-    name = "numeric"
 
-    def _assert_valid_value_and_cast(self, value: Any) -> Decimal | None:
+def regex_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the compiled regex cache."""
+    return _REGEX_CACHE.info()
+
+
+def set_regex_cache_size(maxsize: int) -> None:
+    """Bound the compiled regex cache to ``maxsize`` entries."""
+    _REGEX_CACHE.resize(maxsize)
+
+
+def clear_regex_cache() -> None:
+    """Drop every cached regex and reset the statistics."""
+    _REGEX_CACHE.clear()
+
+
+class NumericBackend:
+    """Native number representation used by ``NumericType`` and the arithmetic actions.
+
+    ``cast`` turns ints, floats, ``Decimal`` values and ``NumericType`` instances
+    into the backend's native numbers (``None`` for anything else) and
+    ``epsilon`` is the comparison tolerance in native units.
+    """
+
+    name = "base"
+    epsilon: Any = 0
+
+    def cast(self, value: Any) -> Any:
         if isinstance(value, NumericType):
-            return value.value
+            if value.backend is self or value.value is None:
+                return value.value
+            return self.cast(value.backend.to_decimal(value.value))
+        return self._cast_number(value)
+
+    def _cast_number(self, value: Any) -> Any:
+        raise NotImplementedError
+
+    def to_decimal(self, value: Any) -> Decimal:
+        raise NotImplementedError
+
+    def add(self, left: Any, right: Any) -> Any:
+        return left + right
+
+    def subtract(self, left: Any, right: Any) -> Any:
+        return left - right
+
+    def multiply(self, left: Any, right: Any) -> Any:
+        return left * right
+
+    def divide(self, left: Any, right: Any) -> Any:
+        return left / right
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class DecimalBackend(NumericBackend):
+    """Exact ``Decimal`` arithmetic; the default backend."""
+
+    name = "decimal"
+    epsilon = Decimal("0.000001")
+
+    def _cast_number(self, value: Any) -> Decimal | None:
         if isinstance(value, Decimal):
             return value
         if isinstance(value, int):
@@ -142,42 +291,217 @@ class NumericType(BaseType):
             return Decimal(str(value))
         return None
 
+    def to_decimal(self, value: Decimal) -> Decimal:
+        return value
+
+
+class FloatBackend(NumericBackend):
+    """Binary floating point with the same comparison tolerance as ``Decimal``."""
+
+    name = "float"
+    epsilon = 0.000001
+
+    def _cast_number(self, value: Any) -> float | None:
+        if isinstance(value, (int, float, Decimal)):
+            return float(value)
+        return None
+
+    def to_decimal(self, value: float) -> Decimal:
+        return Decimal(str(value))
+
+
+class ScaledIntegerBackend(NumericBackend):
+    """Fixed-point integers counting units of ``10 ** -scale``.
+
+    Native values are plain ``int`` unit counts; inputs are rounded half-even
+    to ``scale`` decimal places, as are products and quotients.
+    """
+
+    name = "scaled"
+
+    def __init__(self, scale: int = 6) -> None:
+        if scale < 0:
+            raise ValueError("scale must not be negative")
+        self.scale = scale
+        self.factor = 10**scale
+        self.epsilon = int(DecimalBackend.epsilon.scaleb(scale))
+
+    def _cast_number(self, value: Any) -> int | None:
+        if isinstance(value, int):
+            return value * self.factor
+        if isinstance(value, float):
+            value = Decimal(str(value))
+        if isinstance(value, Decimal):
+            return int(value.scaleb(self.scale).to_integral_value(ROUND_HALF_EVEN))
+        return None
+
+    def to_decimal(self, value: int) -> Decimal:
+        return Decimal(value).scaleb(-self.scale)
+
+    def multiply(self, left: int, right: int) -> int:
+        return _divide_half_even(left * right, self.factor)
+
+    def divide(self, left: int, right: int) -> int:
+        return _divide_half_even(left * self.factor, right)
+
+    def __repr__(self) -> str:
+        return f"ScaledIntegerBackend(scale={self.scale})"
+
+
+def _divide_half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    doubled = 2 * remainder
+    if denominator < 0:
+        doubled, denominator = -doubled, -denominator
+    if doubled > denominator or (doubled == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+DECIMAL_BACKEND = DecimalBackend()
+FLOAT_BACKEND = FloatBackend()
+_NAMED_BACKENDS: Dict[str, Callable[[], NumericBackend]] = {
+    DecimalBackend.name: lambda: DECIMAL_BACKEND,
+    FloatBackend.name: lambda: FLOAT_BACKEND,
+    ScaledIntegerBackend.name: ScaledIntegerBackend,
+}
+_default_backend: NumericBackend = DECIMAL_BACKEND
+_backend_override: ContextVar[NumericBackend | None] = ContextVar(
+    "numeric_backend", default=None
+)
+
+
+def resolve_numeric_backend(backend: str | NumericBackend) -> NumericBackend:
+    """Return the backend instance for ``backend`` (a name or an instance)."""
+    if isinstance(backend, NumericBackend):
+        return backend
+    if backend not in _NAMED_BACKENDS:
+        raise ValueError(f"Unknown numeric backend: {backend!r}")
+    return _NAMED_BACKENDS[backend]()
+
+
+def get_numeric_backend() -> NumericBackend:
+    """Return the numeric backend active in the current context."""
+    override = _backend_override.get()
+    return _default_backend if override is None else override
+
+
+def set_numeric_backend(backend: str | NumericBackend) -> None:
+    """Set the process-wide default numeric backend."""
+    global _default_backend
+    _default_backend = resolve_numeric_backend(backend)
+
+
+@contextmanager
+def use_numeric_backend(backend: str | NumericBackend) -> Iterator[NumericBackend]:
+    """Use ``backend`` for numeric values created within the ``with`` block."""
+    token = _backend_override.set(resolve_numeric_backend(backend))
+    try:
+        yield _backend_override.get()
+    finally:
+        _backend_override.reset(token)
+
+
+class NumericType(BaseType):
+    """Wrapper class exposing numeric operators over the active numeric backend.
+
+    Values are ``Decimal`` unless another backend is selected with
+    :func:`set_numeric_backend` or :func:`use_numeric_backend`.
+    """
+
+    __slots__ = ("backend",)
+
+    # Comparison tolerance. Subclasses may override it (as a Decimal, float or
+    # int); otherwise each backend's own ``epsilon`` applies.
+    EPSILON = DecimalBackend.epsilon
+    name = "numeric"
+
+    def __init__(self, value: Any) -> None:
+        self.backend = get_numeric_backend()
+        super().__init__(value)
+
+    @classmethod
+    def from_native(cls, value: Any, backend: NumericBackend) -> "NumericType":
+        """Wrap a number already in ``backend``'s native representation."""
+        instance = cls.__new__(cls)
+        instance.backend = backend
+        instance.value = value
+        return instance
+
+    def _assert_valid_value_and_cast(self, value: Any) -> Any:
+        return self.backend.cast(value)
+
+    def to_decimal(self) -> Decimal | None:
+        """Return the value as a ``Decimal`` whatever the backend."""
+        return None if self.value is None else self.backend.to_decimal(self.value)
+
+    @classmethod
+    def tolerance(cls, backend: NumericBackend | None = None) -> Decimal:
+        """Return the comparison tolerance as a ``Decimal`` for ``backend`` (default: active)."""
+        if cls.EPSILON is not DecimalBackend.epsilon:
+            return DECIMAL_BACKEND.cast(cls.EPSILON)
+        backend = backend or get_numeric_backend()
+        return backend.to_decimal(backend.epsilon)
+
+    def _epsilon(self) -> Any:
+        epsilon = type(self).EPSILON
+        if epsilon is DecimalBackend.epsilon:
+            return self.backend.epsilon
+        return self.backend.cast(epsilon)
+
     @type_operator(FIELD_NUMERIC)
-    def equal_to(self, other_numeric: Decimal) -> bool:
-        return abs(self.value - other_numeric) <= self.EPSILON
+    def equal_to(self, other_numeric: Any) -> bool:
+        return abs(self.value - other_numeric) <= self._epsilon()
 
     @type_operator(FIELD_NUMERIC)
-    def greater_than(self, other_numeric: Decimal) -> bool:
-        return (self.value - other_numeric) > self.EPSILON
+    def greater_than(self, other_numeric: Any) -> bool:
+        return (self.value - other_numeric) > self._epsilon()
 
     @type_operator(FIELD_NUMERIC)
-    def greater_than_or_equal_to(self, other_numeric: Decimal) -> bool:
-        return self.greater_than(other_numeric) or self.equal_to(other_numeric)
+    def greater_than_or_equal_to(self, other_numeric: Any) -> bool:
+        return (self.value - other_numeric) >= -self._epsilon()
 
     @type_operator(FIELD_NUMERIC)
-    def less_than(self, other_numeric: Decimal) -> bool:
-        return (other_numeric - self.value) > self.EPSILON
+    def less_than(self, other_numeric: Any) -> bool:
+        return (other_numeric - self.value) > self._epsilon()
 
     @type_operator(FIELD_NUMERIC)
-    def less_than_or_equal_to(self, other_numeric: Decimal) -> bool:
-        return self.less_than(other_numeric) or self.equal_to(other_numeric)
+    def less_than_or_equal_to(self, other_numeric: Any) -> bool:
+        return (other_numeric - self.value) >= -self._epsilon()
+
+    @type_operator(
+        FIELD_NUMERIC,
+        assert_type_for_arguments=False,
+        comparison_type=FIELD_LIST,
+    )
+    def is_in(self, value_list: Iterable[Any]) -> bool:
+        """Check if the number is exactly equal to one of a provided list."""
+        if isinstance(value_list, str) or not isinstance(value_list, Iterable):
+            raise ValueError("value_list must be an iterable of numbers")
+        if self.value is None:
+            return False
+        if not isinstance(value_list, frozenset):
+            value_list = membership_set(value_list)
+        return self.to_decimal() in value_list
 
     @type_operator(FIELD_NUMERIC, label="Is in range")
-    def between(self, lower_bound: Decimal, upper_bound: Decimal) -> bool:
+    def between(self, lower_bound: Any, upper_bound: Any) -> bool:
         """Check if the numeric value is between two exclusive bounds."""
-        return self.greater_than(lower_bound) and self.less_than(upper_bound)
+        epsilon = self._epsilon()
+        return (self.value - lower_bound) > epsilon and (upper_bound - self.value) > epsilon
 
     @type_operator(FIELD_NUMERIC, label="Is In Range equal")
-    def between_equal(self, lower_bound: Decimal, upper_bound: Decimal) -> bool:
+    def between_equal(self, lower_bound: Any, upper_bound: Any) -> bool:
         """Check if the numeric value is between two inclusive bounds."""
-        return self.greater_than_or_equal_to(lower_bound) and self.less_than_or_equal_to(
-            upper_bound
-        )
+        epsilon = self._epsilon()
+        return (self.value - lower_bound) >= -epsilon and (upper_bound - self.value) >= -epsilon
 
 
 class BooleanType(BaseType):
     """Wrapper class exposing boolean operators."""
 
+    __slots__ = ()
+
     name = "boolean"
 
     def _assert_valid_value_and_cast(self, value: Any) -> bool | None:
@@ -249,8 +573,25 @@ __all__ = [
     "BaseType",
     "BooleanType",
     "COMPARISON_OPERATOR_MAP",
+    "DECIMAL_BACKEND",
+    "DecimalBackend",
+    "FLOAT_BACKEND",
+    "FloatBackend",
+    "NumericBackend",
     "NumericType",
+    "OperatorEntry",
+    "ScaledIntegerBackend",
     "StringType",
+    "clear_regex_cache",
+    "compile_regex",
     "export_operator_catalog",
+    "get_numeric_backend",
+    "get_operator_table",
     "get_type_operators",
+    "membership_set",
+    "regex_cache_info",
+    "resolve_numeric_backend",
+    "set_numeric_backend",
+    "set_regex_cache_size",
+    "use_numeric_backend",
 ]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from .compiler import CompiledRuleSet, compile_rules
+from .engine import TRACE_NONE, Rule
+from .loader import prime_batch_variables
+
+ERRORS_RAISE = "raise"
+ERRORS_COLLECT = "collect"
+ERROR_MODES = (ERRORS_RAISE, ERRORS_COLLECT)
+
+
+class RecordResult(NamedTuple):
+    """Outcome of evaluating one record, in input order.
+
+    ``result`` is the second item ``run_all`` returns (trace nodes, or the
+    action result with ``return_action_results``) and ``triggered_rules`` the
+    indices of the rules that triggered. With ``errors="collect"`` a failing
+    record has ``triggered`` set to ``None`` and ``error`` describing the
+    exception as ``"<ExceptionType>: <message>"``.
+    """
+
+    index: int
+    triggered: bool | None
+    result: Any
+    error: str | None = None
+    triggered_rules: Tuple[int, ...] = ()
+
+
+def run_all_parallel(
+    rule_list: Sequence[Rule],
+    records: Iterable[Any],
+    actions_class: type,
+    *,
+    variables_factory: Callable[[Any], Any] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    max_pending_chunks: int | None = None,
+    errors: str = ERRORS_RAISE,
+    **run_options: Any,
+) -> Iterator[RecordResult]:
+    """Evaluate ``rule_list`` over ``records`` in a pool of worker processes.
+
+    The rule set, ``actions_class`` and ``variables_factory`` are shipped to
+    each worker once; workers compile the rules and create one actions
+    instance. Records are read lazily and sent in chunks of ``chunk_size``,
+    with at most ``max_pending_chunks`` (default ``2 * workers``) in flight, so
+    memory stays bounded for any number of records. Results are yielded in
+    input order.
+
+    Each record is passed through ``variables_factory`` (default: used as is)
+    before evaluation. ``run_options`` are forwarded to
+    :meth:`CompiledRuleSet.run_all_detailed`; ``trace`` defaults to ``"none"``. With
+    ``errors="raise"`` the first failing record stops the run and its
+    exception propagates; with ``errors="collect"`` failures are reported on
+    the record's :class:`RecordResult` and evaluation continues.
+
+    The arguments are checked and the rules compiled when the function is
+    called, so invalid options or rules raise before any record is read.
+    ``workers=1`` evaluates in the calling process. Worker processes need the
+    actions class and factory to be importable (module-level) definitions.
+    """
+    if errors not in ERROR_MODES:
+        raise ValueError(f"Unknown errors mode: {errors!r}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    run_options.setdefault("trace", TRACE_NONE)
+    worker_args = (list(rule_list), actions_class, variables_factory, errors, run_options)
+
+    chunks = _chunked(records, chunk_size)
+    if workers == 1:
+        return _evaluate_in_process(_WorkerState(*worker_args), chunks)
+    compile_rules(rule_list, actions_class)
+    return _evaluate_in_pool(worker_args, chunks, workers, max_pending_chunks or 2 * workers)
+
+
+def _evaluate_in_process(
+    state: _WorkerState, chunks: Iterator[Tuple[int, List[Any]]]
+) -> Iterator[RecordResult]:
+    for start, chunk in chunks:
+        yield from state.evaluate_chunk(start, chunk)
+
+
+def _evaluate_in_pool(
+    worker_args: Tuple[Any, ...],
+    chunks: Iterator[Tuple[int, List[Any]]],
+    workers: int,
+    max_pending: int,
+) -> Iterator[RecordResult]:
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=worker_args,
+    ) as executor:
+        pending: Deque[Future] = deque()
+        try:
+            for start, chunk in chunks:
+                pending.append(executor.submit(_evaluate_chunk, start, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class _WorkerState:
+    def __init__(
+        self,
+        rule_list: List[Rule],
+        actions_class: type,
+        variables_factory: Callable[[Any], Any] | None,
+        errors: str,
+        run_options: Dict[str, Any],
+    ) -> None:
+        self.rule_set: CompiledRuleSet = compile_rules(rule_list, actions_class)
+        self.actions = actions_class()
+        self.variables_factory = variables_factory
+        self.errors = errors
+        self.run_options = run_options
+
+    def evaluate_chunk(self, start: int, records: Sequence[Any]) -> List[RecordResult]:
+        # Variables objects are built up front so batch variables load once per chunk.
+        prepared: List[Any] = []
+        for record in records:
+            try:
+                prepared.append(record if self.variables_factory is None else self.variables_factory(record))
+            except Exception as exc:
+                if self.errors == ERRORS_RAISE:
+                    raise
+                prepared.append(exc)
+        built = [variables for variables in prepared if not isinstance(variables, Exception)]
+        contexts = iter(prime_batch_variables(built, self.rule_set.required_variables))
+        prepared = [item if isinstance(item, Exception) else next(contexts) for item in prepared]
+
+        results = []
+        for index, variables in enumerate(prepared, start):
+            try:
+                if isinstance(variables, Exception):
+                    raise variables
+                triggered, result, triggered_rules = self.rule_set.run_all_detailed(
+                    variables, self.actions, **self.run_options
+                )
+            except Exception as exc:
+                if self.errors == ERRORS_RAISE:
+                    raise
+                results.append(
+                    RecordResult(index, None, None, f"{exc.__class__.__name__}: {exc}")
+                )
+                continue
+            results.append(RecordResult(index, triggered, result, None, triggered_rules))
+        return results
+
+
+_WORKER_STATE: _WorkerState | None = None
+
+
+def _init_worker(*worker_args: Any) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = _WorkerState(*worker_args)
+
+
+def _evaluate_chunk(start: int, records: Sequence[Any]) -> List[RecordResult]:
+    assert _WORKER_STATE is not None, "worker process was not initialized"
+    return _WORKER_STATE.evaluate_chunk(start, records)
+
+
+def _chunked(records: Iterable[Any], chunk_size: int) -> Iterator[tuple[int, List[Any]]]:
+    iterator = iter(records)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+__all__ = ["ERRORS_COLLECT", "ERRORS_RAISE", "RecordResult", "run_all_parallel"]
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Sequence, Set, Tuple
+
+from .analysis import rule_variables
+from .context import EvaluationContext
+from .engine import Condition, Rule, RunResult, TraceNode, _evaluate_condition_block
+
+
+class SessionDelta(NamedTuple):
+    """What changed after :meth:`RuleSession.update`.
+
+    ``triggered`` and ``untriggered`` are the indices of the rules whose
+    outcome flipped, ``reevaluated`` the indices of the rules that depend on
+    a changed fact, and ``trace`` the updated trace of the whole rule set, as
+    ``run_all`` would return it.
+    """
+
+    triggered: Tuple[int, ...]
+    untriggered: Tuple[int, ...]
+    reevaluated: Tuple[int, ...]
+    trace: List[TraceNode]
+
+
+class _SessionNode:
+    __slots__ = ("block", "group_type", "children", "dependencies", "passed", "trace")
+
+    def __init__(self, block: Condition) -> None:
+        self.block = block
+        self.group_type = None
+        self.children: Tuple[_SessionNode, ...] = ()
+        for group_type in ("all", "any"):
+            if group_type in block:
+                children = block[group_type]
+                if not isinstance(children, list) or not children:
+                    raise AssertionError(f"'{group_type}' requires a non-empty list of conditions")
+                self.group_type = group_type
+                self.children = tuple(_SessionNode(child) for child in children)
+                break
+
+        if self.group_type is None:
+            self.dependencies = rule_variables({"conditions": block})
+        else:
+            dependencies: Set[str] = set()
+            for child in self.children:
+                dependencies |= child.dependencies
+            self.dependencies = frozenset(dependencies)
+        self.passed = False
+        self.trace: TraceNode | None = None
+
+    def evaluate(
+        self,
+        context: EvaluationContext,
+        defined_actions: Any,
+        changed: FrozenSet[str] | None,
+        results: List[Tuple["_SessionNode", bool, TraceNode | None]],
+    ) -> Tuple[bool, TraceNode | None]:
+        """Return this node's outcome, re-evaluating only what depends on ``changed``.
+
+        New outcomes are appended to ``results`` instead of being stored, so a
+        failing update leaves the session unchanged.
+        """
+        if changed is not None and self.dependencies.isdisjoint(changed):
+            return self.passed, self.trace
+
+        if self.group_type is None:
+            passed, trace = _evaluate_condition_block(self.block, context, defined_actions)
+        else:
+            deciding_result = self.group_type == "any"
+            passed = not deciding_result
+            child_nodes = []
+            for child in self.children:
+                child_passed, child_node = child.evaluate(context, defined_actions, changed, results)
+                if child_passed is deciding_result:
+                    passed = deciding_result
+                if child_node is not None:
+                    child_nodes.append(child_node)
+            trace = {"type": self.group_type, "result": passed, "children": child_nodes}
+        results.append((self, passed, trace))
+        return passed, trace
+
+
+class RuleSession:
+    """Keeps a rule set evaluated against a fact dict that changes field by field.
+
+    The rules are evaluated once on creation. Every condition node records the
+    facts it reads (see :func:`~business_rules_genai.analysis.rule_variables`),
+    and :meth:`update` re-evaluates only the leaves, groups and rules that
+    depend on a changed fact, reusing the stored outcome and trace of
+    everything else.
+
+    Conditions must depend on the facts alone: functions whose result changes
+    without a fact changing are not re-evaluated. Rule actions are not run;
+    run them for the rules reported in :attr:`SessionDelta.triggered` with
+    :func:`~business_rules_genai.engine.do_actions` if needed. Groups are
+    always fully evaluated so every stored leaf outcome stays current.
+    """
+
+    def __init__(self, rule_list: Sequence[Rule], facts: Mapping[str, Any], defined_actions: Any) -> None:
+        self.rules = list(rule_list)
+        self.facts: Dict[str, Any] = dict(facts)
+        self.defined_actions = defined_actions
+        self._roots = [
+            _SessionNode(rule.get("conditions")) if rule.get("conditions") else None
+            for rule in self.rules
+        ]
+        self._triggered = [False] * len(self.rules)
+        self._evaluate(None)
+
+    @property
+    def triggered_rules(self) -> Tuple[int, ...]:
+        """Indices of the rules whose conditions currently pass."""
+        return tuple(index for index, triggered in enumerate(self._triggered) if triggered)
+
+    def result(self) -> RunResult:
+        """Return ``(triggered, trace)`` as ``run_all`` would for the current facts."""
+        return any(self._triggered), self.trace()
+
+    def trace(self) -> List[TraceNode]:
+        return [root.trace for root in self._roots if root is not None and root.trace is not None]
+
+    def update(self, changes: Mapping[str, Any] | None = None, **fields: Any) -> SessionDelta:
+        """Merge changed facts and re-evaluate the rules that depend on them."""
+        changed = dict(changes or {}, **fields)
+        previous = {name: self.facts.get(name, _ABSENT) for name in changed}
+        self.facts.update(changed)
+        try:
+            return self._evaluate(frozenset(changed))
+        except BaseException:
+            for name, value in previous.items():
+                if value is _ABSENT:
+                    del self.facts[name]
+                else:
+                    self.facts[name] = value
+            raise
+
+    def _evaluate(self, changed: FrozenSet[str] | None) -> SessionDelta:
+        context = EvaluationContext(self.facts)
+        results: List[Tuple[_SessionNode, bool, TraceNode | None]] = []
+        outcomes: Dict[int, bool] = {}
+        for index, root in enumerate(self._roots):
+            if root is None:
+                if changed is None:
+                    outcomes[index] = True
+                continue
+            if changed is not None and root.dependencies.isdisjoint(changed):
+                continue
+            outcomes[index], _ = root.evaluate(context, self.defined_actions, changed, results)
+
+        for node, passed, trace in results:
+            node.passed, node.trace = passed, trace
+        triggered, untriggered = [], []
+        for index, passed in outcomes.items():
+            if passed != self._triggered[index]:
+                (triggered if passed else untriggered).append(index)
+            self._triggered[index] = passed
+        return SessionDelta(tuple(triggered), tuple(untriggered), tuple(outcomes), self.trace())
+
+
+_ABSENT = object()
+
+
+__all__ = ["RuleSession", "SessionDelta"]
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import inspect
+from decimal import Decimal
+from typing import Any, Dict, List, Sequence
+
+from .actions import export_rule_actions, get_action_spec
+from .engine import (
+    Action,
+    Condition,
+    Rule,
+    _is_literal_wrapper,
+    _is_variable_reference,
+    _normalize_actions,
+    parse_math_expression,
+)
+from .fields import FIELD_LIST, FIELD_NUMERIC, FIELD_TEXT
+from .operators import TYPE_CLASS_MAP, BooleanType, NumericType, StringType, get_operator_table, get_type_operators
+from .variables import export_rule_variables
+
+# Operator input types and action parameter field types mapped to rule types.
+_FIELD_RULE_TYPES = {
+    FIELD_NUMERIC: NumericType.name,
+    FIELD_TEXT: StringType.name,
+    NumericType.name: NumericType.name,
+    StringType.name: StringType.name,
+    BooleanType.name: BooleanType.name,
+}
+
+
+class RuleValidationError(ValueError):
+    """Raised by :func:`validate_rules`; ``errors`` lists every problem found."""
+
+    def __init__(self, errors: Sequence[str]) -> None:
+        self.errors = list(errors)
+        details = "\n".join(f"  {error}" for error in self.errors)
+        super().__init__(f"{len(self.errors)} rule validation error(s):\n{details}")
+
+
+def validate_rules(rule_list: Sequence[Rule], variables_class: Any, actions_class: Any) -> None:
+    """Type-check ``rule_list`` against the exported variable and action metadata.
+
+    Every leaf is checked for a known variable, action or expression source,
+    an operator defined for the source's type, and comparison values (or
+    ``{"var"}`` references) of the type and arity the operator expects.
+    Expression types are inferred from the ``return_type`` of the actions
+    their operators map to, and action calls are checked for existence,
+    call shape and the declared types of their parameters. All problems are
+    reported together in a :class:`RuleValidationError`.
+
+    Sources whose type cannot be inferred (actions without a ``return_type``)
+    are not type-checked further.
+    """
+    errors = _RuleValidator(variables_class, actions_class).validate(rule_list)
+    if errors:
+        raise RuleValidationError(errors)
+
+
+class _RuleValidator:
+    def __init__(self, variables_class: Any, actions_class: Any) -> None:
+        self.variable_types = {
+            definition["name"]: definition["field_type"]
+            for definition in export_rule_variables(variables_class, include_operators=False)
+        }
+        self.variables_class = variables_class
+        self.actions_class = actions_class
+        self.action_definitions = {
+            definition["name"]: definition for definition in export_rule_actions(actions_class)
+        }
+        self.operators = {
+            field_type: {operator["name"]: operator for operator in get_type_operators(field_type)}
+            for field_type in TYPE_CLASS_MAP
+        }
+        self.errors: List[str] = []
+
+    def validate(self, rule_list: Sequence[Rule]) -> List[str]:
+        for index, rule in enumerate(rule_list):
+            path = f"rules[{index}]"
+            if not isinstance(rule, dict):
+                self.errors.append(f"{path}: a rule must be an object")
+                continue
+            self.check_block(rule.get("conditions") or {}, f"{path}.conditions")
+            for position, action in enumerate(_normalize_actions(rule.get("actions"))):
+                self.check_action(action, f"{path}.actions[{position}]")
+        return self.errors
+
+    def check_block(self, block: Condition, path: str) -> None:
+        if not block:
+            return
+        for group_type in ("all", "any"):
+            if group_type in block:
+                children = block[group_type]
+                if not isinstance(children, list) or not children:
+                    self.errors.append(f"{path}: '{group_type}' requires a non-empty list of conditions")
+                    return
+                for index, child in enumerate(children):
+                    self.check_block(child, f"{path}.{group_type}[{index}]")
+                return
+        self.check_leaf(block, path)
+
+    def check_leaf(self, condition: Condition, path: str) -> None:
+        if "expression" in condition:
+            source_type = self.expression_type(condition["expression"], path)
+        elif "function" in condition:
+            source_type = self.check_action(
+                {"function": condition["function"], "params": condition.get("params", [])}, path
+            )
+        elif "name" in condition:
+            source_type = self.variable_type(condition["name"], path)
+        elif condition.get("label"):
+            return
+        else:
+            self.errors.append(f"{path}: condition must specify 'name', 'function', 'expression', or 'label'")
+            return
+
+        operator_name = condition.get("operator")
+        if operator_name is None:
+            self.errors.append(f"{path}: condition is missing an 'operator'")
+            return
+        if source_type is None:
+            return
+        operator = self.operators.get(source_type, {}).get(operator_name)
+        if operator is None:
+            self.errors.append(f"{path}: operator '{operator_name}' is not defined for {source_type} values")
+            return
+
+        value_conditions = condition.get("value_condition")
+        if value_conditions:
+            for index, branch in enumerate(value_conditions):
+                branch_path = f"{path}.value_condition[{index}]"
+                self.check_block(branch.get("conditions") or {}, f"{branch_path}.conditions")
+                if "value" in branch:
+                    self.check_value(branch["value"], source_type, operator, f"{branch_path}.value")
+                for position, action in enumerate(_normalize_actions(branch.get("actions"))):
+                    self.check_action(action, f"{branch_path}.actions[{position}]")
+        elif operator["requires_value"]:
+            if condition.get("value") is None:
+                self.errors.append(f"{path}: operator '{operator_name}' requires a value")
+            else:
+                self.check_value(condition["value"], source_type, operator, f"{path}.value")
+
+    def check_value(self, value: Any, source_type: str, operator: Dict[str, Any], path: str) -> None:
+        if not operator["requires_value"]:
+            return
+        expected = _FIELD_RULE_TYPES.get(operator["input_type"])
+        if _is_variable_reference(value):
+            self.check_type(value, expected, path)
+            return
+        if _is_literal_wrapper(value):
+            value = value["literal"]
+
+        if operator["comparison_type"] == FIELD_LIST:
+            if not isinstance(value, (list, tuple)):
+                self.errors.append(f"{path}: operator '{operator['name']}' expects a list")
+                return
+            for index, item in enumerate(value):
+                self.check_type(item, expected, f"{path}[{index}]")
+            return
+
+        arity = _operator_arity(source_type, operator["name"])
+        if arity == 1:
+            self.check_type(value, expected, path)
+        elif not isinstance(value, (list, tuple)) or len(value) != arity:
+            self.errors.append(f"{path}: operator '{operator['name']}' expects a list of {arity} values")
+        else:
+            for index, item in enumerate(value):
+                self.check_type(item, expected, f"{path}[{index}]")
+
+    def check_type(self, value: Any, expected: str | None, path: str) -> None:
+        actual = self.value_type(value, path)
+        if expected is not None and actual is not None and actual != expected:
+            self.errors.append(f"{path}: expected a {expected} value, got {actual}")
+
+    def value_type(self, value: Any, path: str, *, names_are_variables: bool = False) -> str | None:
+        if _is_variable_reference(value):
+            return self.variable_type(value["var"], path)
+        if _is_literal_wrapper(value):
+            value = value["literal"]
+        elif names_are_variables and isinstance(value, str) and value in self.variable_types:
+            return self.variable_types[value]
+        if isinstance(value, bool):
+            return BooleanType.name
+        if isinstance(value, (int, float, Decimal)):
+            return NumericType.name
+        if isinstance(value, str):
+            return StringType.name
+        return None
+
+    def variable_type(self, name: str, path: str) -> str | None:
+        field_type = self.variable_types.get(name)
+        if field_type is None:
+            self.errors.append(
+                f"{path}: variable '{name}' is not a rule variable of {_class_name(self.variables_class)}"
+            )
+        return field_type
+
+    def check_action(self, action: Action, path: str) -> str | None:
+        """Check an action call and return its declared rule return type, if any."""
+        method_name = action.get("function") or action.get("name")
+        if not method_name:
+            self.errors.append(f"{path}: action is missing a 'function' or 'name'")
+            return None
+        spec = get_action_spec(self.actions_class, method_name)
+        if spec is None:
+            self.errors.append(
+                f"{path}: action '{method_name}' is not defined in class {_class_name(self.actions_class)}"
+            )
+            return None
+
+        raw_params = action.get("params")
+        if isinstance(raw_params, dict) and not (
+            _is_variable_reference(raw_params) or _is_literal_wrapper(raw_params)
+        ):
+            arguments = dict(raw_params)
+            positional: List[Any] = []
+        else:
+            arguments = {}
+            positional = raw_params if isinstance(raw_params, list) else [] if raw_params is None else [raw_params]
+        try:
+            spec.check_arguments(len(positional), tuple(arguments))
+        except TypeError as exc:
+            self.errors.append(f"{path}: action '{method_name}' parameter mismatch: {exc}")
+            return None
+
+        definition = self.action_definitions.get(method_name) or {}
+        declared = definition.get("params") or []
+        for index, value in enumerate(positional):
+            if index < len(declared):
+                arguments[declared[index]["name"]] = value
+        for parameter in declared:
+            if parameter["name"] in arguments:
+                expected = _FIELD_RULE_TYPES.get(parameter.get("field_type"))
+                actual = self.value_type(
+                    arguments[parameter["name"]],
+                    f"{path}.params.{parameter['name']}",
+                    names_are_variables=True,
+                )
+                if expected is not None and actual is not None and actual != expected:
+                    self.errors.append(
+                        f"{path}.params.{parameter['name']}: action '{method_name}' expects a "
+                        f"{expected} value, got {actual}"
+                    )
+        return self.return_type(method_name)
+
+    def expression_type(self, expression: str, path: str) -> str | None:
+        try:
+            tree = parse_math_expression(expression)
+        except (SyntaxError, ValueError) as exc:
+            self.errors.append(f"{path}: invalid expression {expression!r}: {exc}")
+            return None
+        return self.expression_node_type(tree, path)
+
+    def expression_node_type(self, node: Any, path: str) -> str | None:
+        if isinstance(node, dict):
+            function_name = node["function"]
+            for argument in node["args"]:
+                argument_type = self.expression_node_type(argument, path)
+                if argument_type is not None and argument_type != NumericType.name:
+                    self.errors.append(f"{path}: expression operand of '{function_name}' is {argument_type}")
+            if get_action_spec(self.actions_class, function_name) is None:
+                self.errors.append(
+                    f"{path}: action '{function_name}' used by the expression is not defined in class "
+                    f"{_class_name(self.actions_class)}"
+                )
+                return None
+            return self.return_type(function_name)
+        if isinstance(node, str):
+            return self.variable_type(node, path)
+        return self.value_type(node, path)
+
+    def return_type(self, method_name: str) -> str | None:
+        return_type = (self.action_definitions.get(method_name) or {}).get("return_type")
+        return return_type if return_type in TYPE_CLASS_MAP else None
+
+
+def _operator_arity(field_type: str, operator_name: str) -> int:
+    function = get_operator_table(TYPE_CLASS_MAP[field_type])[operator_name].function
+    return len(inspect.signature(function).parameters) - 1
+
+
+def _class_name(source: Any) -> str:
+    return source.__name__ if inspect.isclass(source) else source.__class__.__name__
+
+
+__all__ = ["RuleValidationError", "validate_rules"]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import Any, Dict, List
+from typing import Any, Dict, Hashable, List
 
 from .operators import BaseType, BooleanType, NumericType, StringType, get_type_operators
 from .utils import fn_name_to_pretty_label
@@ -16,6 +17,16 @@ class BaseVariables:
     def get_all_variables(cls, *, include_operators: bool = True) -> List[VariableDefinition]:
         return export_rule_variables(cls, include_operators=include_operators)
 
+    def get_batch_key(self) -> Hashable:
+        """Return the key batch variables load this object's facts by.
+
+        Override in classes declaring ``batch=True`` variables, e.g. to return
+        a customer id.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement get_batch_key() to use batch variables"
+        )
+
 
 def export_rule_variables(
     variable_source: Any,
@@ -56,8 +67,23 @@ def rule_variable(
     *,
     options: List[Any] | None = None,
     description: str | None = None,
+    cache: bool = True,
+    cost: float | None = None,
+    batch: bool = False,
 ):
-    """Decorator to register a method as a UI-discoverable rule variable."""
+    """Decorator to register a method as a UI-discoverable rule variable.
+
+    Set ``cache=False`` for non-deterministic variables that must be recomputed
+    on every lookup instead of once per evaluation. ``cost`` is a relative
+    estimate of how expensive the variable is to compute, used to order
+    conditions in compiled rule sets (plain variables default to 1).
+
+    With ``batch=True`` the method receives a list of keys returned by
+    :meth:`BaseVariables.get_batch_key` and returns one value per key, so
+    :func:`~business_rules_genai.loader.run_all_many` can load a whole chunk
+    of records in one call. Looked up on its own, the variable loads the
+    object's single key.
+    """
 
     normalized_options = list(options or [])
 
@@ -66,57 +92,97 @@ def rule_variable(
             raise AssertionError(
                 f"{field_type} is not instance of BaseType in rule_variable field_type"
             )
+        if batch:
+            func = _batch_variable(func)
         func.field_type = field_type
         func.is_rule_variable = True
         func.label = label or fn_name_to_pretty_label(func.__name__)
         func.options = normalized_options
         func.description = description
+        func.cacheable = cache
+        func.cost = cost
         return func
 
     return wrapper
 
 
+def _batch_variable(loader):
+    @functools.wraps(loader)
+    def load_one(self):
+        return load_values(loader, self, [self.get_batch_key()])[0]
+
+    load_one.batch_loader = loader
+    return load_one
+
+
+def load_values(loader, variables: Any, keys: List[Hashable]) -> List[Any]:
+    """Call a batch ``loader`` for ``keys`` and check it returned one value per key."""
+    values = list(loader(variables, keys))
+    if len(values) != len(keys):
+        raise ValueError(
+            f"Batch variable '{loader.__name__}' returned {len(values)} values for {len(keys)} keys"
+        )
+    return values
+
+
 def _rule_variable_wrapper(
     field_type: type[BaseType],
     label=None,
     *,
     options: List[Any] | None = None,
     description: str | None = None,
+    cache: bool = True,
+    cost: float | None = None,
+    batch: bool = False,
 ):
     if callable(label):
-        return rule_variable(field_type, options=options, description=description)(label)
+        return rule_variable(
+            field_type, options=options, description=description, cache=cache, cost=cost, batch=batch
+        )(label)
     return rule_variable(
         field_type,
         label=label,
         options=options,
         description=description,
+        cache=cache,
+        cost=cost,
+        batch=batch,
     )
 
 
-def numeric_rule_variable(label=None, *, options=None, description=None):
+def numeric_rule_variable(label=None, *, options=None, description=None, cache=True, cost=None, batch=False):
     return _rule_variable_wrapper(
         NumericType,
         label,
         options=options,
         description=description,
+        cache=cache,
+        cost=cost,
+        batch=batch,
     )
 
 
-def string_rule_variable(label=None, *, options=None, description=None):
+def string_rule_variable(label=None, *, options=None, description=None, cache=True, cost=None, batch=False):
     return _rule_variable_wrapper(
         StringType,
         label,
         options=options,
         description=description,
+        cache=cache,
+        cost=cost,
+        batch=batch,
     )
 
 
-def boolean_rule_variable(label=None, *, options=None, description=None):
+def boolean_rule_variable(label=None, *, options=None, description=None, cache=True, cost=None, batch=False):
     return _rule_variable_wrapper(
         BooleanType,
         label,
         options=options,
         description=description,
+        cache=cache,
+        cost=cost,
+        batch=batch,
     )
 
 
@@ -16,11 +16,15 @@ setup(
     long_description_content_type="text/markdown",
     author="business-rules-genai maintainers",
     url="https://github.com/venmo/business-rules",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
     license="MIT",
     python_requires=">=3.9",
     install_requires=[],
+    extras_require={
+        "batch": ["numpy"],
+        "frames": ["numpy", "pandas", "pyarrow"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
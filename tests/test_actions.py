@@ -1,7 +1,21 @@
 from decimal import Decimal
 
-from business_rules_genai.actions import BaseActions, export_rule_actions, rule_action
-from business_rules_genai.operators import BooleanType, NumericType, StringType
+import pytest
+
+from business_rules_genai.actions import (
+    BaseActions,
+    export_rule_actions,
+    get_action_registry,
+    rule_action,
+)
+from business_rules_genai.engine import do_actions, run_all
+from business_rules_genai.operators import (
+    BooleanType,
+    NumericType,
+    ScaledIntegerBackend,
+    StringType,
+    use_numeric_backend,
+)
 
 
 class DemoActions(BaseActions):
@@ -43,6 +57,21 @@ def test_arithmetic_operations_handle_raw_and_wrapped_inputs():
     assert actions.divide(three, 0).value == Decimal("0")
 
 
+def test_arithmetic_actions_use_the_active_numeric_backend():
+    actions = DemoActions()
+
+    with use_numeric_backend("float"):
+        result = actions.divide(NumericType(10), 4)
+        assert result.value == 2.5
+        assert actions.double(result).value == 5.0
+
+    with use_numeric_backend(ScaledIntegerBackend(scale=2)):
+        third = actions.divide(10, 3)
+        assert third.value == 333
+        assert actions.mult(third, 3).to_decimal() == Decimal("9.99")
+        assert actions.add(third, Decimal("0.005")).to_decimal() == Decimal("3.33")
+
+
 def test_action_schema_includes_builtin_and_custom_metadata():
     actions = export_rule_actions(DemoActions)
     action_map = {action["name"]: action for action in actions}
@@ -54,3 +83,52 @@ def test_action_schema_includes_builtin_and_custom_metadata():
     assert action_map["double"]["params"] == [
         {"name": "value", "required": True, "field_type": "numeric"}
     ]
+
+
+def test_action_registry_is_cached_per_class_and_validates_call_shapes():
+    registry = get_action_registry(DemoActions())
+    assert get_action_registry(DemoActions) is registry
+    assert registry["double"].definition == {
+        action["name"]: action for action in export_rule_actions(DemoActions)
+    }["double"]
+
+    registry["add"].check_arguments(2)
+    registry["add"].check_arguments(0, ("value1", "value2"))
+    with pytest.raises(TypeError):
+        registry["add"].check_arguments(1)
+
+
+def test_do_actions_reports_parameter_mismatch():
+    with pytest.raises(AssertionError, match="parameter mismatch"):
+        do_actions([{"function": "double", "params": [1, 2]}], {}, DemoActions())
+    assert do_actions([{"function": "double", "params": [4]}], {}, DemoActions()).value == 8
+
+
+def test_pure_actions_are_memoized_per_evaluation():
+    calls = []
+
+    class MarginActions(BaseActions):
+        @rule_action(pure=True)
+        def margin(self, revenue, cost):
+            calls.append("margin")
+            return self.minus(revenue, cost)
+
+        def audit(self, revenue):
+            calls.append("audit")
+            return revenue
+
+    margin = {"function": "margin", "params": ["revenue", "cost"], "operator": "greater_than"}
+    rules = [
+        {"conditions": {"all": [dict(margin, value=limit)]}} for limit in (10, 20, 30)
+    ]
+    audit = {"function": "audit", "params": ["revenue"], "operator": "greater_than"}
+    rules.append({"conditions": {"all": [dict(audit, value=0), dict(audit, value=1)]}})
+
+    triggered, _ = run_all(rules, {"revenue": 100, "cost": 75}, MarginActions())
+    assert triggered is True
+    assert calls == ["margin", "audit", "audit"]
+    assert get_action_registry(MarginActions)["margin"].pure is True
+
+    calls.clear()
+    run_all(rules, {"revenue": 100, "cost": 75}, MarginActions())
+    assert calls.count("margin") == 1
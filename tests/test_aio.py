@@ -0,0 +1,121 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.aio import run_all_async, run_async
+from business_rules_genai.engine import run_all
+from business_rules_genai.operators import NumericType
+from business_rules_genai.variables import BaseVariables, numeric_rule_variable
+
+RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "revenue", "operator": "greater_than", "value": 100},
+                {"expression": "revenue - cost", "operator": "equal_to", "value": 40},
+                {
+                    "function": "price",
+                    "params": [{"var": "cost"}],
+                    "operator": "greater_than",
+                    "value": {"var": "revenue"},
+                },
+            ]
+        },
+        "actions": [{"function": "notify", "params": [{"var": "revenue"}]}],
+    },
+    {
+        "conditions": {"any": [{"name": "cost", "operator": "less_than", "value": 10}]},
+        "actions": [{"function": "notify", "params": [1]}],
+    },
+]
+
+
+class SyncVariables(BaseVariables):
+    @numeric_rule_variable
+    def revenue(self):
+        return 120
+
+    @numeric_rule_variable
+    def cost(self):
+        return 80
+
+
+class AsyncVariables(BaseVariables):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _fetch(self, value):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return value
+
+    @numeric_rule_variable
+    async def revenue(self):
+        return await self._fetch(120)
+
+    @numeric_rule_variable
+    async def cost(self):
+        return await self._fetch(80)
+
+
+class SyncActions(BaseActions):
+    def price(self, cost):
+        return self.mult(cost, 2)
+
+    def notify(self, value):
+        return self.set_value_numeric(value)
+
+
+class AsyncActions(BaseActions):
+    def __init__(self):
+        self.notified = []
+
+    async def price(self, cost):
+        await asyncio.sleep(0)
+        return self.mult(cost, 2)
+
+    async def notify(self, value):
+        self.notified.append(value.value)
+        return self.set_value_numeric(value)
+
+
+@pytest.mark.parametrize("prefetch", ["rule_set", "rule"])
+@pytest.mark.parametrize("short_circuit", [False, True])
+def test_run_all_async_matches_sync_engine(prefetch, short_circuit):
+    variables = AsyncVariables()
+    actions = AsyncActions()
+
+    result = asyncio.run(
+        run_all_async(RULES, variables, actions, short_circuit=short_circuit, prefetch=prefetch)
+    )
+
+    assert result == run_all(RULES, SyncVariables(), SyncActions(), short_circuit=short_circuit)
+    assert variables.max_in_flight == 2
+    assert actions.notified == [Decimal(120)]
+
+
+def test_run_async_returns_awaited_action_result():
+    triggered, result = asyncio.run(
+        run_async(RULES[0], {"revenue": 120, "cost": 80}, AsyncActions(), return_action_results=True)
+    )
+    assert triggered is True
+    assert isinstance(result, NumericType) and result.value == Decimal(120)
+
+
+def test_async_variable_errors_surface_only_when_evaluated():
+    class FailingVariables(AsyncVariables):
+        @numeric_rule_variable
+        async def cost(self):
+            raise LookupError("pricing sidecar unavailable")
+
+    rule = {"conditions": {"any": [{"name": "revenue", "operator": "greater_than", "value": 1}]}}
+    failing = dict(rule, conditions={"all": [{"name": "cost", "operator": "equal_to", "value": 1}]})
+
+    assert asyncio.run(run_all_async([rule], FailingVariables(), AsyncActions()))[0] is True
+    with pytest.raises(LookupError, match="sidecar"):
+        asyncio.run(run_all_async([rule, failing], FailingVariables(), AsyncActions()))
@@ -0,0 +1,106 @@
+import pytest
+
+from business_rules_genai import compile_rules, run_all
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.analysis import project_variables, required_variables, rule_variables
+from business_rules_genai.variables import BaseVariables, numeric_rule_variable, string_rule_variable
+
+
+class AccountVariables(BaseVariables):
+    def __init__(self, calls=None):
+        self.calls = calls if calls is not None else []
+
+    @numeric_rule_variable
+    def balance(self):
+        self.calls.append("balance")
+        return 250
+
+    @numeric_rule_variable
+    def limit(self):
+        self.calls.append("limit")
+        return 100
+
+    @string_rule_variable
+    def tier(self):
+        self.calls.append("tier")
+        return "gold"
+
+    @numeric_rule_variable
+    def unused(self):
+        self.calls.append("unused")
+        return 0
+
+
+class AccountActions(BaseActions):
+    def score(self, value, currency):
+        return value
+
+    def note(self, message):
+        return message
+
+
+RULES = [
+    {
+        "name": "over limit",
+        "conditions": {
+            "all": [
+                {"name": "balance", "operator": "greater_than", "value": {"var": "limit"}},
+                {"expression": "balance - limit", "operator": "greater_than", "value": 10},
+                {"function": "score", "params": ["balance", "USD"], "operator": "greater_than", "value": 0},
+            ]
+        },
+        "actions": [{"function": "note", "params": {"message": "over"}}],
+    },
+    {
+        "name": "gold",
+        "conditions": {"any": [{"name": "tier", "operator": "equal_to", "value": "gold"}]},
+        "actions": [{"function": "note", "params": [{"var": "tier"}]}],
+    },
+]
+
+
+def test_rule_variables_walk_every_reference():
+    assert rule_variables(RULES[0]) == {"balance", "limit", "USD", "over"}
+    assert rule_variables(RULES[0], AccountVariables) == {"balance", "limit"}
+    assert required_variables(RULES, AccountVariables) == ("balance", "limit", "tier")
+
+
+def test_project_variables_resolves_only_the_projection():
+    calls = []
+    projected = project_variables(AccountVariables(calls), required_variables(RULES, AccountVariables))
+
+    assert projected == {"balance": 250, "limit": 100, "tier": "gold"}
+    assert sorted(calls) == ["balance", "limit", "tier"]
+    assert project_variables({"balance": 1}, ["balance", "USD"]) == {"balance": 1}
+
+
+@pytest.mark.parametrize("short_circuit", [False, True])
+def test_compiled_projected_run_matches_the_interpreter(short_circuit):
+    compiled = compile_rules(RULES, AccountActions, AccountVariables)
+    assert compiled.required_variables == ("balance", "limit", "tier")
+
+    calls = []
+    result = compiled.run_all(AccountVariables(calls), AccountActions(), short_circuit=short_circuit, projected=True)
+
+    assert result == run_all(RULES, AccountVariables(), AccountActions(), short_circuit=short_circuit)
+    assert "unused" not in calls
+    assert calls.count("balance") == 1
+
+
+def test_projected_run_resolves_string_params_defined_on_the_instance():
+    class RegionalVariables(AccountVariables):
+        def __init__(self):
+            super().__init__()
+            self.USD = 2
+
+    rules = [{"conditions": {}, "actions": [{"function": "note", "params": ["USD"]}]}]
+    compiled = compile_rules(rules, AccountActions, AccountVariables)
+    assert compiled.required_variables == ()
+
+    triggered, result = compiled.run_all(
+        RegionalVariables(), AccountActions(), return_action_results=True, projected=True
+    )
+
+    assert triggered is True
+    assert result.value == 2
+    assert run_all(rules, RegionalVariables(), AccountActions(), return_action_results=True)[1].value == 2
@@ -0,0 +1,99 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.engine import run_all
+from business_rules_genai.operators import NumericType
+
+np = pytest.importorskip("numpy")
+
+from business_rules_genai.batch import run_all_batch  # noqa: E402
+
+
+class DemoActions(BaseActions):
+    def margin(self, revenue, cost):
+        if revenue is None:
+            return None
+        return self.divide(self.minus(revenue, cost), cost)
+
+
+RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "revenue", "operator": "greater_than", "value": 100},
+                {"name": "active", "operator": "is_true"},
+            ]
+        },
+        "actions": [],
+    },
+    {
+        "conditions": {
+            "any": [
+                {"name": "revenue", "operator": "between_equal", "value": [50, 100]},
+                {"name": "cost", "operator": "less_than_or_equal_to", "value": 10.5},
+                {
+                    "function": "margin",
+                    "params": ["revenue", "cost"],
+                    "operator": "greater_than",
+                    "value": 2,
+                },
+            ]
+        },
+        "actions": [],
+    },
+    {
+        "conditions": {"name": "segment", "operator": "equal_to", "value": "SME"},
+        "actions": [],
+    },
+]
+
+
+def _records(count):
+    generator = random.Random(7)
+    records = []
+    for index in range(count):
+        record = {
+            "revenue": generator.choice(
+                [100, 100.000001, Decimal("100.0000011"), 50, 49.9999995, None, 175]
+            ),
+            "cost": generator.choice([10, 10.5, 10.5000005, NumericType(40), 0]),
+            "active": generator.choice([True, False, None]),
+            "segment": generator.choice(["SME", "ENT"]),
+        }
+        if index % 11 == 0:
+            del record["active"]
+        records.append(record)
+    return records
+
+
+def test_run_all_batch_matches_row_by_row_engine():
+    records = _records(300)
+    actions = DemoActions()
+
+    matrix = run_all_batch(RULES, records, actions, per_rule=True)
+    expected = [[run_all([rule], record, actions)[0] for rule in RULES] for record in records]
+
+    assert matrix.shape == (300, 3)
+    assert matrix.tolist() == expected
+    assert run_all_batch(RULES, records, actions).tolist() == [any(row) for row in expected]
+
+
+def test_run_all_batch_falls_back_for_unsupported_columns():
+    records = [{"revenue": 120}, {"revenue": [1, 2]}, {}, {"revenue": NumericType(101)}]
+    rule = {"conditions": {"name": "revenue", "operator": "greater_than", "value": 100}}
+
+    assert run_all_batch([rule], records).tolist() == [True, False, False, True]
+
+
+def test_run_all_batch_uses_the_active_backend_tolerance():
+    from business_rules_genai.operators import ScaledIntegerBackend, use_numeric_backend
+
+    rules = [{"conditions": {"all": [{"name": "amount", "operator": "greater_than", "value": 1}]}, "actions": []}]
+    records = [{"amount": 1.01}, {"amount": 1.0000005}, {"amount": 1}]
+
+    with use_numeric_backend(ScaledIntegerBackend(scale=2)):
+        expected = [run_all(rules, record, BaseActions())[0] for record in records]
+        assert run_all_batch(rules, records, BaseActions()).tolist() == expected == [True, False, False]
@@ -0,0 +1,18 @@
+from benchmarks.workloads import BenchActions, BenchVariables, build_cases, count_leaves, make_facts, make_rules
+from business_rules_genai import compile_rules, run_all
+
+
+def test_synthetic_rules_are_valid_and_deterministic():
+    rules = make_rules(20, seed=3)
+    assert rules == make_rules(20, seed=3)
+    assert count_leaves(rules) >= 40
+
+    compiled = compile_rules(rules, BenchActions, BenchVariables)
+    actions = BenchActions()
+    for record in make_facts(10, seed=3):
+        assert compiled.run_all(record, actions) == run_all(rules, BenchVariables(record), actions)
+
+
+def test_cases_run_at_small_scale():
+    for case in build_cases(sizes=(5,), records=10):
+        case.function()
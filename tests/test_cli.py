@@ -0,0 +1,157 @@
+import json
+
+import pytest
+
+from business_rules_genai.actions import BaseActions, rule_action
+from business_rules_genai.cli import import_object, main
+from business_rules_genai.fields import FIELD_NUMERIC
+
+RULES = [
+    {
+        "name": "large",
+        "conditions": {"all": [{"name": "amount", "operator": "greater_than", "value": 10}]},
+        "actions": [{"function": "double", "params": [{"var": "amount"}]}],
+    },
+    {
+        "conditions": {"all": [{"name": "region", "operator": "equal_to", "value": "EU"}]},
+        "actions": [],
+    },
+]
+
+
+class CliActions(BaseActions):
+    @rule_action(params={"amount": FIELD_NUMERIC})
+    def double(self, amount):
+        return amount.value * 2
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(RULES))
+    return path
+
+
+def _decisions(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_evaluate_jsonl_with_stats(tmp_path, rules_file, capsys):
+    facts = tmp_path / "facts.jsonl"
+    facts.write_text(
+        "\n".join(json.dumps(record) for record in [
+            {"amount": 5, "region": "EU"},
+            {"amount": 50, "region": "US"},
+            {"amount": 7, "region": "US"},
+        ])
+    )
+    output = tmp_path / "decisions.jsonl"
+
+    status = main([
+        "evaluate",
+        "--rules", str(rules_file),
+        "--input", str(facts),
+        "--output", str(output),
+        "--actions", "tests.test_cli.CliActions",
+        "--stats",
+    ])
+
+    assert status == 0
+    assert _decisions(output) == [
+        {"index": 0, "triggered": True, "rules": [1]},
+        {"index": 1, "triggered": True, "rules": [0]},
+        {"index": 2, "triggered": False},
+    ]
+    stats = capsys.readouterr().err
+    assert "records: 3  triggered: 2  errors: 0" in stats
+    assert "large: 1" in stats
+    assert "rule[1]: 1" in stats
+
+
+def test_evaluate_csv_with_action_results(tmp_path, rules_file):
+    facts = tmp_path / "facts.csv"
+    facts.write_text("amount,region\n12,US\n3,\n")
+    output = tmp_path / "decisions.jsonl"
+
+    main([
+        "evaluate",
+        "--rules", str(rules_file),
+        "--input", str(facts),
+        "--output", str(output),
+        "--actions", "tests.test_cli:CliActions",
+        "--return-action-results",
+        "--errors", "collect",
+    ])
+
+    decisions = _decisions(output)
+    assert decisions[0] == {"index": 0, "triggered": True, "rules": [0], "result": 24}
+    assert decisions[1]["triggered"] is False
+
+
+def test_import_object_rejects_bare_names():
+    assert import_object("tests.test_cli.CliActions") is CliActions
+    with pytest.raises(ValueError):
+        import_object("CliActions")
+    with pytest.raises(ValueError):
+        import_object("tests.test_cli.Missing")
+    with pytest.raises(ValueError, match="Cannot import"):
+        import_object("tests.no_such_module.CliActions")
+
+
+@pytest.mark.parametrize(
+    "rules_document, actions, message",
+    [
+        ({"name": "not a list"}, "tests.test_cli.CliActions", "must contain a list of rules"),
+        (RULES, "tests.no_such_module.CliActions", "Cannot import 'tests.no_such_module'"),
+    ],
+)
+def test_evaluate_reports_setup_errors_without_traceback(tmp_path, capsys, rules_document, actions, message):
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps(rules_document))
+
+    status = main(["evaluate", "--rules", str(rules_path), "--actions", actions])
+
+    assert status == 1
+    error = capsys.readouterr().err
+    assert error.startswith("error: ")
+    assert message in error
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_evaluate_reports_malformed_lines_per_record_when_collecting(tmp_path, rules_file, workers):
+    facts = tmp_path / "facts.jsonl"
+    facts.write_text('{"amount": 50}\n{"amount": \n\n{"amount": 5}\n')
+    output = tmp_path / "decisions.jsonl"
+
+    status = main([
+        "evaluate",
+        "--rules", str(rules_file),
+        "--input", str(facts),
+        "--output", str(output),
+        "--actions", "tests.test_cli.CliActions",
+        "--workers", str(workers),
+        "--errors", "collect",
+    ])
+
+    assert status == 0
+    decisions = _decisions(output)
+    assert [decision["index"] for decision in decisions] == [0, 1, 2]
+    assert decisions[0]["triggered"] is True
+    assert decisions[1]["triggered"] is None
+    assert decisions[1]["error"].startswith("ValueError: invalid JSON on line 2")
+    assert decisions[2]["triggered"] is False
+
+
+def test_evaluate_stops_on_malformed_lines_when_raising(tmp_path, rules_file, capsys):
+    facts = tmp_path / "facts.jsonl"
+    facts.write_text('{"amount": 50}\nnot json\n')
+
+    status = main([
+        "evaluate",
+        "--rules", str(rules_file),
+        "--input", str(facts),
+        "--actions", "tests.test_cli.CliActions",
+    ])
+
+    assert status == 1
+    assert capsys.readouterr().err.startswith("error: invalid JSON on line 2")
@@ -0,0 +1,357 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.compiler import compile_rules
+from business_rules_genai.engine import run_all
+from business_rules_genai.operators import NumericType
+from business_rules_genai.variables import BaseVariables, numeric_rule_variable
+
+
+class DemoActions(BaseActions):
+    def percentage(self, numerator, denominator):
+        numerator = numerator.value if isinstance(numerator, NumericType) else numerator
+        denominator = (
+            denominator.value if isinstance(denominator, NumericType) else denominator
+        )
+        if not denominator:
+            return NumericType(0)
+        return NumericType((Decimal(str(numerator)) / Decimal(str(denominator))) * 100)
+
+    def ratio(self, *, numerator, denominator):
+        return self.divide(numerator, denominator)
+
+
+class DemoVariables(BaseVariables):
+    @numeric_rule_variable
+    def revenue(self):
+        return 120
+
+
+RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "revenue", "operator": "greater_than", "value": 100},
+                {"name": "segment", "operator": "is_in", "value": ["SME", "ENT"]},
+                {
+                    "function": "percentage",
+                    "params": ["revenue", "cost"],
+                    "operator": "greater_than",
+                    "value": 100,
+                },
+                {"expression": "(revenue - cost) / cost", "operator": "equal_to", "value": 0.5},
+                {"label": "Customer must pass KYC", "value": True},
+            ]
+        },
+        "actions": [{"function": "set_value_string", "params": "eligible"}],
+    },
+    {
+        "conditions": {
+            "any": [
+                {"name": "missing", "operator": "greater_than", "value": 1},
+                {
+                    "function": "ratio",
+                    "params": {"numerator": {"var": "revenue"}, "denominator": {"var": "cost"}},
+                    "operator": "between",
+                    "value": [1, {"var": "threshold"}],
+                },
+                {
+                    "name": "revenue",
+                    "operator": "less_than_or_equal_to",
+                    "value_condition": [
+                        {
+                            "conditions": {
+                                "all": [{"name": "segment", "operator": "equal_to", "value": "ENT"}]
+                            },
+                            "value": 150,
+                        },
+                        {"actions": [{"function": "set_value_numeric", "params": 90}]},
+                    ],
+                },
+            ]
+        },
+        "actions": [{"function": "set_value_numeric", "params": {"var": "threshold"}}],
+    },
+    {"conditions": {}, "actions": []},
+]
+
+
+@pytest.fixture
+def variables():
+    return {"revenue": 120, "cost": 80, "segment": "SME", "threshold": NumericType(10)}
+
+
+@pytest.mark.parametrize("trace", ["full", "result", "none"])
+@pytest.mark.parametrize("short_circuit", [False, True])
+@pytest.mark.parametrize("stop_on_first_trigger", [False, True])
+def test_compiled_rule_set_matches_interpreter(
+    variables, stop_on_first_trigger, short_circuit, trace
+):
+    compiled = compile_rules(RULES, DemoActions)
+    options = {
+        "stop_on_first_trigger": stop_on_first_trigger,
+        "short_circuit": short_circuit,
+        "trace": trace,
+    }
+
+    expected = run_all(RULES, variables, DemoActions(), **options)
+    assert compiled.run_all(variables, DemoActions(), **options) == expected
+
+
+def test_compiled_rule_set_returns_action_results(variables):
+    compiled = compile_rules(RULES[1:], DemoActions())
+
+    triggered, result = compiled.run_all(variables, DemoActions(), return_action_results=True)
+    assert triggered is True
+    assert result.value == Decimal(10)
+
+
+def test_compile_rules_rejects_unknown_actions_and_parameter_mismatches():
+    with pytest.raises(AssertionError, match="not defined"):
+        compile_rules(
+            [{"conditions": {"all": [{"function": "nope", "operator": "is_true"}]}}],
+            DemoActions,
+        )
+    with pytest.raises(AssertionError, match="parameter mismatch"):
+        compile_rules(
+            [{"conditions": {}, "actions": [{"function": "add", "params": [1]}]}],
+            DemoActions,
+        )
+
+
+def test_compile_rules_rejects_malformed_conditions():
+    with pytest.raises(ValueError, match="operator"):
+        compile_rules([{"conditions": {"all": [{"name": "revenue"}]}}], DemoActions)
+    with pytest.raises(AssertionError, match="non-empty"):
+        compile_rules([{"conditions": {"any": []}}], DemoActions)
+    with pytest.raises(AssertionError, match="Variable cost"):
+        compile_rules(
+            [{"conditions": {"all": [{"name": "cost", "operator": "equal_to", "value": 1}]}}],
+            DemoActions,
+            DemoVariables,
+        )
+
+
+@pytest.mark.parametrize("trace", ["full", "result", "none"])
+@pytest.mark.parametrize("short_circuit", [False, True])
+def test_shared_condition_network_matches_interpreter(variables, short_circuit, trace):
+    rules = RULES + RULES[:2]
+    compiled = compile_rules(rules, DemoActions, share_conditions=True)
+
+    expected = run_all(rules, variables, DemoActions(), short_circuit=short_circuit, trace=trace)
+    assert compiled.run_all(
+        variables, DemoActions(), short_circuit=short_circuit, trace=trace
+    ) == expected
+
+
+def test_shared_condition_network_evaluates_each_distinct_condition_once():
+    calls = []
+
+    class CountingActions(DemoActions):
+        def segment_code(self, segment):
+            calls.append(getattr(segment, "value", segment))
+            return segment
+
+    shared_leaf = {
+        "function": "segment_code",
+        "params": [{"var": "segment"}],
+        "operator": "equal_to",
+        "value": "SME",
+    }
+    rules = [
+        {
+            "conditions": {
+                "all": [shared_leaf, {"name": "revenue", "operator": "greater_than", "value": limit}]
+            }
+        }
+        for limit in (10, 20, 30)
+    ]
+    compiled = compile_rules(rules, CountingActions, share_conditions=True)
+
+    # One shared leaf, three revenue leaves and three rule roots.
+    assert compiled.distinct_conditions == 7
+
+    expected = run_all(rules, {"segment": "SME", "revenue": 25}, CountingActions())
+    assert calls == ["SME", "SME", "SME"]
+    calls.clear()
+    assert compiled.run_all({"segment": "SME", "revenue": 25}, CountingActions()) == expected
+    assert calls == ["SME"]
+
+
+def test_compiled_regex_conditions_match_interpreter():
+    patterns = [r"^SM", r"E$", r"(?i)sme", r"(S)\1", r"N", r"M"]
+    rules = [
+        {"conditions": {"all": [{"name": "segment", "operator": "matches_regex", "value": pattern}]}}
+        for pattern in patterns
+    ]
+    compiled = compile_rules(rules, DemoActions)
+
+    for segment in ["SME", "ENT", "SSN", None]:
+        variables = {"segment": segment}
+        assert compiled.run_all(variables, DemoActions()) == run_all(
+            rules, variables, DemoActions()
+        )
+
+
+def test_compiled_is_in_conditions_match_interpreter():
+    members = [f"C{index}" for index in range(1000)] + [7, 0.5]
+    rules = [
+        {"conditions": {"all": [{"name": name, "operator": "is_in", "value": members}]}}
+        for name in ("customer", "score")
+    ]
+    compiled = compile_rules(rules, DemoActions)
+
+    for variables in ({"customer": "C999", "score": 0.5}, {"customer": "X", "score": 7.1}):
+        assert compiled.run_all(variables, DemoActions()) == run_all(
+            rules, variables, DemoActions()
+        )
+
+
+@pytest.mark.parametrize("backend", ["float", "scaled"])
+def test_compiled_rule_set_runs_with_selected_numeric_backend(variables, backend):
+    rules = RULES[1:]
+    compiled = compile_rules(rules, DemoActions, numeric_backend=backend)
+
+    triggered, _ = run_all(rules, variables, DemoActions(), trace="none")
+    assert compiled.run_all(variables, DemoActions(), trace="none") == (triggered, [])
+    assert NumericType(1).value == Decimal(1)
+
+
+def test_reordered_conditions_run_cheapest_first_and_keep_trace_order():
+    calls = []
+
+    class CostlyActions(DemoActions):
+        def lookup_score(self, revenue):
+            calls.append("lookup_score")
+            return revenue
+
+    class CostlyVariables(DemoVariables):
+        @numeric_rule_variable(cost=50)
+        def credit_limit(self):
+            calls.append("credit_limit")
+            return 10
+
+    rules = [
+        {
+            "conditions": {
+                "all": [
+                    {"name": "credit_limit", "operator": "greater_than", "value": 5},
+                    {"function": "lookup_score", "params": ["revenue"], "operator": "greater_than", "value": 1},
+                    {"expression": "revenue * 2", "operator": "greater_than", "value": 1},
+                    {"name": "revenue", "operator": "less_than", "value": 100},
+                ]
+            }
+        }
+    ]
+    compiled = compile_rules(rules, CostlyActions, CostlyVariables, reorder_conditions=True)
+
+    triggered, trace = compiled.run_all(CostlyVariables(), CostlyActions(), short_circuit=True)
+
+    assert triggered is False
+    assert calls == []
+    assert [child["label"] for child in trace[0]["children"]] == [
+        "credit_limit",
+        "lookup_score(revenue)",
+        "revenue * 2",
+        "revenue",
+    ]
+    assert [child["result"] for child in trace[0]["children"]] == ["skipped", "skipped", "skipped", False]
+
+    # Without short-circuiting every child runs in the authored order.
+    assert compiled.run_all(CostlyVariables(), CostlyActions()) == run_all(
+        rules, CostlyVariables(), CostlyActions()
+    )
+    assert calls == ["credit_limit", "lookup_score"] * 2
+
+
+def test_adaptive_ordering_learns_selective_children_and_round_trips_plan():
+    calls = []
+
+    class CountingVariables(DemoVariables):
+        def __init__(self, revenue):
+            self._revenue = revenue
+
+        @numeric_rule_variable
+        def revenue(self):
+            calls.append("revenue")
+            return self._revenue
+
+        @numeric_rule_variable
+        def cost(self):
+            calls.append("cost")
+            return 0
+
+    rules = [
+        {
+            "conditions": {
+                "all": [
+                    {"name": "revenue", "operator": "greater_than", "value": 0},
+                    {"name": "cost", "operator": "greater_than", "value": 5},
+                ]
+            }
+        }
+    ]
+    compiled = compile_rules(rules, DemoActions)
+    compiled.enable_adaptive_ordering(replan_every=10)
+    for _ in range(10):
+        compiled.run_all(CountingVariables(50), DemoActions(), short_circuit=True)
+
+    # "cost" always fails the group, so it is now evaluated first.
+    calls.clear()
+    triggered, trace = compiled.run_all(CountingVariables(50), DemoActions(), short_circuit=True)
+    assert triggered is False
+    assert calls == ["cost"]
+    assert [child["label"] for child in trace[0]["children"]] == ["revenue", "cost"]
+    assert [child["result"] for child in trace[0]["children"]] == ["skipped", False]
+
+    plan = json.loads(json.dumps(compiled.export_plan()))
+    restarted = compile_rules(rules, DemoActions)
+    restarted.import_plan(plan)
+    calls.clear()
+    restarted.run_all(CountingVariables(50), DemoActions(), short_circuit=True)
+    assert calls == ["cost"]
+
+
+def test_adaptive_rule_ordering_is_opt_in_and_keeps_trace_order():
+    rules = [
+        {"name": "rare", "conditions": {"all": [{"name": "revenue", "operator": "greater_than", "value": 1000}]}},
+        {"name": "common", "conditions": {"all": [{"name": "revenue", "operator": "greater_than", "value": 0}]}},
+    ]
+    compiled = compile_rules(rules, DemoActions)
+    compiled.enable_adaptive_ordering(replan_every=5, reorder_rules=True)
+    for _ in range(5):
+        compiled.run_all(DemoVariables(), DemoActions())
+
+    assert compiled.rule_order == (1, 0)
+    triggered, trace, indices = compiled.run_all_detailed(
+        DemoVariables(), DemoActions(), stop_on_first_trigger=True
+    )
+    assert triggered is True
+    assert indices == (1,)
+    assert len(trace) == 1
+
+    # Without stop_on_first_trigger every rule runs and the trace keeps the authored order.
+    _, full_trace, indices = compiled.run_all_detailed(DemoVariables(), DemoActions())
+    assert indices == (1,)
+    assert full_trace == run_all(rules, DemoVariables(), DemoActions())[1]
+
+    plan = compiled.export_plan()
+    restarted = compile_rules(rules, DemoActions)
+    restarted.import_plan(plan)
+    assert restarted.rule_order == (1, 0)
+    with pytest.raises(ValueError):
+        restarted.import_plan({"version": 0})
+
+
+def test_compiled_constant_lists_are_not_shared_with_traces():
+    rule = {"conditions": {"all": [{"name": "revenue", "operator": "between", "value": [100, 200]}]}}
+    compiled = compile_rules([rule], DemoActions)
+
+    _, trace = compiled.run_all({"revenue": 150}, DemoActions())
+    trace[0]["children"][0]["value"].append(999)
+
+    assert rule["conditions"]["all"][0]["value"] == [100, 200]
+    assert compiled.run_all({"revenue": 150}, DemoActions()) == run_all([rule], {"revenue": 150}, DemoActions())
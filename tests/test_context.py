@@ -0,0 +1,73 @@
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.compiler import compile_rules
+from business_rules_genai.context import EvaluationContext
+from business_rules_genai.engine import run_all
+from business_rules_genai.variables import BaseVariables, numeric_rule_variable
+
+
+class CountingVariables(BaseVariables):
+    def __init__(self, revenue):
+        self.revenue_value = revenue
+        self.calls = {"revenue": 0, "sampled": 0}
+
+    @numeric_rule_variable
+    def revenue(self):
+        self.calls["revenue"] += 1
+        return self.revenue_value
+
+    @numeric_rule_variable(cache=False)
+    def sampled(self):
+        self.calls["sampled"] += 1
+        return self.calls["sampled"]
+
+
+RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "revenue", "operator": "greater_than", "value": 10},
+                {"expression": "revenue * 2", "operator": "greater_than", "value": 20},
+                {"name": "sampled", "operator": "greater_than", "value": 0},
+            ]
+        },
+        "actions": [{"function": "set_value_numeric", "params": {"var": "revenue"}}],
+    },
+    {
+        "conditions": {
+            "any": [
+                {"name": "revenue", "operator": "less_than", "value": 1000},
+                {"name": "sampled", "operator": "greater_than", "value": 0},
+            ]
+        }
+    },
+]
+
+
+def test_run_all_computes_each_variable_once_per_call():
+    variables = CountingVariables(100)
+
+    triggered, _ = run_all(RULES, variables, BaseActions())
+    assert triggered is True
+    assert variables.calls == {"revenue": 1, "sampled": 2}
+
+    run_all(RULES, variables, BaseActions())
+    assert variables.calls["revenue"] == 2
+
+    compile_rules(RULES, BaseActions).run_all(variables, BaseActions())
+    assert variables.calls["revenue"] == 3
+
+
+def test_explicit_context_caches_across_calls_until_invalidated():
+    variables = CountingVariables(100)
+    context = EvaluationContext(variables)
+
+    run_all(RULES, context, BaseActions())
+    run_all(RULES, context, BaseActions())
+    assert variables.calls["revenue"] == 1
+    assert context.cached_names() == {"revenue"}
+
+    variables.revenue_value = 5
+    context.invalidate("revenue")
+    triggered, trace = run_all(RULES[:1], context, BaseActions(), trace="result")
+    assert triggered is False
+    assert variables.calls["revenue"] == 2
@@ -2,10 +2,13 @@ from decimal import Decimal
 
 import pytest
 
-from business_rules_genai.actions import BaseActions
+from business_rules_genai.actions import BaseActions, rule_action
 from business_rules_genai.engine import (
     check_conditions_recursively,
+    clear_expression_cache,
+    compile_math_expression,
     execute_math_expression,
+    expression_cache_info,
     parse_math_expression,
     run,
     run_all,
@@ -93,6 +96,68 @@ def test_math_expression_execution(variables, actions):
     assert result.value == Decimal("0.5")
 
 
+def test_compiled_expression_matches_interpreted_execution(variables, actions):
+    for expression in ("(revenue - cost) / cost", "revenue * 2 + missing", "revenue / 0", "7"):
+        expected = execute_math_expression(parse_math_expression(expression), variables, actions)
+        result = compile_math_expression(expression)(variables, actions)
+        if isinstance(expected, NumericType):
+            assert result.value == expected.value
+        else:
+            assert result == expected
+
+
+def test_compiled_expression_uses_overridden_arithmetic(variables):
+    class RoundingActions(DemoActions):
+        def divide(self, value1, value2):
+            return NumericType(super().divide(value1, value2).value.quantize(Decimal("0.1")))
+
+    result = compile_math_expression("revenue / 7")(variables, RoundingActions())
+    assert result.value == Decimal("17.1")
+
+
+def test_compiled_expression_rejects_parameter_mismatches(variables):
+    class UnaryActions(DemoActions):
+        @rule_action()
+        def minus(self, value):
+            return value
+
+    with pytest.raises(AssertionError, match="minus parameter mismatch"):
+        execute_math_expression(parse_math_expression("revenue - cost"), variables, UnaryActions())
+    with pytest.raises(AssertionError, match="minus parameter mismatch"):
+        compile_math_expression("revenue - cost")(variables, UnaryActions())
+
+
+def test_expression_cache_records_hits_and_misses(variables, actions):
+    clear_expression_cache()
+    condition = {"expression": "revenue - cost", "operator": "equal_to", "value": 40}
+
+    for _ in range(3):
+        passed, _ = check_conditions_recursively(condition, variables, actions)
+        assert passed is True
+
+    info = expression_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+def test_pure_arithmetic_sub_results_are_memoized_within_run_all(variables):
+    calls = []
+
+    class CountingActions(DemoActions):
+        @rule_action(pure=True)
+        def minus(self, value1, value2):
+            calls.append((value1.value, value2.value))
+            return super().minus(value1, value2)
+
+    rules = [
+        {"conditions": {"all": [{"expression": expression, "operator": "greater_than", "value": 0}]}}
+        for expression in ("revenue - cost", "(revenue - cost) * 2", "(revenue - cost) / 4")
+    ]
+    triggered, _ = run_all(rules, variables, CountingActions())
+
+    assert triggered is True
+    assert calls == [(Decimal(120), Decimal(80))]
+
+
 def test_run_all_with_actions(variables, actions):
     rules = [
         {
@@ -237,3 +302,93 @@ def test_value_condition_supports_explicit_variable_references():
         DemoActions(),
     )
     assert triggered is True
+
+
+def test_short_circuit_skips_remaining_children(variables):
+    class CountingActions(DemoActions):
+        calls = 0
+
+        def percentage(self, numerator, denominator):
+            CountingActions.calls += 1
+            return super().percentage(numerator, denominator)
+
+    conditions = {
+        "all": [
+            {"name": "revenue", "operator": "less_than", "value": 100},
+            {
+                "function": "percentage",
+                "params": ["revenue", "cost"],
+                "operator": "greater_than",
+                "value": 100,
+            },
+            {"any": [{"name": "segment", "operator": "equal_to", "value": "SME"}]},
+        ]
+    }
+
+    passed, trace = check_conditions_recursively(
+        conditions, variables, CountingActions(), short_circuit=True
+    )
+    assert passed is False
+    assert CountingActions.calls == 0
+    skipped_leaf, skipped_group = trace[0]["children"][1:]
+    assert skipped_leaf["result"] == "skipped"
+    assert skipped_leaf["summary"] == "percentage(revenue, cost) > 100"
+    assert skipped_group["result"] == "skipped"
+    assert skipped_group["children"][0]["summary"] == "segment == SME"
+
+    full_passed, _ = check_conditions_recursively(conditions, variables, CountingActions())
+    assert full_passed is passed
+    assert CountingActions.calls == 1
+
+
+def test_short_circuit_any_group_stops_after_first_pass(variables, actions):
+    rule = {
+        "conditions": {
+            "any": [
+                {"name": "segment", "operator": "equal_to", "value": "SME"},
+                {"expression": "revenue / cost", "operator": "greater_than", "value": 1},
+            ]
+        },
+        "actions": [],
+    }
+
+    triggered, trace = run_all([rule], variables, actions, short_circuit=True)
+    assert triggered is True
+    assert [child["result"] for child in trace[0]["children"]] == [True, "skipped"]
+
+
+def test_trace_levels(variables, actions):
+    rules = [
+        {
+            "conditions": {
+                "all": [
+                    {"name": "revenue", "operator": "greater_than", "value": 100},
+                    {"label": "Customer must pass KYC", "value": True},
+                ]
+            },
+            "actions": [],
+        },
+        {
+            "conditions": {"name": "segment", "operator": "equal_to", "value": "ENT"},
+            "actions": [],
+        },
+    ]
+
+    assert run_all(rules, variables, actions, trace="result") == (
+        True,
+        [{"type": "all", "result": True}, {"type": "condition", "result": False}],
+    )
+    assert run_all(rules, variables, actions, trace="none") == (True, [])
+
+    with pytest.raises(ValueError):
+        run_all(rules, variables, actions, trace="verbose")
+
+
+def test_literal_list_values_are_copied_into_traces():
+    rule = {"conditions": {"all": [{"name": "segment", "operator": "is_in", "value": ["SME", "ENT"]}]}}
+
+    _, trace = run_all([rule], {"segment": "SME"}, BaseActions())
+    trace[0]["children"][0]["value"].append("GOV")
+
+    assert rule["conditions"]["all"][0]["value"] == ["SME", "ENT"]
+    assert run_all([rule], {"segment": "GOV"}, BaseActions())[0] is False
@@ -0,0 +1,88 @@
+import pytest
+
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.engine import run_all
+
+pd = pytest.importorskip("pandas")
+
+from business_rules_genai.frames import evaluate_frame  # noqa: E402
+
+RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "revenue", "operator": "greater_than_or_equal_to", "value": 100},
+                {"name": "segment", "operator": "is_in", "value": ["SME", "ENT"]},
+            ]
+        },
+        "actions": [],
+    },
+    {
+        "conditions": {
+            "any": [
+                {"name": "email", "operator": "matches_regex", "value": r"@example\.(com|org)$"},
+                {"name": "email", "operator": "starts_with", "value": "vip"},
+                {"name": "segment", "operator": "equal_to_case_insensitive", "value": "gov"},
+                {"expression": "revenue - cost", "operator": "less_than", "value": 0},
+            ]
+        },
+        "actions": [],
+    },
+]
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "revenue": [120.0, 99.9999995, None, 250.0, 100.0],
+            "cost": [80, 120, 10, 300, 100],
+            "segment": ["SME", "ENT", "Gov", None, "PUB"],
+            "email": ["a@example.com", "vip@corp.io", None, "x@example.net", "b@example.org"],
+        }
+    )
+
+
+def _expected(frame):
+    records = [
+        {key: (None if pd.isna(value) else value) for key, value in row.items()}
+        for row in frame.to_dict("records")
+    ]
+    return [[run_all([rule], record, BaseActions())[0] for rule in RULES] for record in records]
+
+
+def test_evaluate_frame_matches_row_by_row_engine(frame):
+    triggered, trace = evaluate_frame(RULES, frame, BaseActions(), trace=True)
+
+    assert triggered.values.tolist() == _expected(frame)
+    assert list(trace.columns) == [
+        "rule[0].all[0]",
+        "rule[0].all[1]",
+        "rule[1].any[0]",
+        "rule[1].any[1]",
+        "rule[1].any[2]",
+        "rule[1].any[3]",
+    ]
+    assert trace["rule[1].any[0]"].tolist() == [True, False, False, False, True]
+
+
+def test_evaluate_frame_accepts_arrow_tables(frame):
+    pa = pytest.importorskip("pyarrow")
+
+    triggered, trace = evaluate_frame(RULES, pa.Table.from_pandas(frame), BaseActions())
+
+    assert isinstance(triggered, pa.Table)
+    assert triggered.column_names == ["0", "1"]
+    assert [list(row.values()) for row in triggered.to_pylist()] == _expected(frame)
+    assert trace is None
+
+
+def test_evaluate_frame_handles_object_columns_without_touching_the_frame(frame):
+    frame["segment"] = pd.Series(["SME", "ENT", "Gov", None, "PUB"], dtype=object)
+    frame["region"] = pd.Series([{"eu": 1}, None, "EU", float("nan"), "US"], dtype=object)
+    before = frame.copy()
+
+    triggered, _ = evaluate_frame(RULES, frame, BaseActions())
+
+    assert triggered.values.tolist() == _expected(frame)
+    pd.testing.assert_frame_equal(frame, before)
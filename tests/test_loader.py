@@ -0,0 +1,123 @@
+import pytest
+
+from business_rules_genai import compile_rules, run_all
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.loader import prime_batch_variables, run_all_many
+from business_rules_genai.parallel import run_all_parallel
+from business_rules_genai.variables import BaseVariables, numeric_rule_variable, string_rule_variable
+
+STORE = {"a": 150, "b": 20, "c": 300}
+LOADS = []
+
+
+class CustomerVariables(BaseVariables):
+    def __init__(self, customer_id):
+        self.customer_id = customer_id
+
+    def get_batch_key(self):
+        return self.customer_id
+
+    @numeric_rule_variable(batch=True)
+    def revenue(self, keys):
+        LOADS.append(("revenue", list(keys)))
+        return [STORE[key] for key in keys]
+
+    @string_rule_variable(batch=True)
+    def segment(self, keys):
+        LOADS.append(("segment", list(keys)))
+        return ["ENT" if STORE[key] > 200 else "SME" for key in keys]
+
+    @numeric_rule_variable(batch=True)
+    def unused(self, keys):
+        LOADS.append(("unused", list(keys)))
+        return [0 for _ in keys]
+
+
+RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "revenue", "operator": "greater_than", "value": 100},
+                {"name": "segment", "operator": "equal_to", "value": "SME"},
+            ]
+        }
+    }
+]
+
+
+def make_customer(customer_id):
+    return CustomerVariables(customer_id)
+
+
+@pytest.fixture(autouse=True)
+def clear_loads():
+    LOADS.clear()
+
+
+def test_batch_variable_loads_a_single_key_when_looked_up_alone():
+    triggered, _ = run_all(RULES, CustomerVariables("a"), BaseActions())
+
+    assert triggered is True
+    assert LOADS == [("revenue", ["a"]), ("segment", ["a"])]
+    assert [definition["name"] for definition in CustomerVariables.get_all_variables()] == [
+        "revenue",
+        "segment",
+        "unused",
+    ]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_run_all_many_coalesces_lookups_per_chunk(compiled):
+    rules = compile_rules(RULES, BaseActions) if compiled else RULES
+    customers = [CustomerVariables(key) for key in ["a", "b", "c", "a"]]
+
+    results = list(run_all_many(rules, customers, BaseActions(), chunk_size=3))
+
+    assert [triggered for triggered, _ in results] == [True, False, False, True]
+    assert results == [run_all(RULES, CustomerVariables(key), BaseActions()) for key in ["a", "b", "c", "a"]]
+    assert sorted(LOADS[:2]) == [("revenue", ["a", "b", "c"]), ("segment", ["a", "b", "c"])]
+    assert sorted(LOADS[2:4]) == [("revenue", ["a"]), ("segment", ["a"])]
+
+
+def test_failed_batch_load_is_raised_when_a_rule_reads_the_variable():
+    class BrokenVariables(CustomerVariables):
+        @numeric_rule_variable(batch=True)
+        def revenue(self, keys):
+            return []
+
+    contexts = prime_batch_variables([BrokenVariables("a"), BrokenVariables("b")], {"revenue"})
+
+    with pytest.raises(ValueError, match="returned 0 values for 2 keys"):
+        run_all(RULES, contexts[0], BaseActions())
+
+
+def test_parallel_workers_prime_batch_variables_per_chunk():
+    results = list(
+        run_all_parallel(RULES, ["a", "b", "c"], BaseActions, variables_factory=make_customer, workers=1)
+    )
+
+    assert [result.triggered for result in results] == [True, False, False]
+    assert ("revenue", ["a", "b", "c"]) in LOADS
+
+
+class KeylessVariables(CustomerVariables):
+    def get_batch_key(self):
+        if self.customer_id == "missing":
+            raise KeyError("no key for record")
+        return self.customer_id
+
+
+def make_keyless(customer_id):
+    return KeylessVariables(customer_id)
+
+
+def test_failed_batch_key_only_fails_its_own_record():
+    results = list(
+        run_all_parallel(
+            RULES, ["a", "missing", "b"], BaseActions, variables_factory=make_keyless, workers=1, errors="collect"
+        )
+    )
+
+    assert [result.triggered for result in results] == [True, None, False]
+    assert results[1].error == "KeyError: 'no key for record'"
+    assert ("revenue", ["a", "b"]) in LOADS
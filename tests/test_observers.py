@@ -0,0 +1,125 @@
+import pytest
+
+from business_rules_genai import compile_rules, run_all
+from business_rules_genai.actions import BaseActions, rule_action
+from business_rules_genai.observers import (
+    ACTIVE_OBSERVERS,
+    EvaluationObserver,
+    MetricsCollector,
+    observing,
+    rule_id,
+)
+from business_rules_genai.variables import BaseVariables, numeric_rule_variable
+
+RULES = [
+    {
+        "id": "big-order",
+        "conditions": {
+            "all": [
+                {"name": "amount", "operator": "greater_than", "value": 100},
+                {"function": "double", "params": [{"var": "amount"}], "operator": "greater_than", "value": 1},
+            ]
+        },
+        "actions": [{"function": "notify", "params": []}],
+    },
+    {
+        "conditions": {"any": [{"name": "amount", "operator": "less_than", "value": 0}]},
+        "actions": [{"function": "notify", "params": []}],
+    },
+]
+
+
+class OrderVariables(BaseVariables):
+    @numeric_rule_variable
+    def amount(self):
+        return 150
+
+
+class OrderActions(BaseActions):
+    @rule_action()
+    def double(self, value):
+        return value.value * 2
+
+    @rule_action()
+    def notify(self):
+        return "sent"
+
+
+class Recorder(EvaluationObserver):
+    def __init__(self):
+        self.events = []
+
+    def before_rule(self, rule):
+        self.events.append(("before_rule", rule_id(rule)))
+
+    def after_rule(self, rule, result, elapsed, error):
+        self.events.append(("after_rule", rule_id(rule), result[0]))
+
+    def after_condition(self, label, result, elapsed, error):
+        self.events.append(("condition", label, result[0]))
+
+    def after_action(self, name, result, elapsed, error):
+        self.events.append(("action", name, result))
+
+    def after_variable(self, name, result, elapsed, error):
+        self.events.append(("variable", name, result))
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_observer_sees_rules_conditions_actions_and_variables(compiled):
+    recorder = Recorder()
+    runner = compile_rules(RULES, OrderActions).run_all if compiled else lambda *a: run_all(RULES, *a)
+
+    with observing(recorder):
+        runner(OrderVariables(), OrderActions())
+
+    assert recorder.events[:6] == [
+        ("before_rule", "big-order"),
+        ("variable", "amount", 150),
+        ("condition", "amount", True),
+        ("action", "double", 300),
+        ("condition", "double(amount)", True),
+        ("action", "notify", "sent"),
+    ]
+    assert recorder.events[6] == ("after_rule", "big-order", True)
+    assert recorder.events[-1][0] == "after_rule" and recorder.events[-1][2] is False
+    assert not ACTIVE_OBSERVERS
+
+
+def test_metrics_collector_exports_dict_and_prometheus():
+    collector = MetricsCollector(buckets=(0.5, 1.0))
+    with observing(collector):
+        for _ in range(3):
+            run_all(RULES, OrderVariables(), OrderActions())
+
+    metrics = collector.as_dict()
+    assert metrics["rules"]["big-order"]["count"] == 3
+    assert metrics["rules"]["big-order"]["triggered"] == 3
+    assert metrics["conditions"]["amount"]["passed"] == 3
+    assert metrics["actions"]["notify"]["buckets"]["+Inf"] == 3
+    assert metrics["variables"]["amount"]["count"] == 3
+
+    text = collector.to_prometheus()
+    assert "# TYPE business_rules_rule_duration_seconds histogram" in text
+    assert 'business_rules_rule_duration_seconds_count{rule="big-order"} 3' in text
+    assert 'business_rules_action_duration_seconds_bucket{action="notify",le="+Inf"} 3' in text
+    assert 'business_rules_condition_passed_total{condition="amount"} 3' in text
+    assert f'business_rules_rule_triggered_total{{rule="{rule_id(RULES[1])}"}} 0' in text
+
+    collector.reset()
+    assert collector.to_prometheus() == ""
+
+
+def test_metrics_collector_counts_action_errors():
+    class FailingActions(OrderActions):
+        @rule_action()
+        def notify(self):
+            raise ValueError("down")
+
+    collector = MetricsCollector()
+    with observing(collector), pytest.raises(RuntimeError):
+        run_all(RULES, OrderVariables(), FailingActions())
+
+    metrics = collector.as_dict()
+    assert metrics["actions"]["notify"]["errors"] == 1
+    assert metrics["rules"]["big-order"]["errors"] == 1
@@ -1,10 +1,18 @@
 from decimal import Decimal
 
+import pytest
+
 from business_rules_genai.operators import (
     BooleanType,
     NumericType,
+    ScaledIntegerBackend,
     StringType,
+    clear_regex_cache,
     export_operator_catalog,
+    get_operator_table,
+    regex_cache_info,
+    resolve_numeric_backend,
+    use_numeric_backend,
 )
 
 
@@ -48,3 +56,78 @@ def test_operator_catalog_groups_operators_by_field_type():
     assert "numeric" in catalog
     assert any(operator["name"] == "greater_than" for operator in catalog["numeric"])
     assert any(operator["name"] == "is_true" for operator in catalog["boolean"])
+
+
+def test_matches_regex_uses_bounded_pattern_cache():
+    clear_regex_cache()
+    for _ in range(3):
+        assert StringType("order-42").matches_regex(r"\d+$")
+
+    info = regex_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+def test_numeric_is_in_uses_exact_membership():
+    assert NumericType(3).is_in([1, 2, 3])
+    assert NumericType(0.1).is_in([0.1, 0.2])
+    assert NumericType(Decimal("2.50")).is_in(frozenset({Decimal("2.5")}))
+    assert not NumericType(3.0000001).is_in([3])
+    assert not NumericType(None).is_in([1])
+
+
+@pytest.mark.parametrize("backend", ["decimal", "float", ScaledIntegerBackend(scale=4)])
+def test_numeric_backends_share_comparison_semantics(backend):
+    with use_numeric_backend(backend):
+        value = NumericType(0.1)
+        assert value.backend is resolve_numeric_backend(backend)
+        assert value.equal_to(Decimal("0.1000001"))
+        assert not value.greater_than(0.1)
+        assert value.greater_than_or_equal_to(0.1)
+        assert value.between(0, 1) and not value.between(0.1, 1)
+        assert value.between_equal(0.1, 1)
+        assert value.is_in([0.1, 2])
+        assert value.to_decimal() == Decimal("0.1")
+
+
+def test_numeric_backend_override_is_scoped():
+    with use_numeric_backend("float"):
+        assert isinstance(NumericType(1).value, float)
+        with use_numeric_backend("scaled"):
+            assert NumericType(Decimal("1.5")).value == 1_500_000
+    assert NumericType(1).value == Decimal(1)
+    with pytest.raises(ValueError, match="Unknown numeric backend"):
+        resolve_numeric_backend("binary128")
+
+
+def test_wrapper_types_use_slots():
+    for value in (StringType("a"), NumericType(1), BooleanType(True)):
+        assert not hasattr(value, "__dict__")
+
+
+def test_operator_table_calls_match_public_methods():
+    numeric_table = get_operator_table(NumericType)
+    assert get_operator_table(NumericType) is numeric_table
+    assert set(numeric_table) == {
+        operator["name"] for operator in export_operator_catalog()["numeric"]
+    }
+
+    value = NumericType(5)
+    entry = numeric_table["between_equal"]
+    assert entry.call(value, (5, 6)) is value.between_equal(5, 6) is True
+    assert entry.call(value, ("x", 6)) is value.between_equal("x", 6) is False
+    assert entry.function(value, Decimal(4), Decimal(5)) is True
+    assert get_operator_table(StringType)["is_in"].call(StringType("a"), (["a"],)) is True
+
+
+def test_epsilon_override_applies_to_every_backend():
+    class LooseNumber(NumericType):
+        __slots__ = ()
+        EPSILON = Decimal("0.01")
+
+    for backend in ["decimal", "float", ScaledIntegerBackend(scale=4)]:
+        with use_numeric_backend(backend):
+            assert LooseNumber(1.005).equal_to(1)
+            assert not LooseNumber(1.005).greater_than(1)
+            assert not NumericType(1.005).equal_to(1)
+            assert LooseNumber.tolerance() == Decimal("0.01")
+    assert NumericType.tolerance(ScaledIntegerBackend(scale=4)) == Decimal(0)
@@ -0,0 +1,67 @@
+import pytest
+
+from business_rules_genai.actions import BaseActions, rule_action
+from business_rules_genai.fields import FIELD_NUMERIC
+from business_rules_genai.parallel import RecordResult, run_all_parallel
+
+RULES = [
+    {
+        "conditions": {"all": [{"name": "amount", "operator": "greater_than", "value": 10}]},
+        "actions": [{"function": "check", "params": [{"var": "amount"}]}],
+    }
+]
+
+
+class ParallelActions(BaseActions):
+    @rule_action(params={"amount": FIELD_NUMERIC})
+    def check(self, amount):
+        amount = getattr(amount, "value", amount)
+        if amount == 13:
+            raise ValueError("unlucky")
+        return amount * 2
+
+
+def _records(count):
+    return ({"amount": value} for value in range(count))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_results_come_back_in_input_order(workers):
+    results = list(
+        run_all_parallel(
+            RULES,
+            _records(30),
+            ParallelActions,
+            workers=workers,
+            chunk_size=4,
+            errors="collect",
+            return_action_results=True,
+        )
+    )
+
+    assert [result.index for result in results] == list(range(30))
+    assert [result.triggered for result in results[:11]] == [False] * 11
+    assert results[12] == RecordResult(12, True, 24, None, (0,))
+    assert results[13].triggered is None
+    assert results[13].error == "RuntimeError: 'check': unlucky"
+    assert results[29].result == 58
+
+
+def test_errors_raise_stops_the_run():
+    with pytest.raises(RuntimeError, match="unlucky"):
+        list(run_all_parallel(RULES, _records(20), ParallelActions, workers=2, chunk_size=3))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_invalid_options_and_rules_are_rejected_before_iterating(workers):
+    with pytest.raises(ValueError):
+        run_all_parallel(RULES, [], ParallelActions, workers=workers, errors="ignore")
+    with pytest.raises(ValueError):
+        run_all_parallel(RULES, [], ParallelActions, workers=workers, chunk_size=0)
+    with pytest.raises(AssertionError, match="not defined"):
+        run_all_parallel(
+            [{"conditions": {}, "actions": [{"function": "missing"}]}],
+            [],
+            ParallelActions,
+            workers=workers,
+        )
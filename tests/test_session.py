@@ -0,0 +1,78 @@
+import pytest
+
+from business_rules_genai.actions import BaseActions
+from business_rules_genai.engine import run_all
+from business_rules_genai.session import RuleSession
+
+
+class PricingActions(BaseActions):
+    def __init__(self):
+        self.calls = []
+
+    def margin(self, price, cost):
+        self.calls.append("margin")
+        return self.minus(price, cost)
+
+
+RULES = [
+    {
+        "name": "healthy margin",
+        "conditions": {
+            "all": [
+                {"function": "margin", "params": ["price", "cost"], "operator": "greater_than", "value": 10},
+                {"name": "segment", "operator": "equal_to", "value": "SME"},
+            ]
+        },
+    },
+    {
+        "name": "premium",
+        "conditions": {"any": [{"name": "segment", "operator": "equal_to", "value": "ENT"}]},
+    },
+    {"name": "always", "actions": []},
+]
+
+FACTS = {"price": 100, "cost": 50, "segment": "SME"}
+
+
+def test_session_matches_run_all_after_each_update():
+    actions = PricingActions()
+    session = RuleSession(RULES, FACTS, actions)
+
+    assert session.result() == run_all(RULES, FACTS, PricingActions())
+    assert session.triggered_rules == (0, 2)
+
+    actions.calls.clear()
+    delta = session.update(cost=95)
+    assert delta.triggered == ()
+    assert delta.untriggered == (0,)
+    assert delta.reevaluated == (0,)
+    assert actions.calls == ["margin"]
+    assert delta.trace == run_all(RULES, dict(FACTS, cost=95), PricingActions())[1]
+
+    actions.calls.clear()
+    delta = session.update({"segment": "ENT"})
+    assert delta.triggered == (1,)
+    assert delta.reevaluated == (0, 1)
+    assert actions.calls == []
+    assert session.result() == run_all(RULES, dict(FACTS, cost=95, segment="ENT"), PricingActions())
+
+
+def test_update_of_unused_fact_reevaluates_nothing():
+    session = RuleSession(RULES, FACTS, PricingActions())
+
+    delta = session.update(region="EU")
+
+    assert delta.reevaluated == ()
+    assert delta.trace == session.trace()
+    assert session.facts["region"] == "EU"
+
+
+def test_failed_update_leaves_session_unchanged():
+    session = RuleSession(RULES, FACTS, PricingActions())
+    before = session.result()
+
+    with pytest.raises(RuntimeError):
+        session.update(cost="not a number")
+
+    assert session.facts == FACTS
+    assert session.result() == before
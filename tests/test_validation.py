@@ -0,0 +1,118 @@
+import pytest
+
+from business_rules_genai import compile_rules, run_all
+from business_rules_genai.actions import BaseActions, rule_action
+from business_rules_genai.operators import NumericType
+from business_rules_genai.validation import RuleValidationError, validate_rules
+from business_rules_genai.variables import (
+    BaseVariables,
+    numeric_rule_variable,
+    string_rule_variable,
+)
+
+
+class OrderVariables(BaseVariables):
+    def __init__(self, amount=120, region="EU"):
+        self._amount = amount
+        self._region = region
+
+    @numeric_rule_variable
+    def amount(self):
+        return self._amount
+
+    @string_rule_variable
+    def region(self):
+        return self._region
+
+
+class OrderActions(BaseActions):
+    @rule_action(params={"value": NumericType.name}, return_type=NumericType.name)
+    def with_tax(self, value):
+        return NumericType(value.value * 2)
+
+    @rule_action()
+    def notify(self, message):
+        return message
+
+
+VALID_RULES = [
+    {
+        "conditions": {
+            "all": [
+                {"name": "amount", "operator": "greater_than", "value": 100},
+                {"name": "amount", "operator": "between", "value": [10, {"var": "amount"}]},
+                {"name": "region", "operator": "is_in", "value": ["EU", "US"]},
+                {"expression": "amount * 2 - 5", "operator": "less_than", "value": 1000},
+                {"function": "with_tax", "params": ["amount"], "operator": "equal_to", "value": 240},
+                {
+                    "name": "amount",
+                    "operator": "greater_than_or_equal_to",
+                    "value_condition": [
+                        {"conditions": {"all": [{"name": "region", "operator": "equal_to", "value": "EU"}]}, "value": 50},
+                        {"actions": [{"function": "set_value_numeric", "params": [10]}]},
+                    ],
+                },
+                {"label": "Reviewed by finance"},
+            ]
+        },
+        "actions": [{"function": "notify", "params": {"message": "big order"}}],
+    }
+]
+
+
+def test_valid_rules_pass():
+    validate_rules(VALID_RULES, OrderVariables, OrderActions)
+
+
+def test_all_problems_are_reported_together():
+    rules = [
+        {
+            "conditions": {
+                "any": [
+                    {"name": "amount", "operator": "starts_with", "value": "1"},
+                    {"name": "region", "operator": "equal_to", "value": 5},
+                    {"name": "amount", "operator": "between", "value": [1]},
+                    {"name": "segment", "operator": "equal_to", "value": "SME"},
+                    {"name": "amount", "value": 3},
+                    {"expression": "amount + region", "operator": "greater_than", "value": 1},
+                    {"function": "with_tax", "params": ["text"], "operator": "greater_than", "value": 1},
+                ]
+            },
+            "actions": [{"function": "missing"}, {"function": "notify", "params": []}],
+        }
+    ]
+
+    with pytest.raises(RuleValidationError) as excinfo:
+        validate_rules(rules, OrderVariables, OrderActions)
+
+    errors = excinfo.value.errors
+    assert errors == [
+        "rules[0].conditions.any[0]: operator 'starts_with' is not defined for numeric values",
+        "rules[0].conditions.any[1].value: expected a string value, got numeric",
+        "rules[0].conditions.any[2].value: operator 'between' expects a list of 2 values",
+        "rules[0].conditions.any[3]: variable 'segment' is not a rule variable of OrderVariables",
+        "rules[0].conditions.any[4]: condition is missing an 'operator'",
+        "rules[0].conditions.any[5]: expression operand of 'add' is string",
+        "rules[0].conditions.any[6].params.value: action 'with_tax' expects a numeric value, got string",
+        "rules[0].actions[0]: action 'missing' is not defined in class OrderActions",
+        "rules[0].actions[1]: action 'notify' parameter mismatch: missing a required argument: 'message'",
+    ]
+    assert isinstance(excinfo.value, ValueError)
+
+
+def test_validated_compile_matches_interpreter():
+    compiled = compile_rules(VALID_RULES, OrderActions, OrderVariables, validate=True)
+    actions = OrderActions()
+
+    for variables in (OrderVariables(), OrderVariables(amount=50), OrderVariables(region="APAC")):
+        assert compiled.run_all(variables, actions) == run_all(VALID_RULES, variables, actions)
+
+    with pytest.raises(ValueError):
+        compile_rules(VALID_RULES, OrderActions, validate=True)
+    with pytest.raises(RuleValidationError):
+        compile_rules(
+            [{"conditions": {"name": "amount", "operator": "contains", "value": "1"}}],
+            OrderActions,
+            OrderVariables,
+            validate=True,
+        )